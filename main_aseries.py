@@ -1,6 +1,7 @@
 from tradingagents.graph.aseries_trading_graph import TradingAgentsGraph
 from tradingagents.default_config import DEFAULT_CONFIG
 from dotenv import load_dotenv
+import asyncio
 import os
 
 # Load environment variables from .env file
@@ -22,12 +23,29 @@ config["quick_think_llm"] = "gpt-5"  # Use a different model
 config["max_debate_rounds"] = 1  # Increase debate rounds
 config["online_tools"] = True  # Use online tools for Tushare data
 
-# Initialize with custom config
-ta = TradingAgentsGraph(debug=True, config=config)
+# (symbol, company name, trade date) to analyse in one run
+WATCHLIST = [
+    ("300418.SZ", '昆仑万维', "2025-09-21"),
+]
 
-# forward propagate
-_, decision = ta.propagate("300418.SZ", '昆仑万维', "2025-09-21")
-print(decision)
 
-# Memorize mistakes and reflect
-# ta.reflect_and_remember(1000) # parameter is the position returns
+async def main():
+    # Initialize with custom config
+    ta = TradingAgentsGraph(debug=True, config=config)
+
+    # forward propagate all tickers concurrently through the one graph
+    results = await ta.propagate_batch(WATCHLIST)
+
+    for (symbol, name, date), result in zip(WATCHLIST, results):
+        if isinstance(result, Exception):
+            print(f"{symbol} ({name}) {date}: failed with {result!r}")
+            continue
+        final_state, decision = result
+        print(f"{symbol} ({name}) {date}: {decision}")
+
+        # Memorize mistakes and reflect on this ticker's own run
+        # ta.reflect_and_remember(1000, final_state) # parameter is the position returns
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
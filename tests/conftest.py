@@ -0,0 +1,26 @@
+"""Shared pytest setup for the tests directory"""
+
+import pytest
+
+from tradingagents.dataflows.utils import load_env
+
+# Load .env once for the whole session; the test scripts call load_env()
+# too, which only reads the file when they run directly
+load_env()
+
+
+def pytest_configure(config):
+    # Tests marked network call live APIs; the rest are independent and can
+    # be spread across workers with pytest-xdist, e.g.
+    #   pytest -n auto -m "not network" tests/tradingagents/dataflows
+    config.addinivalue_line(
+        "markers", "network: test calls a live external API and needs credentials"
+    )
+
+
+@pytest.fixture(scope="session")
+def openai_client():
+    """One OpenAI client (and connection pool) for every test in the session"""
+    from tradingagents.dataflows.openai_utils import get_openai_client
+
+    return get_openai_client()
@@ -1,26 +1,37 @@
-import tushare as ts
-from stock_pandas import StockDataFrame
-import finnhub
-import pandas as pd
-from datetime import datetime, timedelta
-import akshare as ak
+import contextlib
+import functools
+
+# tushare, finnhub, akshare and pandas are imported inside the functions that
+# use them so that loading this module (and running a single check) stays fast
 
 finnhub_api_key = 'd32hg9pr01qn0gi40fh0d32hg9pr01qn0gi40fhg'
 ts_api_key = 'd45a1d8e8d02489cb9b86ebaa05f7658a327ad7a9558f082dcd896c3'
-finnhub_client = finnhub.Client(api_key=finnhub_api_key)
+
+
+@functools.lru_cache(maxsize=1)
+def get_finnhub_client():
+    import finnhub
+    return finnhub.Client(api_key=finnhub_api_key)
+
 
 def test_tushare():
+    import tushare as ts
+    from tradingagents.dataflows.indicator_utils import macd
+
     # 1. Get data from Tushare
     pro = ts.pro_api(ts_api_key)
     df = pro.daily(ts_code="300418.SZ", start_date="20250101", end_date="20250913")
-    # 2. Convert to StockDataFrame
-    stock = StockDataFrame(df)
+    # 2. Tushare returns newest first; indicators need chronological order
+    df = df.sort_values("trade_date").reset_index(drop=True)
     # 3. Use indicators
-    print(stock['close'])
-    print(stock['macd'])
+    df["macd"], df["macds"], df["macdh"] = macd(df["close"].to_numpy())
+    print(df['close'])
+    print(df['macd'])
 
 # test_finnhub_insider_sentiment()
 def check_tushare_user_points():
+    import tushare as ts
+
     pro = ts.pro_api(token=ts_api_key)
     # 设置你的token
     df = pro.user(token=ts_api_key)
@@ -28,31 +39,30 @@ def check_tushare_user_points():
     print(df)
 
 def test_finnhub_stock_insider_transactions(ticker = "AAPL"):
+    import pandas as pd
 
-    transactions = finnhub_client.stock_insider_transactions(ticker)
+    transactions = get_finnhub_client().stock_insider_transactions(ticker)
 
-    # Format by date
-    formatted_data = {}
-    for trans in transactions.get('data', []):
-        date = trans.get('filingDate', '')[:10]  # YYYY-MM-DD format
-        if date not in formatted_data:
-            formatted_data[date] = []
-        formatted_data[date].append({
-            'name': trans.get('name'),
-            'share': trans.get('share'),
-            'change': trans.get('change'),
-            'transactionPrice': trans.get('transactionPrice'),
-            'transactionCode': trans.get('transactionCode')  # B=Buy, S=Sell
-        })
-    print('done')
+    # Format by date (transactionCode: B=Buy, S=Sell)
+    columns = ['name', 'share', 'change', 'transactionPrice', 'transactionCode']
+    df = pd.DataFrame(transactions.get('data', []))
+    df = df.reindex(columns=['filingDate'] + columns)
+    df['date'] = df['filingDate'].fillna('').astype(str).str.slice(0, 10)  # YYYY-MM-DD format
+    formatted_data = {
+        date: group[columns].to_dict('records')
+        for date, group in df.groupby('date', sort=False)
+    }
+    print(f'done: {len(formatted_data)} filing dates')
 
  # 2. Fetch Insider Sentiment
 def test_finnhub_insider_sentiment(ticker = "AAPL"):
+    import pandas as pd
+
     # Get last 12 months
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=365)
+    end_date = pd.Timestamp.now()
+    start_date = end_date - pd.Timedelta(days=365)
 
-    sentiment = finnhub_client.stock_insider_sentiment(
+    sentiment = get_finnhub_client().stock_insider_sentiment(
       ticker,
       start_date.strftime('%Y-%m-%d'),
       end_date.strftime('%Y-%m-%d')
@@ -75,12 +85,68 @@ def test_finnhub_insider_sentiment(ticker = "AAPL"):
 
 
 
-def test_akshare():
-    stock_zh_a_hist_df = ak.stock_zh_a_hist(symbol="300418", period="daily", start_date="20250914", end_date='20250915', adjust="")
-    print(stock_zh_a_hist_df.columns)
-    print(stock_zh_a_hist_df)
+@contextlib.contextmanager
+def keep_alive_requests(pool_size=32):
+    """
+    Route module-level requests.get calls (as made by akshare) through one pooled Session.
+
+    Swapping requests.get is global, so only use this while no other thread
+    is making requests.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    original_get = requests.get
+    requests.get = session.get
+    try:
+        yield session
+    finally:
+        requests.get = original_get
+        session.close()
+
+
+def test_akshare(symbols=("300418",)):
+    import akshare as ak
+
+    # Reuse one keep-alive connection for every symbol instead of a new TLS handshake each
+    with keep_alive_requests():
+        for symbol in symbols:
+            stock_zh_a_hist_df = ak.stock_zh_a_hist(symbol=symbol, period="daily", start_date="20250914", end_date='20250915', adjust="")
+            print(stock_zh_a_hist_df.columns)
+            print(stock_zh_a_hist_df)
+
+
+def run_all_providers():
+    """
+    Run the Tushare and Finnhub pulls concurrently (they only block on network
+    I/O), then akshare on this thread once they are done so its pooled
+    session can stand in for requests.get safely.
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    def report(name, pull):
+        try:
+            pull()
+            print(f"{name}: done")
+        except Exception as e:
+            print(f"{name}: {type(e).__name__}: {e}")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(report, 'tushare', test_tushare),
+            executor.submit(report, 'finnhub', functools.partial(test_finnhub_stock_insider_transactions, 'AAPL')),
+        ]
+        for future in as_completed(futures):
+            future.result()
+
+    report('akshare', test_akshare)
 
 
 if __name__ == '__main__':
-    test_tushare()
+    run_all_providers()
     # check_tushare_user_points()
\ No newline at end of file
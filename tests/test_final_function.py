@@ -1,58 +1,56 @@
 #!/usr/bin/env python3
-"""Final test of the get_stock_news_openai function"""
+"""Final test of the get_stock_news_openai function over a watchlist"""
 
-import os
-import sys
-from dotenv import load_dotenv
+import asyncio
 
-# Load environment variables
-load_dotenv()
+from tradingagents.dataflows.utils import load_env
 
-# Add project root to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Load environment variables (already done by conftest.py under pytest)
+load_env()
 
-from tradingagents.dataflows.interface import get_stock_news_openai
+from tradingagents.dataflows.interface import aget_stock_news_openai_batch
 
 def test_final_function():
     """Test the actual function as it exists"""
 
     print("=" * 80)
-    print("FINAL TEST OF get_stock_news_openai")
+    print("FINAL TEST OF aget_stock_news_openai_batch")
     print("=" * 80)
 
-    ticker = "AAPL"
+    watchlist = [("300418.SZ", "昆仑万维"), ("000001.SZ", "平安银行")]
     curr_date = "2025-09-19"
 
     print(f"\nParameters:")
-    print(f"  Ticker: {ticker}")
+    print(f"  Watchlist: {watchlist}")
     print(f"  Date: {curr_date}")
     print()
 
-    print("Calling get_stock_news_openai...")
+    print("Calling aget_stock_news_openai_batch...")
     print("(Watch for any debug output from the function)")
     print("-" * 40)
 
     try:
-        result = get_stock_news_openai(ticker, curr_date)
+        results = asyncio.run(aget_stock_news_openai_batch(watchlist, curr_date))
 
         print("-" * 40)
         print("\n✓ Function completed successfully!")
 
-        print(f"\nResult:")
-        print(f"  Type: {type(result)}")
-
-        if result is None:
-            print("  ✗ Result is None (exception occurred)")
-        elif result == "No results returned from social media search.":
-            print("  ⚠️ Fallback message returned (output_text was empty)")
-        else:
-            print(f"  ✓ Got actual content!")
-            print(f"  Length: {len(result)} characters")
-            print(f"\nFirst 300 characters:")
-            print("-" * 40)
-            print(result[:300])
-            if len(result) > 300:
-                print("... [truncated]")
+        for (symbol, ticker), result in zip(watchlist, results):
+            print(f"\nResult for {ticker} ({symbol}):")
+            print(f"  Type: {type(result)}")
+
+            if result is None:
+                print("  ✗ Result is None (exception occurred)")
+            elif result == "No results returned from social media search.":
+                print("  ⚠️ Fallback message returned (output_text was empty)")
+            else:
+                print(f"  ✓ Got actual content!")
+                print(f"  Length: {len(result)} characters")
+                print(f"\nFirst 300 characters:")
+                print("-" * 40)
+                print(result[:300])
+                if len(result) > 300:
+                    print("... [truncated]")
 
     except AttributeError as e:
         print(f"\n✗ AttributeError: {e}")
@@ -1,20 +1,47 @@
 #!/usr/bin/env python3
 """Test OpenAI API to understand the error"""
 
-import os
-import sys
-from dotenv import load_dotenv
+from tradingagents.dataflows.utils import load_env
 
-# Load environment variables
-load_dotenv()
-
-# Add project root to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Load environment variables (already done by conftest.py under pytest)
+load_env()
 
 from tradingagents.dataflows.config import get_config
+from tradingagents.dataflows.openai_utils import get_openai_client
 from openai import OpenAI
 
-def test_openai_api():
+
+def _call_responses(client, config):
+    """Call the Responses API (client.responses.create)"""
+    return client.responses.create(
+        model=config["quick_think_llm"],
+        input=[{"role": "system", "content": [{"type": "input_text", "text": "Test"}]}],
+        text={"format": {"type": "text"}},
+        reasoning={},
+        temperature=1,
+        max_output_tokens=100,
+        top_p=1,
+        store=True,
+    )
+
+
+def _call_chat_completions(client, config):
+    """Call the Chat Completions API (client.chat.completions.create)"""
+    return client.chat.completions.create(
+        model=config.get("quick_think_llm", "gpt-3.5-turbo"),
+        messages=[{"role": "system", "content": "Test"}],
+        temperature=1,
+        max_tokens=100,
+    )
+
+
+# Resolve the API shape once at import instead of probing with a failing call;
+# responses is a class-level property, so no client needs to be built here
+HAS_RESPONSES_API = hasattr(OpenAI, "responses")
+_call_llm = _call_responses if HAS_RESPONSES_API else _call_chat_completions
+
+
+def test_openai_api(openai_client):
     """Test different OpenAI API formats"""
 
     config = get_config()
@@ -25,10 +52,9 @@ def test_openai_api():
     # Test 1: Check if backend_url is set
     if "backend_url" in config and config["backend_url"]:
         print(f"\nUsing custom backend URL: {config['backend_url']}")
-        client = OpenAI(base_url=config["backend_url"])
     else:
         print("\nUsing standard OpenAI API")
-        client = OpenAI()
+    client = openai_client
 
     # Test 2: Check what attributes the client has
     print(f"\nClient attributes: {dir(client)}")
@@ -47,46 +73,16 @@ def test_openai_api():
     else:
         print("Client does NOT have 'chat' attribute")
 
-    # Test 5: Try to understand the actual structure
+    # Test 5: Call the API through the shape detected at import
     print("\nTrying to call the API...")
-
-    # First try the custom format
+    print(f"Using {_call_llm.__doc__}")
     try:
-        print("Attempting custom format (client.responses.create)...")
-        response = client.responses.create(
-            model=config["quick_think_llm"],
-            input=[{"role": "system", "content": [{"type": "input_text", "text": "Test"}]}],
-            text={"format": {"type": "text"}},
-            reasoning={},
-            temperature=1,
-            max_output_tokens=100,
-            top_p=1,
-            store=True,
-        )
-        print("SUCCESS: Custom format works!")
+        response = _call_llm(client, config)
+        print("SUCCESS: API call works!")
         print(f"Response type: {type(response)}")
-        return
-    except AttributeError as e:
-        print(f"FAILED: Custom format - AttributeError: {e}")
-    except Exception as e:
-        print(f"FAILED: Custom format - Other error: {type(e).__name__}: {e}")
-
-    # Then try standard OpenAI format
-    try:
-        print("\nAttempting standard format (client.chat.completions.create)...")
-        response = client.chat.completions.create(
-            model=config.get("quick_think_llm", "gpt-3.5-turbo"),
-            messages=[{"role": "system", "content": "Test"}],
-            temperature=1,
-            max_tokens=100,
-        )
-        print("SUCCESS: Standard format works!")
-        print(f"Response: {response.choices[0].message.content}")
-        return
     except Exception as e:
-        print(f"FAILED: Standard format - {type(e).__name__}: {e}")
-
-    print("\nNeither API format worked. Please check your configuration.")
+        print(f"FAILED: {type(e).__name__}: {e}")
+        print("\nPlease check your configuration.")
 
 if __name__ == "__main__":
-    test_openai_api()
\ No newline at end of file
+    test_openai_api(get_openai_client())
\ No newline at end of file
@@ -1,41 +1,173 @@
 #!/usr/bin/env python3
 """Test get_stock_news_openai function with individual site searches"""
 
+import asyncio
 import traceback
-import dotenv
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
 import json
-import sys
-import os
-from datetime import datetime, timedelta
+import pandas as pd
 
-# Load environment variables
-dotenv.load_dotenv()
+from tradingagents.dataflows.utils import load_env, loads_json
 
-# Add project root to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Load environment variables (already done by conftest.py under pytest)
+load_env()
+
+from tradingagents.dataflows.config import get_config
+from tradingagents.dataflows.interface import aget_stock_news_openai
+
+@dataclass(slots=True)
+class NewsItem:
+    """One search result item from get_stock_news_openai"""
+    platform: str = 'Unknown'
+    datetime_local: str = 'No date'
+    title_or_snippet: str = 'No content'
+    url: str = 'No URL'
+    category: str = 'unknown'
+    author: str = 'anonymous'
+
+    @classmethod
+    def from_dict(cls, d):
+        # Keep only known keys; the model may add extra fields or nulls
+        return cls(**{k: d[k] for k in NEWS_ITEM_FIELDS if d.get(k) is not None})
+
+
+NEWS_ITEM_FIELDS = tuple(f.name for f in fields(NewsItem))
+
+
+def format_result(symbol, ticker, curr_date, result):
+    """Render one search result as report text (runs on a worker thread)"""
+    lines = []
+    emit = lines.append
+
+    emit("\n" + "=" * 60)
+    emit(f"RESULTS FOR {ticker} ({symbol})")
+    emit("=" * 60)
+
+    if result is None:
+        emit("\n✗ ERROR: Function returned None")
+        emit("This indicates an exception occurred during execution")
+        return "\n".join(lines)
+
+    emit("\n✓ Function completed successfully!")
+
+    # Try to parse the result as JSON
+    try:
+        result_json = loads_json(result)
+
+        # Display summary
+        summary = result_json.get("summary", {})
+        emit("\n" + "=" * 60)
+        emit("SEARCH SUMMARY:")
+        emit("=" * 60)
+        emit(f"  Total items found: {summary.get('total_items_found', 0)}")
+        emit(f"  Unique items: {summary.get('unique_items', 0)}")
+        emit(f"  Sites searched: {summary.get('sites_searched', 0)}")
+        emit(f"  Date range: {summary.get('date_range', 'N/A')}")
+
+        # Display per-site results
+        emit("\nPER-SITE RESULTS:")
+        emit("-" * 40)
+        search_details = summary.get('search_details', [])
+
+        if search_details:
+            for detail in search_details:
+                site_name = detail.get('site', 'Unknown')
+                found_count = detail.get('found_count', 0)
+                status = "✓" if found_count > 0 else "○"
+                emit(f"  {status} {site_name}: {found_count} items")
+        else:
+            emit("  No search details available")
+
+        # Display sample items
+        items = [NewsItem.from_dict(d) for d in result_json.get("items", [])]
+        if items:
+            emit("\n" + "=" * 60)
+            emit(f"SAMPLE ITEMS (showing first 5 of {len(items)}):")
+            emit("=" * 60)
+
+            for i, item in enumerate(items[:5], 1):
+                emit(f"\n{i}. [{item.platform}] {item.datetime_local}")
+
+                # Show title/snippet
+                snippet = item.title_or_snippet
+                if len(snippet) > 150:
+                    snippet = snippet[:150] + "..."
+                emit(f"   {snippet}")
+
+                # Show URL
+                url = item.url
+                if len(url) > 80:
+                    url = url[:77] + "..."
+                emit(f"   URL: {url}")
+
+                # Show category and author if available
+                emit(f"   Type: {item.category}, Author: {item.author}")
+        else:
+            emit("\n○ No items found in search results")
+
+    except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses this
+        emit(f"\n⚠️ WARNING: Could not parse result as JSON")
+        emit(f"JSON Error: {e}")
+        emit("\nRaw output (first 500 characters):")
+        emit("-" * 40)
+        emit(result[:500] if len(result) > 500 else result)
+        if len(result) > 500:
+            emit("... [truncated]")
+
+    return "\n".join(lines)
+
+
+async def search_and_report(watchlist, curr_date):
+    """
+    Search every stock concurrently and format each result on a worker
+    thread as soon as it arrives, so report building overlaps the
+    remaining searches.
+    """
+    config = get_config()
+    semaphore = asyncio.Semaphore(config.get("news_batch_concurrency", 8))
+
+    async def search_one(symbol, ticker):
+        async with semaphore:
+            result = await aget_stock_news_openai(symbol, ticker, curr_date)
+        return symbol, ticker, result
+
+    def report(symbol, ticker, result):
+        print(format_result(symbol, ticker, curr_date, result))
+
+    # A single worker keeps each report printed as one uninterrupted block
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        reports = []
+        for search in asyncio.as_completed([search_one(*stock) for stock in watchlist]):
+            symbol, ticker, result = await search
+            print("-" * 60)
+            print(f"✓ Search completed for {ticker} ({symbol})")
+            reports.append(pool.submit(report, symbol, ticker, result))
+
+        # Surface any error raised while formatting a report
+        for future in reports:
+            future.result()
 
-from tradingagents.dataflows.interface import get_stock_news_openai
 
 def test_get_stock_news_openai():
     """Test the get_stock_news_openai function"""
 
-    # Test parameters
-    ticker = '昆仑万维'
-    symbol = '300418.SZ'
+    # Test parameters: (symbol, ticker) pairs
+    watchlist = [('300418.SZ', '昆仑万维')]
     curr_date = '2025-09-20'
 
     print("=" * 80)
     print("Testing get_stock_news_openai with Individual Site Searches")
     print("=" * 80)
     print(f"\nParameters:")
-    print(f"  Ticker (Company Name): {ticker}")
-    print(f"  Symbol (Stock Code): {symbol}")
+    for symbol, ticker in watchlist:
+        print(f"  Ticker (Company Name): {ticker}, Symbol (Stock Code): {symbol}")
     print(f"  Current Date: {curr_date}")
 
     # Calculate expected date range
-    end_date_dt = datetime.strptime(curr_date, '%Y-%m-%d')
-    start_date_dt = end_date_dt - timedelta(days=7)
-    print(f"  Expected Date Range: {start_date_dt.strftime('%Y-%m-%d')} to {end_date_dt.strftime('%Y-%m-%d')}")
+    end_date_dt = pd.Timestamp(curr_date)
+    start_date_dt = end_date_dt - pd.Timedelta(days=7)
+    print(f"  Expected Date Range: {start_date_dt:%Y-%m-%d} to {end_date_dt:%Y-%m-%d}")
     print()
 
     print("Starting search (searching each site individually)...")
@@ -45,89 +177,7 @@ def test_get_stock_news_openai():
     print("-" * 60)
 
     try:
-        # Call the function
-        result = get_stock_news_openai(symbol, ticker, curr_date)
-
-        print("-" * 60)
-
-        if result is None:
-            print("\n✗ ERROR: Function returned None")
-            print("This indicates an exception occurred during execution")
-            return
-
-        print("\n✓ Function completed successfully!")
-
-        # Try to parse the result as JSON
-        try:
-            result_json = json.loads(result)
-
-            # Display summary
-            summary = result_json.get("summary", {})
-            print("\n" + "=" * 60)
-            print("SEARCH SUMMARY:")
-            print("=" * 60)
-            print(f"  Total items found: {summary.get('total_items_found', 0)}")
-            print(f"  Unique items: {summary.get('unique_items', 0)}")
-            print(f"  Sites searched: {summary.get('sites_searched', 0)}")
-            print(f"  Date range: {summary.get('date_range', 'N/A')}")
-
-            # Display per-site results
-            print("\nPER-SITE RESULTS:")
-            print("-" * 40)
-            search_details = summary.get('search_details', [])
-
-            if search_details:
-                for detail in search_details:
-                    site_name = detail.get('site', 'Unknown')
-                    found_count = detail.get('found_count', 0)
-                    status = "✓" if found_count > 0 else "○"
-                    print(f"  {status} {site_name}: {found_count} items")
-            else:
-                print("  No search details available")
-
-            # Display sample items
-            items = result_json.get("items", [])
-            if items:
-                print("\n" + "=" * 60)
-                print(f"SAMPLE ITEMS (showing first 5 of {len(items)}):")
-                print("=" * 60)
-
-                for i, item in enumerate(items[:5], 1):
-                    print(f"\n{i}. [{item.get('platform', 'Unknown')}] {item.get('datetime_local', 'No date')}")
-
-                    # Show title/snippet
-                    snippet = item.get('title_or_snippet', 'No content')
-                    if len(snippet) > 150:
-                        snippet = snippet[:150] + "..."
-                    print(f"   {snippet}")
-
-                    # Show URL
-                    url = item.get('url', 'No URL')
-                    if len(url) > 80:
-                        url = url[:77] + "..."
-                    print(f"   URL: {url}")
-
-                    # Show category and author if available
-                    category = item.get('category', 'unknown')
-                    author = item.get('author', 'anonymous')
-                    print(f"   Type: {category}, Author: {author}")
-            else:
-                print("\n○ No items found in search results")
-
-            # Save results to file
-            # output_file = f"test_results_{symbol}_{curr_date.replace('-', '')}.json"
-            # with open(output_file, "w", encoding="utf-8") as f:
-            #     json.dump(result_json, f, ensure_ascii=False, indent=2)
-            # print(f"\n✓ Full results saved to: {output_file}")
-
-        except json.JSONDecodeError as e:
-            print(f"\n⚠️ WARNING: Could not parse result as JSON")
-            print(f"JSON Error: {e}")
-            print("\nRaw output (first 500 characters):")
-            print("-" * 40)
-            print(result[:500] if len(result) > 500 else result)
-            if len(result) > 500:
-                print("... [truncated]")
+        asyncio.run(search_and_report(watchlist, curr_date))
 
     except Exception as e:
         print("\n✗ EXCEPTION OCCURRED:")
@@ -1,33 +1,30 @@
 #!/usr/bin/env python3
 """Complete test to understand OpenAI Responses API structure"""
 
-import os
-import sys
-from dotenv import load_dotenv
 import json
 
-# Load environment variables
-load_dotenv()
+from tradingagents.dataflows.utils import load_env
 
-# Add project root to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Load environment variables (already done by conftest.py under pytest)
+load_env()
 
 from tradingagents.dataflows.config import get_config
-from openai import OpenAI
+from tradingagents.dataflows.openai_utils import get_openai_client
 
-def test_complete_response_structure():
+def test_complete_response_structure(openai_client):
     """Test to fully understand the response object structure"""
 
     config = get_config()
-    client = OpenAI(base_url=config["backend_url"])
+    client = openai_client
 
     print("=" * 80)
     print("COMPLETE OPENAI RESPONSES API STRUCTURE TEST")
     print("=" * 80)
 
     try:
-        # Make a call with web search
-        response = client.responses.create(
+        # Stream a call with web search so output items can be inspected
+        # while the model is still generating
+        with client.responses.stream(
             model=config["quick_think_llm"],
             input=[
                 {
@@ -53,7 +50,23 @@ def test_complete_response_structure():
             max_output_tokens=500,
             top_p=1,
             store=True,
-        )
+        ) as stream:
+            print("\n0. STREAMED EVENTS")
+            print("-" * 40)
+            streamed_text = []
+            for event in stream:
+                if event.type == "response.output_item.done":
+                    item = event.item
+                    print(f"  Item done: {item.__class__.__name__} (status: {getattr(item, 'status', 'N/A')})")
+                    action = getattr(item, "action", None)
+                    if getattr(action, "query", None):
+                        print(f"    Query: {action.query}")
+                elif event.type == "response.output_text.delta":
+                    streamed_text.append(event.delta)
+
+            response = stream.get_final_response()
+
+        print(f"  Streamed text length: {len(''.join(streamed_text))}")
 
         print("\n1. RESPONSE OBJECT OVERVIEW")
         print("-" * 40)
@@ -62,23 +75,16 @@ def test_complete_response_structure():
 
         print("\n2. TOP-LEVEL ATTRIBUTES")
         print("-" * 40)
-        # Get all non-private attributes
-        attrs = [attr for attr in dir(response) if not attr.startswith('_') and not attr.startswith('model_')]
-
-        for attr in sorted(attrs):
-            if hasattr(response, attr):
-                value = getattr(response, attr)
-                # Skip methods
-                if callable(value):
-                    continue
-
-                if value is not None:
-                    if isinstance(value, (str, int, float, bool)):
-                        print(f"  {attr}: {value}")
-                    elif isinstance(value, list):
-                        print(f"  {attr}: List with {len(value)} items")
-                    else:
-                        print(f"  {attr}: {type(value).__name__}")
+        # Dump the populated fields once instead of reflecting over dir(response)
+        fields = response.model_dump(mode="python", exclude_none=True)
+
+        for attr, value in sorted(fields.items()):
+            if isinstance(value, (str, int, float, bool)):
+                print(f"  {attr}: {value}")
+            elif isinstance(value, list):
+                print(f"  {attr}: List with {len(value)} items")
+            else:
+                print(f"  {attr}: {type(getattr(response, attr)).__name__}")
 
         print("\n3. RESPONSE.OUTPUT ANALYSIS")
         print("-" * 40)
@@ -121,20 +127,23 @@ def test_complete_response_structure():
 
         print("\n4. RESPONSE.OUTPUT_TEXT ANALYSIS")
         print("-" * 40)
-        if hasattr(response, 'output_text'):
-            print(f"response.output_text type: {type(response.output_text)}")
+        # output_text is a property that re-joins every output message on each
+        # access, so read it once and reuse the string below
+        output_text = getattr(response, 'output_text', None)
+        if output_text is not None:
+            print(f"response.output_text type: {type(output_text)}")
 
-            if response.output_text:
+            if output_text:
                 print("\nWhat response.output_text is:")
                 print("  - The final formatted text output from the model")
                 print("  - This is what should be shown to the user")
                 print("  - It's the model's actual answer after reasoning and web search")
 
                 # Try to get the actual text
-                if isinstance(response.output_text, str):
-                    print(f"\n  Actual text: {response.output_text[:200]}...")
+                if isinstance(output_text, str):
+                    print(f"\n  Actual text: {output_text[:200]}...")
                 else:
-                    print(f"  output_text is not a string, it's: {response.output_text}")
+                    print(f"  output_text is not a string, it's: {output_text}")
 
         print("\n5. OTHER IMPORTANT ATTRIBUTES")
         print("-" * 40)
@@ -173,9 +182,9 @@ def test_complete_response_structure():
                                 break
 
         # Method 2: Check output_text
-        if not extracted_text and hasattr(response, 'output_text'):
-            if isinstance(response.output_text, str):
-                extracted_text = response.output_text
+        if not extracted_text and output_text is not None:
+            if isinstance(output_text, str):
+                extracted_text = output_text
                 print(f"\n✓ Found text via output_text: {extracted_text[:100]}...")
 
         if not extracted_text:
@@ -187,4 +196,4 @@ def test_complete_response_structure():
         traceback.print_exc()
 
 if __name__ == "__main__":
-    test_complete_response_structure()
\ No newline at end of file
+    test_complete_response_structure(get_openai_client())
\ No newline at end of file
@@ -1,24 +1,19 @@
 #!/usr/bin/env python3
 """Test to understand the structure of OpenAI Responses API objects"""
 
-import os
-import sys
-from dotenv import load_dotenv
+from tradingagents.dataflows.utils import load_env
 
-# Load environment variables
-load_dotenv()
-
-# Add project root to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Load environment variables (already done by conftest.py under pytest)
+load_env()
 
 from tradingagents.dataflows.config import get_config
-from openai import OpenAI
+from tradingagents.dataflows.openai_utils import get_openai_client
 
-def test_response_structure():
+def test_response_structure(openai_client):
     """Test and print the structure of response objects"""
 
     config = get_config()
-    client = OpenAI(base_url=config["backend_url"])
+    client = openai_client
 
     print("Testing OpenAI Responses API structure...")
     print("-" * 50)
@@ -47,7 +42,7 @@ def test_response_structure():
         )
 
         print(f"Response type: {type(response)}")
-        print(f"Response attributes: {dir(response)}")
+        print(f"Response fields: {list(response.model_dump(exclude_none=True))}")
         print()
 
         # Check if response has output attribute
@@ -61,7 +56,7 @@ def test_response_structure():
                 print(f"Item {i}:")
                 print(f"  Type: {type(item)}")
                 print(f"  Class name: {item.__class__.__name__}")
-                print(f"  Attributes: {dir(item)}")
+                print(f"  Fields: {list(item.model_dump(exclude_none=True))}")
 
                 # Try to get content/text from different possible attributes
                 if hasattr(item, 'content'):
@@ -109,4 +104,4 @@ def test_response_structure():
         print(f"Error: {type(e).__name__}: {e}")
 
 if __name__ == "__main__":
-    test_response_structure()
\ No newline at end of file
+    test_response_structure(get_openai_client())
\ No newline at end of file
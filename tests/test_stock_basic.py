@@ -1,13 +1,13 @@
-import os
-import tushare as ts
-import dotenv
-dotenv.load_dotenv()
+from tradingagents.dataflows.utils import load_env
 
-ts_key = os.getenv('TUSHARE_TOKEN')
-pro = ts.pro_api()
+# Load environment variables (already done by conftest.py under pytest)
+load_env()
+
+from tradingagents.dataflows.tushare_utils import get_tushare_utils
 
 # Get one row and print all column names supported by stock_basic
-df = pro.stock_basic(limit=1)  # no fields => all columns
+# (the full listing is cached on disk, so reruns skip the API call)
+df = get_tushare_utils().get_stock_basic().head(1)  # no fields => all columns
 print(list(df.columns))
 # print(df.head())
 for col in df.columns:
@@ -1,24 +1,28 @@
 #!/usr/bin/env python3
 """Test get_stock_news_openai function"""
 
-import os
-import sys
-import signal
-from dotenv import load_dotenv
+import pytest
 
-# Load environment variables
-load_dotenv()
+from tradingagents.dataflows.utils import load_env
 
-# Add project root to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Load environment variables (already done by conftest.py under pytest)
+load_env()
 
+from tradingagents.dataflows.config import get_config, set_config
 from tradingagents.dataflows.interface import get_stock_news_openai
 
-# Timeout handler for long-running API calls
-def timeout_handler(signum, frame):
-    print("\n⚠️ Test timed out after 30 seconds")
-    print("The API call is taking too long - this is likely due to the OpenAI Responses API")
-    exit(1)
+# Each OpenAI request gives up after this many seconds; the client raises a
+# catchable timeout error instead of the process being killed
+REQUEST_TIMEOUT = 30
+
+
+@pytest.fixture(autouse=True)
+def request_timeout():
+    """Shorten the OpenAI timeout for this module and restore the config afterwards"""
+    original = get_config()
+    set_config({"openai_request_timeout": REQUEST_TIMEOUT})
+    yield
+    set_config(original)
 
 def test_get_stock_news_openai():
     """Test the get_stock_news_openai function"""
@@ -94,11 +98,5 @@ def test_get_stock_news_openai():
     print("\n" + "=" * 70)
 
 if __name__ == "__main__":
-    # Set a 30 second timeout
-    signal.signal(signal.SIGALRM, timeout_handler)
-    signal.alarm(30)
-
-    try:
-        test_get_stock_news_openai()
-    finally:
-        signal.alarm(0)  # Cancel the alarm
\ No newline at end of file
+    set_config({"openai_request_timeout": REQUEST_TIMEOUT})
+    test_get_stock_news_openai()
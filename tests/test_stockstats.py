@@ -4,15 +4,15 @@ Test script for stockstats_utils.py to verify data format compatibility
 """
 
 import pandas as pd
-import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from tradingagents.dataflows.stockstats_utils import StockstatsUtils
 from tradingagents.dataflows.tushare_utils import get_tushare_utils
 from stockstats import wrap
 import numpy as np
 
+# Set TEST_VERBOSE=1 to print DataFrame reprs (columns, dtypes, sample rows)
+VERBOSE = bool(os.getenv("TEST_VERBOSE"))
+
 def test_tushare_data_format():
     """Test if Tushare data format works with stockstats"""
     print("\n=== Testing Tushare Data Format ===")
@@ -27,9 +27,12 @@ def test_tushare_data_format():
     data = tushare.get_stock_data(symbol, start_date, end_date)
 
     print("\n1. Raw Tushare Data:")
-    print(f"   Columns: {list(data.columns)}")
-    print(f"   Data types:\n{data.dtypes}")
-    print(f"   First 3 rows:\n{data.head(3)}")
+    if VERBOSE:
+        print(f"   Columns: {list(data.columns)}")
+        print(f"   Data types:\n{data.dtypes}")
+        print(f"   First 3 rows:\n{data.head(3)}")
+    else:
+        print(f"   {len(data)} rows (set TEST_VERBOSE=1 for columns, dtypes and sample rows)")
 
     # Test wrapping with stockstats
     print("\n2. Testing stockstats wrap:")
@@ -38,7 +41,16 @@ def test_tushare_data_format():
         # But we need to check what columns are actually present
         df = wrap(data)
         print("   ✓ Wrap successful")
-        print(f"   Available columns after wrap: {list(df.columns)}")
+        if VERBOSE:
+            print(f"   Available columns after wrap: {list(df.columns)}")
+
+        # Compute every indicator in one access so stockstats shares the
+        # intermediate EMA/SMA columns; the checks below then read cached columns
+        indicators_to_test = ['close_10_sma', 'macd', 'boll']
+        try:
+            df[['rsi'] + indicators_to_test]
+        except Exception:
+            pass  # the per-indicator checks report which one failed
 
         # Test calculating an indicator
         print("\n3. Testing indicator calculation:")
@@ -51,10 +63,9 @@ def test_tushare_data_format():
             print(f"   ✗ RSI calculation failed: {e}")
 
         # Test other indicators
-        indicators_to_test = ['close_10_sma', 'macd', 'boll']
         for indicator in indicators_to_test:
             try:
-                values = df[indicator]
+                df[indicator]
                 print(f"   ✓ {indicator} calculation successful")
             except Exception as e:
                 print(f"   ✗ {indicator} calculation failed: {e}")
@@ -129,20 +140,17 @@ def test_date_matching():
 
     # Test date matching
     test_date = "2024-11-15"
-    test_date_dt = pd.to_datetime(test_date)
 
     print(f"\nTesting match for {test_date}")
 
-    # Method 1: Using dt.date
-    matches1 = sample_data[sample_data['Date'].dt.date == test_date_dt.date()]
-    print(f"Method 1 (dt.date): Found {len(matches1)} matches")
-
-    # Method 2: Using string comparison with formatted dates
-    sample_data['Date_str'] = sample_data['Date'].dt.strftime('%Y-%m-%d')
-    matches2 = sample_data[sample_data['Date_str'] == test_date]
-    print(f"Method 2 (string): Found {len(matches2)} matches")
+    # Dates are sorted, so a binary search finds the row without scanning
+    days = sample_data['Date'].values.astype('datetime64[D]')
+    target = np.datetime64(test_date, 'D')
+    idx = np.searchsorted(days, target)
+    match = sample_data.iloc[idx] if idx < len(days) and days[idx] == target else None
+    print(f"Binary search: {'found' if match is not None else 'no'} match")
 
-    if len(matches1) > 0:
+    if match is not None:
         print(f"✓ Date matching works!")
     else:
         print(f"✗ Date matching failed")
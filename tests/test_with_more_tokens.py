@@ -1,90 +1,124 @@
 #!/usr/bin/env python3
 """Test with increased max_output_tokens"""
 
-import os
-import sys
-from dotenv import load_dotenv
+import asyncio
+import functools
 
-# Load environment variables
-load_dotenv()
+from tradingagents.dataflows.utils import load_env
 
-# Add project root to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Load environment variables (already done by conftest.py under pytest)
+load_env()
 
-from tradingagents.dataflows.interface import get_stock_news_openai
-
-# First, let's patch the function temporarily to use more tokens
 from tradingagents.dataflows.config import get_config
-from openai import OpenAI
+from tradingagents.dataflows.openai_utils import gather_with_client
 
-def test_stock_news_with_more_tokens():
-    """Test with increased token limit"""
 
-    print("Testing with increased max_output_tokens...")
-    print("-" * 40)
+# Enough text to judge the search; streaming stops once this much has arrived
+PREVIEW_CHARS = 500
 
-    config = get_config()
-    client = OpenAI(base_url=config["backend_url"])
 
-    ticker = "AAPL"
-    curr_date = "2025-09-19"
+async def fetch_social_media_search(client, ticker, curr_date):
+    """
+    Stream the social-media web search for one ticker with the larger token limit.
 
-    try:
-        print(f"Calling API with max_output_tokens=10000 (instead of 4096)")
-
-        response = client.responses.create(
-            model=config["quick_think_llm"],
-            input=[
-                {
-                    "role": "system",
-                    "content": [
-                        {
-                            "type": "input_text",
-                            "text": f"Can you search Social Media for {ticker} from 7 days before {curr_date} to {curr_date}? Make sure you only get the data posted during that period.",
-                        }
-                    ],
-                }
-            ],
-            text={"format": {"type": "text"}},
-            reasoning={},
-            tools=[
-                {
-                    "type": "web_search_preview",
-                    "user_location": {"type": "approximate"},
-                    "search_context_size": "low",
-                }
-            ],
-            temperature=1,
-            max_output_tokens=10000,  # Increased from 4096
-            top_p=1,
-            store=True,
-        )
+    The stream is closed as soon as PREVIEW_CHARS of text have arrived, so
+    the test does not wait for the full generation.
 
+    Returns:
+        (text, response): text received so far, and the final response or
+        None if the stream was stopped early
+    """
+    config = get_config()
+    collected = []
+    received = 0
+    async with client.responses.stream(
+        model=config["quick_think_llm"],
+        input=[
+            {
+                "role": "system",
+                "content": [
+                    {
+                        "type": "input_text",
+                        "text": f"Can you search Social Media for {ticker} from 7 days before {curr_date} to {curr_date}? Make sure you only get the data posted during that period.",
+                    }
+                ],
+            }
+        ],
+        text={"format": {"type": "text"}},
+        reasoning={},
+        tools=[
+            {
+                "type": "web_search_preview",
+                "user_location": {"type": "approximate"},
+                "search_context_size": "low",
+            }
+        ],
+        temperature=1,
+        max_output_tokens=10000,  # Increased from 4096
+        top_p=1,
+        store=True,
+    ) as stream:
+        async for event in stream:
+            if event.type == "response.output_text.delta":
+                collected.append(event.delta)
+                received += len(event.delta)
+                if received >= PREVIEW_CHARS:
+                    return "".join(collected), None
+
+        return "".join(collected), await stream.get_final_response()
+
+
+def report_social_media_search(result):
+    """Print status and output text of one streamed search"""
+    text, response = result
+
+    if response is None:
+        print(f"\nStopped streaming after {len(text)} characters")
+    else:
         print(f"\nResponse Status: {response.status}")
 
         if response.status == "incomplete":
             print(f"  Still incomplete. Reason: {response.incomplete_details}")
 
-        print(f"\nOutput Text:")
-        print(f"  Is empty: {response.output_text == ''}")
+    print(f"\nOutput Text:")
+    print(f"  Is empty: {text == ''}")
+
+    if text:
+        print(f"  Length: {len(text)} characters")
+        print(f"\nContent Preview:")
+        print("-" * 40)
+        print(text[:PREVIEW_CHARS])
+        if response is None or len(text) > PREVIEW_CHARS:
+            print("... [truncated]")
+    else:
+        print("  output_text is still empty")
+
+        # Try to understand what's in the output
+        print(f"\nOutput items: {len(response.output)}")
+        for i, item in enumerate(response.output):
+            print(f"  {i}: {item.__class__.__name__} - Status: {getattr(item, 'status', 'N/A')}")
+
+
+def test_stock_news_with_more_tokens():
+    """Test with increased token limit"""
+
+    print("Testing with increased max_output_tokens...")
+    print("-" * 40)
+
+    ticker = "AAPL"
+    curr_date = "2025-09-19"
 
-        if response.output_text:
-            print(f"  Length: {len(response.output_text)} characters")
-            print(f"\nContent Preview:")
-            print("-" * 40)
-            print(response.output_text[:500])
-            if len(response.output_text) > 500:
-                print("... [truncated]")
-        else:
-            print("  output_text is still empty")
+    print(f"Calling API with max_output_tokens=10000 (instead of 4096)")
 
-            # Try to understand what's in the output
-            print(f"\nOutput items: {len(response.output)}")
-            for i, item in enumerate(response.output):
-                print(f"  {i}: {item.__class__.__name__} - Status: {getattr(item, 'status', 'N/A')}")
+    response, = asyncio.run(gather_with_client(
+        [functools.partial(fetch_social_media_search, ticker=ticker, curr_date=curr_date)],
+        return_exceptions=True,
+    ))
 
-    except Exception as e:
-        print(f"Error: {type(e).__name__}: {e}")
+    if isinstance(response, Exception):
+        print(f"Error: {type(response).__name__}: {response}")
+        return
+    report_social_media_search(response)
 
 if __name__ == "__main__":
-    test_stock_news_with_more_tokens()
\ No newline at end of file
+    test_stock_news_with_more_tokens()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test suite for the disk-backed caches in cache_utils.py
+"""
+
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from tradingagents.dataflows.cache_utils import (
+    FileCache,
+    ResponseCache,
+    disk_cached,
+    make_cache_key,
+)
+
+
+def test_make_cache_key_is_stable():
+    """Keys do not depend on keyword order and differ for different payloads"""
+
+    key1 = make_cache_key(model="gpt", input=[{"text": "昆仑万维"}], top_p=1)
+    key2 = make_cache_key(top_p=1, input=[{"text": "昆仑万维"}], model="gpt")
+    key3 = make_cache_key(model="gpt", input=[{"text": "平安银行"}], top_p=1)
+
+    assert key1 == key2
+    assert key1 != key3
+
+
+def test_response_cache_roundtrip():
+    """Stored text is returned for the same key and misses return None"""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = ResponseCache(os.path.join(temp_dir, "responses.sqlite"))
+
+        assert cache.get("missing") is None
+
+        cache.set("key", '{"items": []}')
+        assert cache.get("key") == '{"items": []}'
+
+        # A second instance over the same file sees the entry
+        reopened = ResponseCache(os.path.join(temp_dir, "responses.sqlite"))
+        assert reopened.get("key") == '{"items": []}'
+
+
+def test_response_cache_ttl():
+    """Entries older than the TTL are treated as misses"""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = ResponseCache(os.path.join(temp_dir, "responses.sqlite"), ttl=0.05)
+        cache.set("key", "value")
+        assert cache.get("key") == "value"
+
+        time.sleep(0.1)
+        assert cache.get("key") is None
+
+
+def test_file_cache_roundtrip_and_ttl():
+    """FileCache returns stored payloads until they expire"""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = FileCache(os.path.join(temp_dir, "news"), ttl=0.05)
+
+        assert cache.get("missing") is None
+
+        payload = {"items": [{"title_or_snippet": "昆仑万维"}]}
+        cache.set("key", payload)
+        assert cache.get("key") == payload
+
+        time.sleep(0.1)
+        assert cache.get("key") is None
+
+
+def test_disk_cached_reuses_results():
+    """disk_cached calls the function once per distinct argument set"""
+
+    calls = []
+
+    def fetch(symbol, date=None):
+        calls.append((symbol, date))
+        return f"{symbol} {date}"
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cached_fetch = disk_cached(FileCache(temp_dir))(fetch)
+
+        assert cached_fetch("AAPL", date="2024-11-15") == "AAPL 2024-11-15"
+        assert cached_fetch("AAPL", date="2024-11-15") == "AAPL 2024-11-15"
+        assert cached_fetch("MSFT", date="2024-11-15") == "MSFT 2024-11-15"
+        assert calls == [("AAPL", "2024-11-15"), ("MSFT", "2024-11-15")]
+
+        # Results rejected by should_cache are fetched again next time
+        calls.clear()
+        skip_aapl = disk_cached(
+            FileCache(os.path.join(temp_dir, "filtered")),
+            should_cache=lambda result: not result.startswith("AAPL"),
+        )(fetch)
+        skip_aapl("AAPL")
+        skip_aapl("AAPL")
+        assert calls == [("AAPL", None), ("AAPL", None)]
+
+
+def test_file_cache_concurrent_writes():
+    """Threads writing the same key never corrupt the entry or leave temp files"""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = FileCache(temp_dir)
+        payload = {"text": "x" * 100000}
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda _: cache.set("same", payload), range(32)))
+
+        assert cache.get("same") == payload
+        assert os.listdir(temp_dir) == ["same.json"]
+
+
+if __name__ == "__main__":
+    test_make_cache_key_is_stable()
+    test_response_cache_roundtrip()
+    test_response_cache_ttl()
+    test_file_cache_roundtrip_and_ttl()
+    test_disk_cached_reuses_results()
+    test_file_cache_concurrent_writes()
+    print("✅ cache_utils tests passed")
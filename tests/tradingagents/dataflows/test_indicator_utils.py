@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test suite for the indicator kernels in indicator_utils.py
+"""
+
+
+import numpy as np
+import pandas as pd
+
+from tradingagents.dataflows.indicator_utils import ema, macd
+
+
+def _sample_close(n=300):
+    rng = np.random.default_rng(0)
+    return 20 + np.cumsum(rng.normal(0, 0.5, n))
+
+
+def test_ema_matches_pandas():
+    """ema() agrees with pandas ewm(adjust=False)"""
+
+    close = _sample_close()
+    expected = pd.Series(close).ewm(span=12, adjust=False).mean().to_numpy()
+
+    np.testing.assert_allclose(ema(close, 12), expected)
+
+
+def test_macd_matches_pandas():
+    """macd() agrees with the pandas EMA formulation"""
+
+    close = pd.Series(_sample_close())
+    fast = close.ewm(span=12, adjust=False).mean()
+    slow = close.ewm(span=26, adjust=False).mean()
+    expected_macd = fast - slow
+    expected_signal = expected_macd.ewm(span=9, adjust=False).mean()
+
+    macd_line, signal_line, hist = macd(close.to_numpy())
+
+    np.testing.assert_allclose(macd_line, expected_macd.to_numpy())
+    np.testing.assert_allclose(signal_line, expected_signal.to_numpy())
+    np.testing.assert_allclose(hist, (expected_macd - expected_signal).to_numpy())
+
+
+def test_ema_empty_input():
+    """Empty input yields an empty result"""
+
+    assert ema(np.array([]), 12).shape == (0,)
+
+
+if __name__ == "__main__":
+    test_ema_matches_pandas()
+    test_macd_matches_pandas()
+    test_ema_empty_input()
+    print("✅ indicator_utils tests passed")
@@ -6,14 +6,17 @@ Test suite for interface.py functions including Tushare and other data sources
 
 import sys
 import os
-from dotenv import load_dotenv
+import asyncio
+import functools
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
-# Add project root to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+from tradingagents.dataflows.utils import load_env
 
-# Load environment variables
-load_dotenv()
+# Load environment variables (already done by conftest.py under pytest)
+load_env()
 
 from tradingagents.dataflows.interface import (
     get_tushare_stock_info,
@@ -26,6 +29,135 @@ from tradingagents.dataflows.interface import (
     get_stockstats_indicator,
     get_stock_stats_indicators_window
 )
+from tradingagents.dataflows.cache_utils import FileCache, disk_cached
+
+
+def _memoize(func):
+    """In-process memo for keyword-only calls, so repeated argument sets fetch once per run"""
+    @functools.lru_cache(maxsize=256)
+    def cached(items):
+        return func(**dict(items))
+
+    @functools.wraps(func)
+    def wrapper(**kwargs):
+        return cached(tuple(sorted(kwargs.items())))
+
+    return wrapper
+
+
+# Historical ranges do not change, so keep fetched results on disk between
+# runs; set TEST_NO_CACHE=1 to always hit the live APIs. The interface
+# functions report failures as "Error..." strings, which are not stored.
+if not os.environ.get("TEST_NO_CACHE"):
+    _test_cache = disk_cached(
+        FileCache(
+            os.path.join(os.path.dirname(os.path.abspath(__file__)), ".test_cache"),
+            ttl=90 * 24 * 60 * 60,
+        ),
+        should_cache=lambda result: not str(result).startswith("Error"),
+    )
+    get_tushare_stock_info = _test_cache(get_tushare_stock_info)
+    get_tushare_data_online = _test_cache(get_tushare_data_online)
+    get_finnhub_news = _test_cache(get_finnhub_news)
+    get_google_news = _test_cache(get_google_news)
+    get_YFin_data_online = _test_cache(get_YFin_data_online)
+
+# e.g. test_yfin_data and test_chinese_vs_us_stocks request the same AAPL range
+get_tushare_stock_info = _memoize(get_tushare_stock_info)
+get_YFin_data_online = _memoize(get_YFin_data_online)
+
+
+class _ThreadLocalStdout(io.TextIOBase):
+    """Route print() from worker threads into per-thread buffers"""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def write(self, text):
+        buffer = getattr(self._local, "buffer", None)
+        return (buffer or self._stream).write(text)
+
+    def flush(self):
+        self._stream.flush()
+
+    def capture(self, fn):
+        """Run fn and return everything it printed"""
+        self._local.buffer = io.StringIO()
+        try:
+            fn()
+            return self._local.buffer.getvalue()
+        finally:
+            self._local.buffer = None
+
+
+# Static reference text, written in one call instead of a print() per line
+OUTPUT_FORMATS = """
+### Tushare Output Structure ###
+----------------------------------------
+Header format:
+  # Tushare Stock Information
+  # Symbol: [SYMBOL]
+  # Info Type: [TYPE]
+  # Date: [DATE]
+  # Retrieved: [TIMESTAMP]
+  ============================================================
+
+Content format (varies by info_type):
+  - Company: Name, Industry, Area, Listed, Market, Concepts
+  - Financial: ROE, ROA, EPS, P/E, P/B, Margins
+  - News: Title, Date, Source, Content
+  - Concepts: Concept Name, In Date
+
+### Reddit Output Structure ###
+----------------------------------------
+Header format:
+  ## [TICKER] News Reddit, from [START] to [END]:
+
+Content format:
+  ### [Post Title]
+  [Post Content]
+  (with metadata like upvotes, date)
+
+### Finnhub Output Structure ###
+----------------------------------------
+Header format:
+  ## [TICKER] News, from [START] to [END]:
+
+Content format:
+  ### [Headline] (date)
+  [Summary]
+
+### YFin Output Structure ###
+----------------------------------------
+Header format:
+  # Stock data for [SYMBOL] from [START] to [END]
+  # Total records: [COUNT]
+  # Data retrieved on: [TIMESTAMP]
+
+Content format:
+  CSV format with columns:
+  Date, Open, High, Low, Close, Adj Close, Volume
+"""
+
+DATA_COVERAGE_SUMMARY = """
+### Data Source Coverage Matrix ###
+----------------------------------------
+
+| Data Source     | Chinese Stocks | US Stocks |
+|-----------------|----------------|-----------|
+| Tushare         |  Full Support |  No      |
+| Yahoo Finance   |  Limited      |  Full    |
+| Reddit          |  Limited      |  Yes     |
+| Finnhub         |  No           |  Yes     |
+| Google News     | ~ Some         |  Yes     |
+| StockStats      |  Yes (w/data) |  Yes     |
+
+Legend:
+   = Full support
+  ~ = Partial support
+   = No support or very limited
+"""
 
 
 def print_section_header(title):
@@ -44,61 +176,39 @@ def test_tushare_stock_info():
 
     print_section_header("TESTING TUSHARE STOCK INFO FUNCTIONS")
 
-    # Test 1: Company Information
-    print("\n### 1. Company Information ###")
-    print("-" * 40)
-    try:
-        company_info = get_tushare_stock_info(
-            symbol=symbol,
-            info_type="company",
-            date=test_date,
-            max_limit=10
-        )
-        print(company_info)
-    except Exception as e:
-        print(f"Error: {e}")
-
-    # Test 2: Financial Data
-    print("\n### 2. Financial Data ###")
-    print("-" * 40)
-    try:
-        financial_info = get_tushare_stock_info(
-            symbol=symbol,
-            info_type="financial",
-            date="2024-09-30",  # Use quarter end date
-            max_limit=1
-        )
-        print(financial_info)
-    except Exception as e:
-        print(f"Error: {e}")
-
-    # Test 3: Concepts/Themes
-    print("\n### 3. Stock Concepts/Themes ###")
-    print("-" * 40)
-    try:
-        concepts_info = get_tushare_stock_info(
-            symbol=symbol,
-            info_type="concept",
-            date=test_date,
-            max_limit=5
-        )
-        print(concepts_info)
-    except Exception as e:
-        print(f"Error: {e}")
-
-    # Test 4: News (may require special permissions)
-    print("\n### 4. Stock News ###")
-    print("-" * 40)
-    try:
-        news_info = get_tushare_stock_info(
-            symbol=symbol,
-            info_type="news",
-            date=test_date,
-            max_limit=3
-        )
-        print(news_info)
-    except Exception as e:
-        print(f"Error: {e}")
+    # (heading, info_type, date, max_limit); news may require special permissions
+    sub_tests = [
+        ("1. Company Information", "company", test_date, 10),
+        ("2. Financial Data", "financial", "2024-09-30", 1),  # Use quarter end date
+        ("3. Stock Concepts/Themes", "concept", test_date, 5),
+        ("4. Stock News", "news", test_date, 3),
+    ]
+
+    def fetch(info_type, date, max_limit):
+        try:
+            return get_tushare_stock_info(
+                symbol=symbol,
+                info_type=info_type,
+                date=date,
+                max_limit=max_limit
+            )
+        except Exception as e:
+            return f"Error: {e}"
+
+    # The four lookups are independent round-trips, so issue them together
+    async def fetch_all():
+        loop = asyncio.get_running_loop()
+        return await asyncio.gather(*[
+            loop.run_in_executor(None, functools.partial(fetch, info_type, date, max_limit))
+            for _, info_type, date, max_limit in sub_tests
+        ])
+
+    results = asyncio.run(fetch_all())
+
+    for (heading, *_), result in zip(sub_tests, results):
+        print(f"\n### {heading} ###")
+        print("-" * 40)
+        print(result)
 
 
 def test_tushare_price_data():
@@ -277,52 +387,7 @@ def compare_output_formats():
     """Compare different output formats"""
 
     print_section_header("OUTPUT FORMAT COMPARISON")
-
-    print("\n### Tushare Output Structure ###")
-    print("-" * 40)
-    print("Header format:")
-    print("  # Tushare Stock Information")
-    print("  # Symbol: [SYMBOL]")
-    print("  # Info Type: [TYPE]")
-    print("  # Date: [DATE]")
-    print("  # Retrieved: [TIMESTAMP]")
-    print("  " + "=" * 60)
-    print("")
-    print("Content format (varies by info_type):")
-    print("  - Company: Name, Industry, Area, Listed, Market, Concepts")
-    print("  - Financial: ROE, ROA, EPS, P/E, P/B, Margins")
-    print("  - News: Title, Date, Source, Content")
-    print("  - Concepts: Concept Name, In Date")
-
-    print("\n### Reddit Output Structure ###")
-    print("-" * 40)
-    print("Header format:")
-    print("  ## [TICKER] News Reddit, from [START] to [END]:")
-    print("")
-    print("Content format:")
-    print("  ### [Post Title]")
-    print("  [Post Content]")
-    print("  (with metadata like upvotes, date)")
-
-    print("\n### Finnhub Output Structure ###")
-    print("-" * 40)
-    print("Header format:")
-    print("  ## [TICKER] News, from [START] to [END]:")
-    print("")
-    print("Content format:")
-    print("  ### [Headline] (date)")
-    print("  [Summary]")
-
-    print("\n### YFin Output Structure ###")
-    print("-" * 40)
-    print("Header format:")
-    print("  # Stock data for [SYMBOL] from [START] to [END]")
-    print("  # Total records: [COUNT]")
-    print("  # Data retrieved on: [TIMESTAMP]")
-    print("")
-    print("Content format:")
-    print("  CSV format with columns:")
-    print("  Date, Open, High, Low, Close, Adj Close, Volume")
+    sys.stdout.write(OUTPUT_FORMATS)
 
 
 def test_chinese_vs_us_stocks():
@@ -344,15 +409,14 @@ def test_chinese_vs_us_stocks():
             date=test_date,
             max_limit=1
         )
-        # Extract just the content part
-        lines = tushare_info.split('\n')
-        for i, line in enumerate(lines):
-            if "====" in line and i < len(lines) - 1:
-                print("Tushare Data Available:")
-                for content_line in lines[i+1:]:
-                    if content_line.strip():
-                        print(f"  {content_line.strip()}")
-                break
+        # Extract just the content part, after the "====" header rule
+        rule = tushare_info.find("====")
+        content_start = tushare_info.find("\n", rule) + 1 if rule != -1 else 0
+        if content_start:
+            print("Tushare Data Available:")
+            for content_line in tushare_info[content_start:].splitlines():
+                if content_line.strip():
+                    print(f"  {content_line.strip()}")
     except Exception as e:
         print(f"Tushare Error: {e}")
 
@@ -365,7 +429,7 @@ def test_chinese_vs_us_stocks():
             max_limit_per_day=2
         )
         if reddit_cn:
-            print(f"Reddit Data: Found {len(reddit_cn.split('###')) - 1} posts")
+            print(f"Reddit Data: Found {reddit_cn.count('###')} posts")
         else:
             print("Reddit Data: No data found (expected for Chinese stocks)")
     except:
@@ -407,23 +471,7 @@ def test_data_coverage_summary():
     """Summarize data coverage for different sources"""
 
     print_section_header("DATA COVERAGE SUMMARY")
-
-    print("\n### Data Source Coverage Matrix ###")
-    print("-" * 40)
-    print("")
-    print("| Data Source     | Chinese Stocks | US Stocks |")
-    print("|-----------------|----------------|-----------|")
-    print("| Tushare         |  Full Support |  No      |")
-    print("| Yahoo Finance   |  Limited      |  Full    |")
-    print("| Reddit          |  Limited      |  Yes     |")
-    print("| Finnhub         |  No           |  Yes     |")
-    print("| Google News     | ~ Some         |  Yes     |")
-    print("| StockStats      |  Yes (w/data) |  Yes     |")
-    print("")
-    print("Legend:")
-    print("   = Full support")
-    print("  ~ = Partial support")
-    print("   = No support or very limited")
+    sys.stdout.write(DATA_COVERAGE_SUMMARY)
 
 
 def main():
@@ -436,15 +484,31 @@ def main():
     print("#" * 80)
 
     # Run all tests
-    # test_reddit_functions()
-    test_tushare_stock_info()
-    test_tushare_price_data()
-    test_other_news_sources()
-    test_technical_indicators()
-    test_yfin_data()
-    compare_output_formats()
-    test_chinese_vs_us_stocks()
-    test_data_coverage_summary()
+    tests = [
+        # test_reddit_functions,
+        test_tushare_stock_info,
+        test_tushare_price_data,
+        test_other_news_sources,
+        test_technical_indicators,
+        test_yfin_data,
+        compare_output_formats,
+        test_chinese_vs_us_stocks,
+        test_data_coverage_summary,
+    ]
+
+    # The tests are independent and mostly wait on HTTP, so run them
+    # concurrently and print each one's buffered output in the original order
+    stdout = sys.stdout
+    sys.stdout = _ThreadLocalStdout(stdout)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(sys.stdout.capture, test) for test in tests]
+            outputs = [future.result() for future in futures]
+    finally:
+        sys.stdout = stdout
+
+    for output in outputs:
+        print(output, end="")
 
     print("\n" + "#" * 80)
     print("#" + " " * 30 + "TESTS COMPLETED" + " " * 33 + "#")
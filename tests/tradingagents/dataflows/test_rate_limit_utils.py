@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test suite for the OpenAI rate limiter in rate_limit_utils.py
+"""
+
+import asyncio
+import threading
+import time
+
+from tradingagents.dataflows import rate_limit_utils
+from tradingagents.dataflows.rate_limit_utils import (
+    AsyncRateLimiter,
+    call_with_rate_limit,
+    parse_reset_duration,
+)
+
+
+class _RateLimited(Exception):
+    status_code = 429
+    response = None
+
+
+class _ServerError(Exception):
+    status_code = 500
+    response = None
+
+
+class _BadRequest(Exception):
+    status_code = 400
+    response = None
+
+
+class _RawResponse:
+    def __init__(self, headers, value):
+        self.headers = headers
+        self._value = value
+
+    def parse(self):
+        return self._value
+
+
+def test_parse_reset_duration():
+    """OpenAI reset header formats are converted to seconds"""
+
+    assert parse_reset_duration("6m0s") == 360
+    assert parse_reset_duration("1.5s") == 1.5
+    assert parse_reset_duration("20ms") == 0.02
+    assert parse_reset_duration("2") == 2
+    assert parse_reset_duration(None) is None
+    assert parse_reset_duration("soon") is None
+
+
+def test_acquire_within_budget_does_not_wait():
+    """Requests inside the per-minute budget are admitted immediately"""
+
+    limiter = AsyncRateLimiter(max_requests_per_minute=60, max_tokens_per_minute=1000)
+
+    async def run():
+        for _ in range(5):
+            await limiter.acquire(tokens=100)
+
+    start = time.monotonic()
+    asyncio.run(run())
+    assert time.monotonic() - start < 0.1
+    assert limiter.available_tokens < 600
+
+
+def test_acquire_waits_when_budget_exhausted():
+    """Once the request bucket is empty callers wait for it to refill"""
+
+    # 1200 RPM refills one request every 50ms
+    limiter = AsyncRateLimiter(max_requests_per_minute=1200)
+    limiter.available_requests = 0
+
+    start = time.monotonic()
+    asyncio.run(limiter.acquire())
+    assert time.monotonic() - start >= 0.04
+
+
+def test_headers_tighten_budget():
+    """Remaining counts reported by the server cap the local buckets"""
+
+    limiter = AsyncRateLimiter(max_requests_per_minute=500, max_tokens_per_minute=10000)
+    limiter.update_from_headers({
+        "x-ratelimit-remaining-requests": "3",
+        "x-ratelimit-remaining-tokens": "250",
+    })
+
+    assert limiter.available_requests == 3
+    assert limiter.available_tokens == 250
+
+
+def test_call_with_rate_limit_retries_429():
+    """A 429 pauses the limiter and the request is retried"""
+
+    limiter = AsyncRateLimiter(max_requests_per_minute=6000)
+    attempts = []
+
+    async def request():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise _RateLimited()
+        return _RawResponse({}, "ok")
+
+    # Keep the backoff short for the test
+    limiter.pause = lambda seconds: AsyncRateLimiter.pause(limiter, 0.01)
+
+    assert asyncio.run(call_with_rate_limit(limiter, request)) == "ok"
+    assert len(attempts) == 2
+
+
+def test_call_with_rate_limit_retries_server_errors():
+    """A 5xx is retried with backoff; other client errors are raised at once"""
+
+    limiter = AsyncRateLimiter(max_requests_per_minute=6000)
+    attempts = []
+
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise _ServerError()
+        return _RawResponse({}, "ok")
+
+    async def bad_request():
+        attempts.append(1)
+        raise _BadRequest()
+
+    # Keep the backoff short for the test
+    original_backoff = rate_limit_utils.RETRY_BACKOFF_SECONDS
+    rate_limit_utils.RETRY_BACKOFF_SECONDS = 0.001
+    try:
+        assert asyncio.run(call_with_rate_limit(limiter, flaky)) == "ok"
+        assert len(attempts) == 2
+
+        attempts.clear()
+        try:
+            asyncio.run(call_with_rate_limit(limiter, bad_request))
+        except _BadRequest:
+            pass
+        else:
+            raise AssertionError("400 should not be retried")
+        assert len(attempts) == 1
+    finally:
+        rate_limit_utils.RETRY_BACKOFF_SECONDS = original_backoff
+
+
+def test_limiter_shared_across_threads():
+    """Event loops in several threads draw on one budget without losing updates"""
+
+    limiter = AsyncRateLimiter(max_requests_per_minute=100)
+
+    async def take(count):
+        for _ in range(count):
+            await limiter.acquire()
+
+    threads = [threading.Thread(target=asyncio.run, args=(take(25),)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # All 100 reservations are recorded; only a sliver has refilled since
+    assert 0 <= limiter.available_requests < 1
+
+
+if __name__ == "__main__":
+    test_parse_reset_duration()
+    test_acquire_within_budget_does_not_wait()
+    test_acquire_waits_when_budget_exhausted()
+    test_headers_tighten_budget()
+    test_call_with_rate_limit_retries_429()
+    test_call_with_rate_limit_retries_server_errors()
+    test_limiter_shared_across_threads()
+    print("✅ rate_limit_utils tests passed")
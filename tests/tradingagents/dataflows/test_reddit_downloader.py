@@ -6,45 +6,81 @@ Tests the Reddit download functionality and data format compatibility
 """
 
 import os
-import sys
-import json
+import mmap
 import tempfile
-import shutil
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock
-from dotenv import load_dotenv
+import pytest
 
-# Add project root to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+from tradingagents.dataflows.utils import dumps_json_line, load_env, loads_json
 
-# Load environment variables
-load_dotenv()
+# Load environment variables (already done by conftest.py under pytest)
+load_env()
 
 from tradingagents.dataflows.reddit_downloader import RedditStockDownloader
 from tradingagents.dataflows.interface import get_reddit_company_news, get_reddit_global_news
 from tradingagents.dataflows.config import DATA_DIR
 
+# App's default data directory for downloaded Reddit posts
+REDDIT_DATA_DIR = os.path.join(DATA_DIR, "reddit_data")
 
+# One clock reading shared by the mock posts so their timestamps are consistent
+NOW = datetime.now()
+NOW_TS = int(NOW.timestamp())
+DAY = 24 * 60 * 60
+
+# Tests against the live Reddit API are skipped without credentials
+HAS_CREDS = bool(os.getenv("REDDIT_CLIENT_ID") and os.getenv("REDDIT_CLIENT_SECRET"))
+requires_creds = pytest.mark.skipif(not HAS_CREDS, reason="Reddit API credentials not configured")
+
+def scan_jsonl(path):
+    """
+    Return the first record line and the line count of a JSONL file
+
+    The file is memory-mapped rather than read into a list of lines.
+    """
+    if os.path.getsize(path) == 0:  # mmap cannot map an empty file
+        return None, 0
+
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        first_end = mm.find(b"\n")
+        first_line = mm[:first_end] if first_end != -1 else mm[:]
+
+        n_lines = 0
+        pos = 0
+        while (pos := mm.find(b"\n", pos) + 1):
+            n_lines += 1
+        if mm[-1:] != b"\n":  # last record without a trailing newline
+            n_lines += 1
+
+    return first_line, n_lines
+
+
+def print_credentials_help():
+    """Explain how to configure Reddit API credentials"""
+    print("\n⚠️  Reddit API credentials not found in environment variables")
+    print("To run Reddit downloader tests with real API:")
+    print("1. Create a Reddit app at https://www.reddit.com/prefs/apps")
+    print("2. Add to .env file:")
+    print("   REDDIT_CLIENT_ID=your_client_id")
+    print("   REDDIT_CLIENT_SECRET=your_client_secret")
+
+
+@requires_creds
 def test_reddit_api_credentials():
     """Test that Reddit API credentials are configured"""
 
     client_id = os.getenv("REDDIT_CLIENT_ID", "")
     client_secret = os.getenv("REDDIT_CLIENT_SECRET", "")
 
-    if not client_id or not client_secret:
-        print("\n⚠️  Reddit API credentials not found in environment variables")
-        print("To run Reddit downloader tests with real API:")
-        print("1. Create a Reddit app at https://www.reddit.com/prefs/apps")
-        print("2. Add to .env file:")
-        print("   REDDIT_CLIENT_ID=your_client_id")
-        print("   REDDIT_CLIENT_SECRET=your_client_secret")
-        raise Exception("Reddit API credentials not configured")
-
     assert client_id != "", "REDDIT_CLIENT_ID should not be empty"
     assert client_secret != "", "REDDIT_CLIENT_SECRET should not be empty"
     print("✅ Reddit API credentials found")
 
 
+@pytest.mark.network
+@requires_creds
 def test_reddit_connection():
     """Test connection to Reddit API"""
 
@@ -53,9 +89,6 @@ def test_reddit_connection():
     reddit_username = os.getenv("REDDIT_USERNAME", "YourUsername")
     reddit_user_agent = os.getenv("REDDIT_USER_AGENT", f"TestAgent/1.0 by u/{reddit_username}")
 
-    if not client_id or not client_secret:
-        raise Exception("Reddit API credentials not configured")
-
     try:
         downloader = RedditStockDownloader(
             client_id=client_id,
@@ -86,6 +119,8 @@ def test_reddit_connection():
             raise Exception(f"Failed to connect to Reddit API: {e}")
 
 
+@pytest.mark.network
+@requires_creds
 def test_download_sample_data():
     """Test downloading a small sample of Reddit data"""
 
@@ -94,11 +129,7 @@ def test_download_sample_data():
     reddit_username = os.getenv("REDDIT_USERNAME", "YourUsername")
     reddit_user_agent = os.getenv("REDDIT_USER_AGENT", f"TestAgent/1.0 by u/{reddit_username}")
 
-    if not client_id or not client_secret:
-        raise Exception("Reddit API credentials not configured")
-
-    # Use app's default data directory
-    output_dir = os.path.join(DATA_DIR, "reddit_data")
+    output_dir = REDDIT_DATA_DIR
 
     try:
         downloader = RedditStockDownloader(
@@ -130,23 +161,22 @@ def test_download_sample_data():
         company_news_dir = os.path.join(output_dir, 'company_news')
         assert os.path.exists(company_news_dir), "Company news directory not created"
 
-        jsonl_files = [f for f in os.listdir(company_news_dir) if f.endswith('.jsonl')]
+        with os.scandir(company_news_dir) as entries:
+            jsonl_files = [entry for entry in entries if entry.name.endswith('.jsonl')]
         assert len(jsonl_files) > 0, "No JSONL files created"
 
         print(f"✅ Created {len(jsonl_files)} JSONL files")
 
         # Verify file content
         for jsonl_file in jsonl_files:
-            file_path = os.path.join(company_news_dir, jsonl_file)
-            with open(file_path, 'r') as f:
-                lines = f.readlines()
-                if lines:
-                    # Check first line is valid JSON
-                    first_post = json.loads(lines[0])
-                    assert 'created_utc' in first_post
-                    assert 'title' in first_post
-                    assert 'id' in first_post
-                    print(f"  ✓ {jsonl_file}: {len(lines)} posts")
+            first_line, n_lines = scan_jsonl(jsonl_file.path)
+            if n_lines:
+                # Check first line is valid JSON
+                first_post = loads_json(first_line)
+                assert 'created_utc' in first_post
+                assert 'title' in first_post
+                assert 'id' in first_post
+                print(f"  ✓ {jsonl_file.name}: {n_lines} posts")
 
         print(f"\n📁 Data saved to: {output_dir}")
 
@@ -158,13 +188,11 @@ def test_data_format_compatibility():
     """Test that downloaded data format is compatible with existing functions"""
 
     # Create mock data in the expected format
-    temp_dir = tempfile.mkdtemp()
-
-    try:
+    with tempfile.TemporaryDirectory() as temp_dir:
         # Create mock Reddit data
         mock_posts = [
             {
-                "created_utc": int((datetime.now() - timedelta(days=1)).timestamp()),
+                "created_utc": NOW_TS - DAY,
                 "id": "test123",
                 "title": "AAPL to the moon! 🚀",
                 "selftext": "Apple just announced amazing earnings",
@@ -173,7 +201,7 @@ def test_data_format_compatibility():
                 "url": "https://reddit.com/r/stocks/test123"
             },
             {
-                "created_utc": int((datetime.now() - timedelta(days=2)).timestamp()),
+                "created_utc": NOW_TS - 2 * DAY,
                 "id": "test456",
                 "title": "Why AAPL is overvalued",
                 "selftext": "Here's my analysis on Apple stock...",
@@ -188,26 +216,39 @@ def test_data_format_compatibility():
         os.makedirs(company_news_dir, exist_ok=True)
 
         mock_file = os.path.join(company_news_dir, 'stocks.jsonl')
-        with open(mock_file, 'w') as f:
-            for post in mock_posts:
-                f.write(json.dumps(post) + '\n')
+        with open(mock_file, 'wb') as f:
+            f.write(b"".join(dumps_json_line(post) for post in mock_posts))
 
         # Test that the interface functions can read this data
         # Note: We'd need to mock the DATA_DIR to point to temp_dir
         # This is more of a format validation than full integration test
 
         # Verify the file format
-        with open(mock_file, 'r') as f:
-            for line in f:
-                post = json.loads(line)
-                assert isinstance(post['created_utc'], int)
-                assert isinstance(post['title'], str)
-                assert isinstance(post['ups'], int)
+        with open(mock_file, 'rb') as f:
+            posts = [loads_json(line) for line in f.read().split(b"\n") if line]
+
+        assert len(posts) == len(mock_posts)
+        for post in posts:
+            assert isinstance(post['created_utc'], int)
+            assert isinstance(post['title'], str)
+            assert isinstance(post['ups'], int)
 
         print("✅ Data format is compatible with expected structure")
 
-    finally:
-        shutil.rmtree(temp_dir)
+
+
+def build_submission(i, title, selftext="", author="test_user", ups=500, num_comments=100):
+    """Plain stand-in for a praw Submission; only attribute reads are needed"""
+    return SimpleNamespace(
+        created_utc=NOW_TS - i * 60,
+        id=f"mock{i}",
+        title=title,
+        selftext=selftext,
+        ups=ups,
+        num_comments=num_comments,
+        url=f"https://reddit.com/mock{i}",
+        author=author,
+    )
 
 
 def test_mock_downloader():
@@ -222,21 +263,15 @@ def test_mock_downloader():
         mock_subreddit = Mock()
         mock_reddit_instance.subreddit.return_value = mock_subreddit
 
-        # Mock submissions
-        mock_submission = Mock()
-        mock_submission.created_utc = int(datetime.now().timestamp())
-        mock_submission.id = "mock123"
-        mock_submission.title = "TSLA Discussion Thread"
-        mock_submission.selftext = "What do you think about Tesla?"
-        mock_submission.ups = 500
-        mock_submission.num_comments = 100
-        mock_submission.url = "https://reddit.com/mock"
-        mock_submission.author = Mock()
-        mock_submission.author.__str__ = Mock(return_value="test_user")
-
-        mock_subreddit.hot.return_value = [mock_submission]
-        mock_subreddit.new.return_value = [mock_submission]
-        mock_subreddit.top.return_value = [mock_submission]
+        # One batch of distinct submissions, served by a single listing
+        submissions = [
+            build_submission(i, f"TSLA Discussion Thread {i}", "What do you think about Tesla?")
+            for i in range(5)
+        ]
+        mock_subreddit.hot.return_value = submissions
+        mock_subreddit.new.return_value = []
+        # top overlaps hot in practice; repeats must not produce duplicates
+        mock_subreddit.top.return_value = submissions[:2]
 
         # Test downloader with mock
         downloader = RedditStockDownloader(
@@ -245,7 +280,7 @@ def test_mock_downloader():
             user_agent="MockAgent/1.0"
         )
 
-        end_date = datetime.now()
+        end_date = NOW
         start_date = end_date - timedelta(days=1)
 
         posts = downloader.search_posts_by_date_range(
@@ -255,11 +290,92 @@ def test_mock_downloader():
             query="TSLA"
         )
 
-        assert len(posts) > 0
-        assert posts[0]['title'] == "TSLA Discussion Thread"
+        assert [post['id'] for post in posts] == [f"mock{i}" for i in range(5)]
+        assert posts[0]['title'] == "TSLA Discussion Thread 0"
+        mock_subreddit.hot.assert_called_once()
         print("✅ Mock downloader works correctly")
 
 
+def test_mock_company_news_single_pass():
+    """All tickers are matched against one listing pass per subreddit"""
+
+    with patch('praw.Reddit') as mock_reddit, \
+            patch('tradingagents.dataflows.reddit_downloader.time.sleep'):
+        mock_subreddit = Mock()
+        mock_reddit.return_value.subreddit.return_value = mock_subreddit
+
+        titles = ["GOOGL earnings beat", "Nvidia guidance raised", "Weekly discussion"]
+        # Deleted accounts come back from praw with author=None
+        submissions = [
+            build_submission(i, title, author=None, ups=10, num_comments=1)
+            for i, title in enumerate(titles)
+        ]
+
+        mock_subreddit.hot.return_value = submissions
+        mock_subreddit.new.return_value = []
+        mock_subreddit.top.return_value = []
+
+        downloader = RedditStockDownloader(
+            client_id="mock_id",
+            client_secret="mock_secret",
+            user_agent="MockAgent/1.0"
+        )
+
+        posts = downloader.download_company_news(
+            tickers=["GOOGL", "NVDA"],
+            start_date=NOW - timedelta(days=1),
+            end_date=NOW,
+            subreddits=["stocks"],
+            posts_per_ticker=10
+        )
+
+        # NVDA matches through its company name
+        assert [post['id'] for post in posts["stocks"]] == ["mock0", "mock1"]
+        assert all(post['author'] == "[deleted]" for post in posts["stocks"])
+        mock_subreddit.hot.assert_called_once()
+        print("✅ Company news uses one listing pass per subreddit")
+
+
+def test_mock_global_news_parallel_paced():
+    """Subreddits are scanned concurrently while API requests stay paced"""
+
+    subreddits = ["worldnews", "news", "economics", "finance"]
+
+    with patch('praw.Reddit') as mock_reddit, \
+            patch('tradingagents.dataflows.reddit_downloader.time.sleep') as mock_sleep:
+        mock_subreddit = Mock()
+        mock_reddit.return_value.subreddit.return_value = mock_subreddit
+
+        mock_subreddit.hot.return_value = [build_submission(0, "Fed rate decision")]
+        mock_subreddit.new.return_value = []
+        mock_subreddit.top.return_value = []
+
+        downloader = RedditStockDownloader(
+            client_id="mock_id",
+            client_secret="mock_secret",
+            user_agent="MockAgent/1.0",
+            max_workers=4,
+            requests_per_minute=60
+        )
+
+        posts = downloader.download_global_news(
+            start_date=NOW - timedelta(days=1),
+            end_date=NOW,
+            subreddits=subreddits,
+            keywords=["Fed rate"]
+        )
+
+    assert all([post['id'] for post in posts[sub]] == ["mock0"] for sub in subreddits)
+
+    # 12 listing requests one second apart: all but the first wait their turn
+    waits = sorted(call.args[0] for call in mock_sleep.call_args_list)
+    assert len(waits) == 11
+    assert waits[-1] == pytest.approx(11, abs=0.5)
+    print("✅ Global news scans subreddits concurrently with paced requests")
+
+
+@pytest.mark.network
+@requires_creds
 def test_integration_small_sample():
     """Integration test with small real data sample"""
 
@@ -268,15 +384,11 @@ def test_integration_small_sample():
     reddit_username = os.getenv("REDDIT_USERNAME", "YourUsername")
     user_agent = os.getenv("REDDIT_USER_AGENT", f"TestAgent/1.0 by u/{reddit_username}")
 
-    if not client_id or not client_secret:
-        raise Exception("Reddit API credentials not configured")
-
     print("\n" + "="*60)
     print("Reddit Downloader Integration Test")
     print("="*60)
 
-    # Use app's default data directory
-    output_dir = os.path.join(DATA_DIR, "reddit_data")
+    output_dir = REDDIT_DATA_DIR
 
     try:
         # Initialize downloader
@@ -347,33 +459,38 @@ def main():
     print("# Reddit Downloader Test Suite")
     print("#"*60)
 
-    # Run tests
+    # Run tests: (name, function, needs Reddit credentials)
     tests = [
-        ("API Credentials", test_reddit_api_credentials),
-        ("Reddit Connection", test_reddit_connection),
-        ("Data Format", test_data_format_compatibility),
-        ("Mock Downloader", test_mock_downloader),
-        ("Sample Download", test_download_sample_data),
-        ("Integration Test", test_integration_small_sample),
+        ("API Credentials", test_reddit_api_credentials, True),
+        ("Reddit Connection", test_reddit_connection, True),
+        ("Data Format", test_data_format_compatibility, False),
+        ("Mock Downloader", test_mock_downloader, False),
+        ("Mock Batched Company News", test_mock_company_news_single_pass, False),
+        ("Mock Parallel Global News", test_mock_global_news_parallel_paced, False),
+        ("Sample Download", test_download_sample_data, True),
+        ("Integration Test", test_integration_small_sample, True),
     ]
 
     passed = 0
     failed = 0
     skipped = 0
 
-    for test_name, test_func in tests:
+    if not HAS_CREDS:
+        print_credentials_help()
+
+    for test_name, test_func, needs_creds in tests:
         print(f"\n### Testing: {test_name}")
         print("-"*40)
+        if needs_creds and not HAS_CREDS:
+            print("⚠️  Skipped: Reddit API credentials not configured")
+            skipped += 1
+            continue
         try:
             test_func()
             passed += 1
         except Exception as e:
-            if "credentials not configured" in str(e).lower():
-                print(f"⚠️  Skipped: {e}")
-                skipped += 1
-            else:
-                print(f"❌ Failed: {e}")
-                failed += 1
+            print(f"❌ Failed: {e}")
+            failed += 1
 
     # Summary
     print("\n" + "="*60)
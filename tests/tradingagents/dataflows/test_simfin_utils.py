@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test suite for the SimFin statement lookups in simfin_utils.py
+"""
+
+import os
+import sys
+import tempfile
+
+import pytest
+
+from tradingagents.dataflows import simfin_utils
+
+SAMPLE_CSV = """Ticker;SimFinId;Currency;Fiscal Year;Report Date;Publish Date;Total Assets
+AAPL;111052;USD;2022;2022-09-30;2022-10-28;352755000000
+AAPL;111052;USD;2023;2023-09-30;2023-11-03;352583000000
+MSFT;59265;USD;2023;2023-06-30;2023-07-27;411976000000
+"""
+
+
+def _write_sample(data_dir):
+    csv_path = os.path.join(
+        data_dir, "fundamental_data", "simfin_data_all", "balance_sheet",
+        "companies", "us", "us-balance-annual.csv",
+    )
+    os.makedirs(os.path.dirname(csv_path))
+    with open(csv_path, "w") as f:
+        f.write(SAMPLE_CSV)
+
+
+def _lookup(monkeypatch, use_parquet, curr_date, ticker="AAPL"):
+    monkeypatch.setattr(simfin_utils, "pq", simfin_utils.pq if use_parquet else None)
+    simfin_utils._load_simfin_ticker.cache_clear()
+    return simfin_utils.get_latest_simfin_statement("balance_sheet", "annual", ticker, curr_date)
+
+
+@pytest.mark.parametrize("use_parquet", [
+    False,
+    pytest.param(True, marks=pytest.mark.skipif(simfin_utils.pq is None, reason="pyarrow not installed")),
+])
+def test_latest_statement_is_point_in_time(monkeypatch, use_parquet):
+    """Only statements published on or before curr_date are considered"""
+
+    with tempfile.TemporaryDirectory() as tmp:
+        _write_sample(tmp)
+        monkeypatch.setattr(simfin_utils, "get_config", lambda: {"data_dir": tmp})
+
+        latest = _lookup(monkeypatch, use_parquet, "2023-12-01")
+        assert latest["Fiscal Year"] == 2023
+        assert "SimFinId" not in latest.index
+
+        earlier = _lookup(monkeypatch, use_parquet, "2023-06-01")
+        assert earlier["Fiscal Year"] == 2022
+
+        assert _lookup(monkeypatch, use_parquet, "2022-01-01") is None
+        assert _lookup(monkeypatch, use_parquet, "2023-12-01", ticker="TSLA") is None
+
+
+@pytest.mark.skipif(simfin_utils.pq is None, reason="pyarrow not installed")
+def test_parquet_matches_csv(monkeypatch):
+    """The parquet copy returns the same row as parsing the CSV"""
+
+    with tempfile.TemporaryDirectory() as tmp:
+        _write_sample(tmp)
+        monkeypatch.setattr(simfin_utils, "get_config", lambda: {"data_dir": tmp})
+
+        from_parquet = _lookup(monkeypatch, True, "2023-12-01")
+        from_csv = _lookup(monkeypatch, False, "2023-12-01")
+
+    assert from_parquet.to_dict() == from_csv.to_dict()
+
+
+@pytest.mark.parametrize("use_parquet", [
+    False,
+    pytest.param(True, marks=pytest.mark.skipif(simfin_utils.pq is None, reason="pyarrow not installed")),
+])
+def test_columns_limit_loaded_fields(monkeypatch, use_parquet):
+    """Only the requested fields (plus the lookup keys) are returned"""
+
+    with tempfile.TemporaryDirectory() as tmp:
+        _write_sample(tmp)
+        monkeypatch.setattr(simfin_utils, "get_config", lambda: {"data_dir": tmp})
+        monkeypatch.setattr(simfin_utils, "pq", simfin_utils.pq if use_parquet else None)
+        simfin_utils._load_simfin_ticker.cache_clear()
+
+        latest = simfin_utils.get_latest_simfin_statement(
+            "balance_sheet", "annual", "AAPL", "2023-12-01", columns=["Total Assets"]
+        )
+
+    assert list(latest.index) == ["Ticker", "Publish Date", "Total Assets"]
+    assert latest["Total Assets"] == 352583000000
+
+
+def test_ticker_rows_are_cached(monkeypatch):
+    """Repeated lookups for a ticker parse the source file once"""
+
+    with tempfile.TemporaryDirectory() as tmp:
+        _write_sample(tmp)
+        monkeypatch.setattr(simfin_utils, "get_config", lambda: {"data_dir": tmp})
+        monkeypatch.setattr(simfin_utils, "pq", None)
+        simfin_utils._load_simfin_ticker.cache_clear()
+        simfin_utils._load_simfin_full.cache_clear()
+
+        reads = []
+        read_csv = simfin_utils._read_simfin_csv
+        monkeypatch.setattr(simfin_utils, "_read_simfin_csv", lambda path: reads.append(path) or read_csv(path))
+
+        for curr_date in ("2023-06-01", "2023-12-01", "2024-01-01"):
+            simfin_utils.get_latest_simfin_statement("balance_sheet", "annual", "AAPL", curr_date)
+        simfin_utils.get_latest_simfin_statement("balance_sheet", "annual", "MSFT", "2024-01-01")
+
+    assert len(reads) == 1
+
+
+@pytest.mark.skipif(simfin_utils.pq is None, reason="pyarrow not installed")
+def test_unwritable_data_dir_falls_back_to_csv(monkeypatch):
+    """A failed parquet write leaves lookups on the CSV"""
+
+    def read_only(*args, **kwargs):
+        raise PermissionError("read-only file system")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        _write_sample(tmp)
+        monkeypatch.setattr(simfin_utils, "get_config", lambda: {"data_dir": tmp})
+        monkeypatch.setattr(simfin_utils.pd.DataFrame, "to_parquet", read_only)
+
+        assert simfin_utils.ensure_simfin_parquet("balance_sheet", "annual") is None
+        latest = _lookup(monkeypatch, True, "2023-12-01")
+        leftovers = os.listdir(os.path.dirname(simfin_utils._simfin_csv_path("balance_sheet", "annual")))
+
+    assert latest["Fiscal Year"] == 2023
+    assert leftovers == ["us-balance-annual.csv"]
+
+
+def test_numeric_columns_are_narrowed_losslessly():
+    """Small integers shrink while statement values keep every digit"""
+
+    with tempfile.TemporaryDirectory() as tmp:
+        _write_sample(tmp)
+        with open(os.path.join(tmp, "sample.csv"), "w") as f:
+            f.write(SAMPLE_CSV.replace("352583000000", "352583000000.5"))
+        df = simfin_utils._read_simfin_csv(
+            os.path.join(tmp, "fundamental_data", "simfin_data_all", "balance_sheet",
+                         "companies", "us", "us-balance-annual.csv")
+        )
+        lossy = simfin_utils._read_simfin_csv(os.path.join(tmp, "sample.csv"))
+
+    assert df["Fiscal Year"].dtype.itemsize < 8
+    assert df["Total Assets"].iloc[1] == 352583000000
+    assert lossy["Total Assets"].dtype == "float64"
+    assert lossy["Total Assets"].iloc[1] == 352583000000.5
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
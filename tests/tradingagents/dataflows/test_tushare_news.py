@@ -4,18 +4,21 @@
 Test file for get_news and get_stock_info methods in tushare_utils.py
 """
 
-import sys
 import os
-from dotenv import load_dotenv
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
 from datetime import datetime
 
-# Add project root to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+from tradingagents.dataflows.utils import load_env
 
-# Load environment variables
-load_dotenv()
+# Load environment variables (already done by conftest.py under pytest)
+load_env()
 
-from tradingagents.dataflows.tushare_utils import TushareUtils
+from tradingagents.dataflows.tushare_utils import get_tushare_utils
+
+# Concurrent Tushare requests; the allowed rate depends on the account tier
+TUSHARE_CONCURRENCY = int(os.getenv("TUSHARE_CONCURRENCY", "4"))
 
 
 def print_section_header(title):
@@ -30,8 +33,8 @@ def test_get_news():
 
     print_section_header("TESTING GET_NEWS METHOD (ALL NEWS COLLECTION)")
 
-    # Initialize TushareUtils
-    tushare_utils = TushareUtils()
+    # Shared TushareUtils instance (API client and stock_basic cache)
+    tushare_utils = get_tushare_utils()
 
     # Test parameters
     test_date = "2025-09-19"
@@ -64,14 +67,13 @@ def test_get_news():
 
             # Show sample news items
             print("\n### Sample News Items (First 3) ###")
-            for idx, row in news_df.head(3).iterrows():
-                print(f"\nItem {idx + 1}:")
-                print(f"  Type: {row['type']}")
-                print(f"  Source: {row['source']}")
-                print(f"  Date: {row['datetime']}")
-                print(f"  Title: {row['title'][:100]}..." if len(row['title']) > 100 else f"  Title: {row['title']}")
-                if row.get('ts_code'):
-                    print(f"  Stock Code: {row['ts_code']}")
+            sample = news_df.head(3).copy()
+            titles = sample['title'].astype(str)
+            sample['title'] = titles.str.slice(0, 100).where(
+                titles.str.len() <= 100, titles.str.slice(0, 100) + "..."
+            )
+            columns = [c for c in ['type', 'source', 'datetime', 'title', 'ts_code'] if c in sample]
+            print(sample[columns].to_string())
         else:
             print("No news found for the specified period.")
 
@@ -84,8 +86,8 @@ def test_get_stock_info():
 
     print_section_header("TESTING GET_STOCK_INFO METHOD (FILTERED NEWS)")
 
-    # Initialize TushareUtils
-    tushare_utils = TushareUtils()
+    # Shared TushareUtils instance (API client and stock_basic cache)
+    tushare_utils = get_tushare_utils()
 
     # Test parameters
     test_stocks = [
@@ -97,18 +99,34 @@ def test_get_stock_info():
     interval = 2  # Reduced to avoid timeout
     max_limit = 1000
 
-    for symbol in test_stocks:
+    # Fetch every stock concurrently; each call blocks on Tushare round-trips
+    async def fetch_all():
+        semaphore = asyncio.Semaphore(TUSHARE_CONCURRENCY)
+
+        async def fetch_one(symbol):
+            async with semaphore:
+                return await asyncio.to_thread(
+                    tushare_utils.get_stock_info,
+                    symbol=symbol,
+                    date=test_date,
+                    interval=interval,
+                    max_limit=max_limit
+                )
+
+        return await asyncio.gather(
+            *[fetch_one(symbol) for symbol in test_stocks],
+            return_exceptions=True
+        )
+
+    results = asyncio.run(fetch_all())
+
+    for symbol, stock_info in zip(test_stocks, results):
         print(f"\n### Testing Stock: {symbol} ###")
         print("-" * 40)
 
         try:
-            # Get stock information
-            stock_info = tushare_utils.get_stock_info(
-                symbol=symbol,
-                date=test_date,
-                interval=interval,
-                max_limit=max_limit
-            )
+            if isinstance(stock_info, Exception):
+                raise stock_info
 
             if stock_info:
                 print(f"Total items found: {len(stock_info)}")
@@ -139,8 +157,8 @@ def test_news_filtering():
 
     print_section_header("TESTING NEWS FILTERING LOGIC")
 
-    # Initialize TushareUtils
-    tushare_utils = TushareUtils()
+    # Shared TushareUtils instance (API client and stock_basic cache)
+    tushare_utils = get_tushare_utils()
 
     # Test specific stock
     symbol = "000001.SZ"  # Ping An Bank
@@ -155,7 +173,7 @@ def test_news_filtering():
         all_news_df = tushare_utils.get_news(date=test_date, interval=interval)
         print(f"Total news items (unfiltered): {len(all_news_df)}")
 
-        # Get filtered stock info
+        # Get filtered stock info (reuses the news window fetched above)
         stock_info = tushare_utils.get_stock_info(
             symbol=symbol,
             date=test_date,
@@ -169,15 +187,10 @@ def test_news_filtering():
 
         # Show filtering statistics
         if news_items:
-            news_types = {}
-            for item in news_items:
-                news_type = item['type']
-                if news_type not in news_types:
-                    news_types[news_type] = 0
-                news_types[news_type] += 1
+            news_types = pd.Series([item['type'] for item in news_items], name='type')
 
             print("\n### Filtered News by Type ###")
-            for news_type, count in news_types.items():
+            for news_type, count in news_types.value_counts().items():
                 print(f"  {news_type}: {count}")
 
     except Exception as e:
@@ -189,8 +202,8 @@ def test_different_intervals():
 
     print_section_header("TESTING DIFFERENT INTERVAL VALUES")
 
-    # Initialize TushareUtils
-    tushare_utils = TushareUtils()
+    # Shared TushareUtils instance (API client and stock_basic cache)
+    tushare_utils = get_tushare_utils()
 
     test_date = "2025-09-19"
     intervals = [30]
@@ -198,24 +211,32 @@ def test_different_intervals():
     print(f"\nTesting news collection with different intervals")
     print("-" * 40)
 
-    for interval in intervals:
-        try:
-            news_df = tushare_utils.get_news(
-                date=test_date,
-                interval=interval
-            )
+    def fetch(interval):
+        return tushare_utils.get_news(date=test_date, interval=interval)
 
-            print(f"\nInterval: {interval} days")
-            print(f"  Total news items: {len(news_df)}")
+    # Prefetch the next interval while the current one is being summarized
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        next_future = executor.submit(fetch, intervals[0]) if intervals else None
 
-            if not news_df.empty:
-                # Show date range
-                min_date = news_df['datetime'].min()
-                max_date = news_df['datetime'].max()
-                print(f"  Date range: {min_date} to {max_date}")
+        for i, interval in enumerate(intervals):
+            future = next_future
+            if i + 1 < len(intervals):
+                next_future = executor.submit(fetch, intervals[i + 1])
 
-        except Exception as e:
-            print(f"Error with interval {interval}: {e}")
+            try:
+                news_df = future.result()
+
+                print(f"\nInterval: {interval} days")
+                print(f"  Total news items: {len(news_df)}")
+
+                if not news_df.empty:
+                    # Show date range
+                    min_date = news_df['datetime'].min()
+                    max_date = news_df['datetime'].max()
+                    print(f"  Date range: {min_date} to {max_date}")
+
+            except Exception as e:
+                print(f"Error with interval {interval}: {e}")
 
 
 def main():
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test suite for the resumable progress file in TushareFetcher
+"""
+
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from tushare_fetch.fetcher import TushareFetcher, pa_dataset
+
+
+def test_progress_round_trip():
+    """Appended entries load back with the latest end_date per stock"""
+
+    with tempfile.TemporaryDirectory() as tmp:
+        progress_file = Path(tmp) / "fetch_progress.txt"
+        # Older files hold bare ts_codes
+        progress_file.write_text("600000.SH\n")
+
+        fetcher = TushareFetcher.__new__(TushareFetcher)
+        fetcher._append_progress(progress_file, "000001.SZ", "20250101", 120)
+        fetcher._append_progress(progress_file, "000001.SZ", "20250301", 160)
+
+        progress = fetcher._load_progress(progress_file)
+
+    assert progress == {"600000.SH": "", "000001.SZ": "20250301"}
+
+
+def test_is_up_to_date():
+    """Only stocks fetched through the requested end_date are skipped"""
+
+    assert TushareFetcher._is_up_to_date("20250301", "20250301")
+    assert TushareFetcher._is_up_to_date("", "20250301")
+    assert not TushareFetcher._is_up_to_date("20250101", "20250301")
+    assert not TushareFetcher._is_up_to_date(None, "20250301")
+
+
+class _FailingPro:
+    """Stand-in Tushare client whose daily endpoint fails for one stock"""
+
+    def daily(self, ts_code, **kwargs):
+        if ts_code == "000002.SZ":
+            raise RuntimeError("connection reset")
+        if ts_code == "000003.SZ":
+            return pd.DataFrame(columns=["ts_code", "trade_date", "close"])
+        return pd.DataFrame({"ts_code": [ts_code], "trade_date": ["20250301"], "close": [10.0]})
+
+
+def test_failed_fetch_is_not_recorded():
+    """Errors are retried on resume while stocks without data are recorded"""
+
+    with tempfile.TemporaryDirectory() as tmp:
+        fetcher = TushareFetcher.__new__(TushareFetcher)
+        fetcher.data_dir = Path(tmp)
+        fetcher.pro = _FailingPro()
+
+        fetcher.fetch_all_daily_data(
+            stock_list=["000001.SZ", "000002.SZ", "000003.SZ"],
+            end_date="20250301",
+            delay=0,
+            workers=2,
+        )
+        progress = fetcher._load_progress(Path(tmp) / "fetch_progress.txt")
+
+    assert progress == {"000001.SZ": "20250301", "000003.SZ": "20250301"}
+
+
+def test_save_error_stops_pending_fetches():
+    """A fatal save error is raised without fetching the rest of the queue"""
+
+    fetched = []
+
+    class _CountingPro(_FailingPro):
+        def daily(self, ts_code, **kwargs):
+            fetched.append(ts_code)
+            return super().daily("000001.SZ", **kwargs)
+
+    def disk_full(ts_code, df):
+        raise OSError(28, "No space left on device")
+
+    stock_list = [f"{i:06d}.SZ" for i in range(100)]
+    with tempfile.TemporaryDirectory() as tmp:
+        fetcher = TushareFetcher.__new__(TushareFetcher)
+        fetcher.data_dir = Path(tmp)
+        fetcher.pro = _CountingPro()
+        fetcher._save_daily_data = disk_full
+
+        with pytest.raises(OSError):
+            fetcher.fetch_all_daily_data(stock_list=stock_list, end_date="20250301", delay=0, workers=2)
+
+    assert len(fetched) < len(stock_list)
+
+
+@pytest.mark.skipif(pa_dataset is None, reason="pyarrow not installed")
+def test_merge_includes_legacy_csv():
+    """CSV files written without pyarrow are merged with the partitions"""
+
+    with tempfile.TemporaryDirectory() as tmp:
+        fetcher = TushareFetcher.__new__(TushareFetcher)
+        fetcher.data_dir = Path(tmp)
+
+        legacy_dir = Path(tmp) / "daily"
+        legacy_dir.mkdir()
+        pd.DataFrame({"ts_code": ["000001.SZ"], "trade_date": ["20250228"], "close": [9.5]}).to_csv(
+            legacy_dir / "000001.SZ.csv", index=False
+        )
+        fetcher._save_daily_data(
+            "000002.SZ",
+            pd.DataFrame({"ts_code": ["000002.SZ"], "trade_date": ["20250301"], "close": [10.0]}),
+        )
+
+        fetcher.merge_daily_data("merged.csv")
+        merged = pd.read_csv(Path(tmp) / "merged.csv", dtype={"trade_date": str})
+
+    assert sorted(merged["ts_code"]) == ["000001.SZ", "000002.SZ"]
+    assert sorted(merged["trade_date"]) == ["20250228", "20250301"]
+
+
+if __name__ == "__main__":
+    test_progress_round_trip()
+    test_is_up_to_date()
+    test_failed_fetch_is_not_recorded()
+    test_save_error_stops_pending_fetches()
+    if pa_dataset is not None:
+        test_merge_includes_legacy_csv()
+    print("✅ fetcher progress tests passed")
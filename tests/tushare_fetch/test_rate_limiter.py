@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test suite for the adaptive Tushare rate limiter in rate_limiter.py
+"""
+
+import time
+
+from tushare_fetch.rate_limiter import AdaptiveRateLimiter, is_rate_limit_error
+
+
+def test_is_rate_limit_error():
+    """Tushare quota messages are recognised, other errors are not"""
+
+    assert is_rate_limit_error(Exception("抱歉，您每分钟最多访问该接口500次"))
+    assert is_rate_limit_error(Exception("HTTP 429 Too Many Requests"))
+    assert not is_rate_limit_error(Exception("invalid ts_code"))
+
+
+def test_success_shrinks_delay_to_minimum():
+    """Clean calls decrease the delay multiplicatively, bounded below"""
+
+    limiter = AdaptiveRateLimiter(initial_delay=0.2, min_delay=0.1, decrease_factor=0.5)
+
+    limiter.on_success()
+    assert abs(limiter.delay - 0.1) < 1e-9
+    limiter.on_success()
+    assert abs(limiter.delay - 0.1) < 1e-9
+
+
+def test_rate_limit_grows_delay_and_pauses():
+    """A rate-limit error adds to the delay and holds the next call"""
+
+    limiter = AdaptiveRateLimiter(
+        initial_delay=0.1, max_delay=0.25, increase_step=0.1, backoff_base=0.05
+    )
+
+    backoff = limiter.on_rate_limit()
+    assert abs(limiter.delay - 0.2) < 1e-9
+    limiter.on_rate_limit()
+    assert abs(limiter.delay - 0.25) < 1e-9
+    assert limiter.rate_limited == 2
+
+    start = time.monotonic()
+    limiter.wait()
+    assert time.monotonic() - start >= backoff * 0.5
+
+
+def test_wait_spaces_calls():
+    """Consecutive calls are at least one delay apart"""
+
+    limiter = AdaptiveRateLimiter(initial_delay=0.05, min_delay=0.05)
+
+    start = time.monotonic()
+    for _ in range(3):
+        limiter.wait()
+    assert time.monotonic() - start >= 0.09
+    assert limiter.calls == 3
+
+
+if __name__ == "__main__":
+    test_is_rate_limit_error()
+    test_success_shrinks_delay_to_minimum()
+    test_rate_limit_grows_delay_and_pauses()
+    test_wait_spaces_calls()
+    print("✅ rate_limiter tests passed")
@@ -2,20 +2,20 @@
 """
 CLI tool to fetch Tushare data for Chinese stock market.
 
+Requires the project to be installed (pip install -e .).
+
 Usage:
     python tools/fetch_tushare_data.py --token YOUR_TOKEN
     python tools/fetch_tushare_data.py --token YOUR_TOKEN --start-date 20200101
     python tools/fetch_tushare_data.py --token YOUR_TOKEN --stock-basic-only
+    python tools/fetch_tushare_data.py --token YOUR_TOKEN --no-merge
 """
 
 import argparse
 import sys
-from pathlib import Path
-
-# Add parent directory to path to import tushare_fetch module
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from tushare_fetch.fetcher import TushareFetcher
+from tushare_fetch.rate_limiter import AdaptiveRateLimiter
 
 
 def main():
@@ -74,7 +74,42 @@ def main():
         "--delay",
         type=float,
         default=0.2,
-        help="Delay between API calls in seconds (default: 0.2)"
+        help="Initial delay between API calls in seconds (default: 0.2)"
+    )
+
+    parser.add_argument(
+        "--min-delay",
+        type=float,
+        default=0.05,
+        help="Shortest delay the adaptive limiter speeds up to (default: 0.05)"
+    )
+
+    parser.add_argument(
+        "--max-delay",
+        type=float,
+        default=2.0,
+        help="Longest delay the adaptive limiter backs off to (default: 2.0)"
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Number of stocks fetched concurrently (default: 4)"
+    )
+
+    parser.add_argument(
+        "--force-refresh",
+        action="store_true",
+        help="Refetch stocks already recorded as completed in the progress file"
+    )
+
+    parser.add_argument(
+        "--merge",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Merge daily data into a single file after fetching "
+             "(default: ask when run interactively, skip otherwise)"
     )
 
     args = parser.parse_args()
@@ -108,20 +143,32 @@ def main():
     print(f"Start date: {args.start_date or 'from beginning'}")
     print(f"End date: {args.end_date or 'today'}")
     print(f"Batch size: {args.batch_size}")
-    print(f"API delay: {args.delay}s")
+    print(f"API delay: {args.delay}s (adaptive, {args.min_delay}-{args.max_delay}s)")
+    print(f"Workers: {args.workers}")
     print("=" * 60)
 
+    # Speeds up while calls succeed and backs off when Tushare rate-limits
+    rate_limiter = AdaptiveRateLimiter(
+        initial_delay=args.delay,
+        min_delay=args.min_delay,
+        max_delay=args.max_delay
+    )
+
     fetcher.fetch_all_daily_data(
         start_date=args.start_date,
         end_date=args.end_date,
         batch_size=args.batch_size,
-        delay=args.delay
+        rate_limiter=rate_limiter,
+        workers=args.workers,
+        force_refresh=args.force_refresh
     )
 
-    # Ask if user wants to merge
+    # Only prompt when someone is there to answer (not under cron/CI)
     print("\n" + "=" * 60)
-    response = input("Merge all daily data into a single file? (y/n): ")
-    if response.lower() == 'y':
+    do_merge = args.merge
+    if do_merge is None:
+        do_merge = sys.stdin.isatty() and input("Merge all daily data into a single file? (y/n): ").lower() == 'y'
+    if do_merge:
         fetcher.merge_daily_data()
 
     print("\nDone!")
@@ -1,5 +1,7 @@
+import functools
 import os
 import requests
+from requests.adapters import HTTPAdapter
 import pandas as pd
 import json
 from datetime import datetime
@@ -7,6 +9,14 @@ from io import StringIO
 
 API_BASE_URL = "https://www.alphavantage.co/query"
 
+@functools.lru_cache(maxsize=None)
+def _get_session() -> requests.Session:
+    """Shared Session so successive API calls reuse keep-alive connections."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32)
+    session.mount("https://", adapter)
+    return session
+
 def get_api_key() -> str:
     """Retrieve the API key for Alpha Vantage from environment variables."""
     api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
@@ -63,7 +73,7 @@ def _make_api_request(function_name: str, params: dict) -> dict | str:
         # Remove entitlement if it's None or empty
         api_params.pop("entitlement", None)
     
-    response = requests.get(API_BASE_URL, params=api_params)
+    response = _get_session().get(API_BASE_URL, params=api_params)
     response.raise_for_status()
 
     response_text = response.text
@@ -0,0 +1,170 @@
+# Disk-backed caches for expensive data and LLM calls
+
+import functools
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import time
+from contextlib import closing, contextmanager
+from typing import Any, Callable, Optional
+
+
+def make_cache_key(*parts, **kwargs) -> str:
+    """
+    Build a stable hash from the arguments of a cached call.
+
+    Args:
+        *parts: Positional values identifying the call
+        **kwargs: Keyword values identifying the call
+
+    Returns:
+        Hex digest usable as a cache key or file name
+    """
+    payload = json.dumps(
+        {"args": parts, "kwargs": kwargs},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@contextmanager
+def atomic_write_path(path: str):
+    """
+    Yield a unique temporary file next to path, moved over path on success.
+
+    The name comes from mkstemp, so threads of one process writing the same
+    path never share a temporary file; the rename is atomic, so readers see
+    either the old or the new file. The temporary file is removed on error.
+    """
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(
+        dir=directory, prefix=f"{os.path.basename(path)}.", suffix=".tmp"
+    )
+    os.close(fd)
+    try:
+        yield tmp_path
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+class ResponseCache:
+    """SQLite store of LLM response text keyed by the request payload."""
+
+    def __init__(self, path: str, ttl: Optional[float] = None):
+        """
+        Args:
+            path: SQLite database file
+            ttl: Seconds an entry stays valid; None keeps entries forever
+        """
+        self.path = path
+        self.ttl = ttl
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, created REAL NOT NULL, text TEXT NOT NULL)"
+            )
+
+    def _connect(self):
+        # A short-lived connection per call keeps the cache safe to share
+        # between threads and event loops
+        return sqlite3.connect(self.path, timeout=30)
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached text for key, or None on a miss or expired entry."""
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute(
+                "SELECT created, text FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+        if row is None:
+            return None
+        created, text = row
+        if self.ttl is not None and time.time() - created > self.ttl:
+            return None
+        return text
+
+    def set(self, key: str, text: str):
+        """Store text under key, replacing any previous entry."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, created, text) VALUES (?, ?, ?)",
+                (key, time.time(), text),
+            )
+
+
+class FileCache:
+    """Directory of JSON files, one per key, holding a timestamped payload."""
+
+    def __init__(self, directory: str, ttl: Optional[float] = None):
+        """
+        Args:
+            directory: Folder the cache files are written to
+            ttl: Seconds an entry stays valid; None keeps entries forever
+        """
+        self.directory = directory
+        self.ttl = ttl
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str):
+        """Return the cached payload for key, or None on a miss or expired entry."""
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if self.ttl is not None and time.time() - entry.get("timestamp", 0) > self.ttl:
+            return None
+        return entry.get("payload")
+
+    def set(self, key: str, payload):
+        """Store a JSON-serialisable payload under key, replacing any previous entry."""
+        with atomic_write_path(self._path(key)) as tmp_path:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"timestamp": time.time(), "payload": payload}, f, ensure_ascii=False)
+
+
+def disk_cached(
+    cache: FileCache, should_cache: Optional[Callable[[Any], bool]] = None
+) -> Callable:
+    """
+    Decorator that memoizes a function's JSON-serialisable result in a FileCache.
+
+    The key covers the function name and its arguments; None results and
+    raised exceptions are not cached.
+
+    Args:
+        cache: FileCache the results are stored in
+        should_cache: Predicate deciding whether a result is stored, e.g. to
+            skip error messages returned as strings
+
+    Returns:
+        Decorator wrapping the function
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = make_cache_key(func.__module__, func.__qualname__, *args, **kwargs)
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+
+            result = func(*args, **kwargs)
+            if result is not None and (should_cache is None or should_cache(result)):
+                cache.set(key, result)
+            return result
+
+        return wrapper
+
+    return decorator
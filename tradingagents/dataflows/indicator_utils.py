@@ -0,0 +1,62 @@
+# Technical indicator kernels over plain NumPy arrays
+
+import numpy as np
+from typing import Tuple
+
+# Numba is optional; without it the kernels run as ordinary Python loops
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def _ema(values, period):
+    alpha = 2.0 / (period + 1.0)
+    out = np.empty_like(values)
+    if values.shape[0] == 0:
+        return out
+    out[0] = values[0]
+    for i in range(1, values.shape[0]):
+        out[i] = alpha * values[i] + (1.0 - alpha) * out[i - 1]
+    return out
+
+
+def ema(values, period: int) -> np.ndarray:
+    """
+    Exponential moving average seeded with the first value.
+
+    Matches pandas ``Series.ewm(span=period, adjust=False).mean()``.
+
+    Args:
+        values: Price series in chronological order
+        period: EMA span
+
+    Returns:
+        float64 array of the same length as values
+    """
+    return _ema(np.ascontiguousarray(values, dtype=np.float64), period)
+
+
+def macd(
+    close, fast: int = 12, slow: int = 26, signal: int = 9
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    MACD line, signal line and histogram.
+
+    Args:
+        close: Close prices in chronological order
+        fast: Fast EMA span
+        slow: Slow EMA span
+        signal: Signal EMA span
+
+    Returns:
+        Tuple of (macd, signal, histogram) float64 arrays
+    """
+    close = np.ascontiguousarray(close, dtype=np.float64)
+    macd_line = _ema(close, fast) - _ema(close, slow)
+    signal_line = _ema(macd_line, signal)
+    return macd_line, signal_line, macd_line - signal_line
@@ -2,21 +2,83 @@ from typing import Annotated, Dict
 from .reddit_utils import fetch_top_from_category
 from .yfin_utils import *
 from .stockstats_utils import *
+from .stockstats_utils import BEST_IND_PARAMS, load_yfin_price_data
 from .googlenews_utils import *
 from .finnhub_utils import get_data_in_range
 from .tushare_utils import get_tushare_utils
-from dateutil.relativedelta import relativedelta
+from .simfin_utils import get_latest_simfin_statement
+from .y_finance import get_YFin_data_online as _get_YFin_data_online
+from .utils import parse_date
 from concurrent.futures import ThreadPoolExecutor
-from datetime import datetime
+from datetime import datetime, timedelta
+import asyncio
+import functools
+import itertools
 import json
 import os
 import pandas as pd
 from tqdm import tqdm
-import yfinance as yf
-from openai import OpenAI
 from .config import get_config, set_config, DATA_DIR
+from .cache_utils import FileCache, ResponseCache, make_cache_key
+from .rate_limit_utils import AsyncRateLimiter, call_with_rate_limit
+from .openai_utils import make_async_openai_client
+import time
 import traceback
 
+# Finnhub range lookups kept in memory, and how long (seconds) one stays valid
+FINNHUB_CACHE_SIZE = 512
+FINNHUB_CACHE_TTL = 3600
+# Output tokens allowed per news search; one request never asks for more than
+# the model cap, and a combined search would otherwise reserve that much TPM
+NEWS_SITE_MAX_OUTPUT_TOKENS = 10000
+NEWS_MAX_OUTPUT_TOKENS = 16000
+
+
+@functools.lru_cache(maxsize=FINNHUB_CACHE_SIZE)
+def _cached_data_in_range(ticker, before, curr_date, kind, ttl_bucket):
+    # ttl_bucket is part of the cache key so entries expire with the period
+    return get_data_in_range(ticker, before, curr_date, kind, DATA_DIR)
+
+
+def _finnhub_data_in_range(ticker, before, curr_date, kind):
+    """
+    get_data_in_range for DATA_DIR, memoized for FINNHUB_CACHE_TTL seconds.
+
+    The analysts query the same ticker and range several times per run;
+    only the first call reads and parses the JSON files. Callers must not
+    modify the result.
+    """
+    ttl_bucket = int(time.time() // FINNHUB_CACHE_TTL)
+    return _cached_data_in_range(ticker, before, curr_date, kind, ttl_bucket)
+
+
+def iter_finnhub_news(
+    ticker: Annotated[
+        str,
+        "Search query of a company's, e.g. 'AAPL, TSM, etc.",
+    ],
+    curr_date: Annotated[str, "Current date in yyyy-mm-dd format"],
+    look_back_days: Annotated[int, "how many days to look back"],
+):
+    """
+    Yield the get_finnhub_news report piece by piece: the header, then one
+    section per news item. Nothing is yielded when there is no news.
+    """
+
+    start_date = parse_date(curr_date)
+    before = start_date - timedelta(days=look_back_days)
+    before = before.strftime("%Y-%m-%d")
+
+    result = _finnhub_data_in_range(ticker, before, curr_date, "news_data")
+
+    if len(result) == 0:
+        return
+
+    yield f"## {ticker} News, from {before} to {curr_date}:\n"
+    for day, data in result.items():
+        for entry in data:
+            yield f"### {entry['headline']} ({day})\n{entry['summary']}\n\n"
+
 
 def get_finnhub_news(
     ticker: Annotated[
@@ -25,6 +87,7 @@ def get_finnhub_news(
     ],
     curr_date: Annotated[str, "Current date in yyyy-mm-dd format"],
     look_back_days: Annotated[int, "how many days to look back"],
+    max_sections: Annotated[int, "keep at most this many sections, header included"] = None,
 ):
     """
     Retrieve news about a company within a time frame
@@ -33,31 +96,28 @@ def get_finnhub_news(
         ticker (str): ticker for the company you are interested in
         start_date (str): Start date in yyyy-mm-dd format
         end_date (str): End date in yyyy-mm-dd format
+        max_sections (int): Truncate the report without formatting the rest; None keeps all
     Returns
         str: dataframe containing the news of the company in the time frame
 
     """
+    return "".join(itertools.islice(iter_finnhub_news(ticker, curr_date, look_back_days), max_sections))
 
-    start_date = datetime.strptime(curr_date, "%Y-%m-%d")
-    before = start_date - relativedelta(days=look_back_days)
-    before = before.strftime("%Y-%m-%d")
-
-    result = get_data_in_range(ticker, before, curr_date, "news_data", DATA_DIR)
-
-    if len(result) == 0:
-        return ""
 
-    combined_result = ""
-    for day, data in result.items():
-        if len(data) == 0:
-            continue
-        for entry in data:
-            current_news = (
-                "### " + entry["headline"] + f" ({day})" + "\n" + entry["summary"]
-            )
-            combined_result += current_news + "\n\n"
+def _unique_entries(data):
+    """
+    Yield the entries of a get_data_in_range result once each, in order.
 
-    return f"## {ticker} News, from {before} to {curr_date}:\n" + str(combined_result)
+    Finnhub repeats the same record on several days of a range; entries are
+    compared by content through a hashable key instead of a list scan.
+    """
+    seen = set()
+    for entries in data.values():
+        for entry in entries:
+            key = json.dumps(entry, sort_keys=True, default=str)
+            if key not in seen:
+                seen.add(key)
+                yield entry
 
 
 def get_finnhub_company_insider_sentiment(
@@ -77,22 +137,19 @@ def get_finnhub_company_insider_sentiment(
         str: a report of the sentiment in the past 15 days starting at curr_date
     """
 
-    date_obj = datetime.strptime(curr_date, "%Y-%m-%d")
-    before = date_obj - relativedelta(days=look_back_days)
+    date_obj = parse_date(curr_date)
+    before = date_obj - timedelta(days=look_back_days)
     before = before.strftime("%Y-%m-%d")
 
-    data = get_data_in_range(ticker, before, curr_date, "insider_senti", DATA_DIR)
+    data = _finnhub_data_in_range(ticker, before, curr_date, "insider_senti")
 
     if len(data) == 0:
         return ""
 
-    result_str = ""
-    seen_dicts = []
-    for date, senti_list in data.items():
-        for entry in senti_list:
-            if entry not in seen_dicts:
-                result_str += f"### {entry['year']}-{entry['month']}:\nChange: {entry['change']}\nMonthly Share Purchase Ratio: {entry['mspr']}\n\n"
-                seen_dicts.append(entry)
+    result_str = "".join(
+        f"### {entry['year']}-{entry['month']}:\nChange: {entry['change']}\nMonthly Share Purchase Ratio: {entry['mspr']}\n\n"
+        for entry in _unique_entries(data)
+    )
 
     return (
         f"## {ticker} Insider Sentiment Data for {before} to {curr_date}:\n"
@@ -118,23 +175,19 @@ def get_finnhub_company_insider_transactions(
         str: a report of the company's insider transaction/trading informtaion in the past 15 days
     """
 
-    date_obj = datetime.strptime(curr_date, "%Y-%m-%d")
-    before = date_obj - relativedelta(days=look_back_days)
+    date_obj = parse_date(curr_date)
+    before = date_obj - timedelta(days=look_back_days)
     before = before.strftime("%Y-%m-%d")
 
-    data = get_data_in_range(ticker, before, curr_date, "insider_trans", DATA_DIR)
+    data = _finnhub_data_in_range(ticker, before, curr_date, "insider_trans")
 
     if len(data) == 0:
         return ""
 
-    result_str = ""
-
-    seen_dicts = []
-    for date, senti_list in data.items():
-        for entry in senti_list:
-            if entry not in seen_dicts:
-                result_str += f"### Filing Date: {entry['filingDate']}, {entry['name']}:\nChange:{entry['change']}\nShares: {entry['share']}\nTransaction Price: {entry['transactionPrice']}\nTransaction Code: {entry['transactionCode']}\n\n"
-                seen_dicts.append(entry)
+    result_str = "".join(
+        f"### Filing Date: {entry['filingDate']}, {entry['name']}:\nChange:{entry['change']}\nShares: {entry['share']}\nTransaction Price: {entry['transactionPrice']}\nTransaction Code: {entry['transactionCode']}\n\n"
+        for entry in _unique_entries(data)
+    )
 
     return (
         f"## {ticker} insider transactions from {before} to {curr_date}:\n"
@@ -150,39 +203,15 @@ def get_simfin_balance_sheet(
         "reporting frequency of the company's financial history: annual / quarterly",
     ],
     curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+    columns: Annotated[list, "statement fields to include; None for all"] = None,
 ):
-    data_path = os.path.join(
-        DATA_DIR,
-        "fundamental_data",
-        "simfin_data_all",
-        "balance_sheet",
-        "companies",
-        "us",
-        f"us-balance-{freq}.csv",
-    )
-    df = pd.read_csv(data_path, sep=";")
-
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
-
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
-
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
+    latest_balance_sheet = get_latest_simfin_statement("balance_sheet", freq, ticker, curr_date, columns)
 
     # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
+    if latest_balance_sheet is None:
         print("No balance sheet available before the given current date.")
         return ""
 
-    # Get the most recent balance sheet by selecting the row with the latest Publish Date
-    latest_balance_sheet = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
-
-    # drop the SimFinID column
-    latest_balance_sheet = latest_balance_sheet.drop("SimFinId")
-
     return (
         f"## {freq} balance sheet for {ticker} released on {str(latest_balance_sheet['Publish Date'])[0:10]}: \n"
         + str(latest_balance_sheet)
@@ -197,39 +226,15 @@ def get_simfin_cashflow(
         "reporting frequency of the company's financial history: annual / quarterly",
     ],
     curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+    columns: Annotated[list, "statement fields to include; None for all"] = None,
 ):
-    data_path = os.path.join(
-        DATA_DIR,
-        "fundamental_data",
-        "simfin_data_all",
-        "cash_flow",
-        "companies",
-        "us",
-        f"us-cashflow-{freq}.csv",
-    )
-    df = pd.read_csv(data_path, sep=";")
-
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
-
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
-
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
+    latest_cash_flow = get_latest_simfin_statement("cash_flow", freq, ticker, curr_date, columns)
 
     # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
+    if latest_cash_flow is None:
         print("No cash flow statement available before the given current date.")
         return ""
 
-    # Get the most recent cash flow statement by selecting the row with the latest Publish Date
-    latest_cash_flow = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
-
-    # drop the SimFinID column
-    latest_cash_flow = latest_cash_flow.drop("SimFinId")
-
     return (
         f"## {freq} cash flow statement for {ticker} released on {str(latest_cash_flow['Publish Date'])[0:10]}: \n"
         + str(latest_cash_flow)
@@ -244,39 +249,15 @@ def get_simfin_income_statements(
         "reporting frequency of the company's financial history: annual / quarterly",
     ],
     curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+    columns: Annotated[list, "statement fields to include; None for all"] = None,
 ):
-    data_path = os.path.join(
-        DATA_DIR,
-        "fundamental_data",
-        "simfin_data_all",
-        "income_statements",
-        "companies",
-        "us",
-        f"us-income-{freq}.csv",
-    )
-    df = pd.read_csv(data_path, sep=";")
-
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
-
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
-
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
+    latest_income = get_latest_simfin_statement("income_statements", freq, ticker, curr_date, columns)
 
     # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
+    if latest_income is None:
         print("No income statement available before the given current date.")
         return ""
 
-    # Get the most recent income statement by selecting the row with the latest Publish Date
-    latest_income = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
-
-    # drop the SimFinID column
-    latest_income = latest_income.drop("SimFinId")
-
     return (
         f"## {freq} income statement for {ticker} released on {str(latest_income['Publish Date'])[0:10]}: \n"
         + str(latest_income)
@@ -291,18 +272,16 @@ def get_google_news(
 ) -> str:
     query = query.replace(" ", "+")
 
-    start_date = datetime.strptime(curr_date, "%Y-%m-%d")
-    before = start_date - relativedelta(days=look_back_days)
+    start_date = parse_date(curr_date)
+    before = start_date - timedelta(days=look_back_days)
     before = before.strftime("%Y-%m-%d")
 
     news_results = getNewsData(query, before, curr_date)
 
-    news_str = ""
-
-    for news in news_results:
-        news_str += (
-            f"### {news['title']} (source: {news['source']}) \n\n{news['snippet']}\n\n"
-        )
+    news_str = "".join(
+        f"### {news['title']} (source: {news['source']}) \n\n{news['snippet']}\n\n"
+        for news in news_results
+    )
 
     if len(news_results) == 0:
         return ""
@@ -310,56 +289,155 @@ def get_google_news(
     return f"## {query} Google News, from {before} to {curr_date}:\n\n{news_str}"
 
 
+async def aget_news_batch(news_fn, queries, curr_date, look_back_days):
+    """
+    Run a news tool for several tickers or queries concurrently.
+
+    The tools block on file and HTTP reads, so each call runs in a worker
+    thread and the waits overlap.
+
+    Args:
+        news_fn: get_finnhub_news, get_google_news or another tool taking
+            (query, curr_date, look_back_days)
+        queries: Tickers or search queries
+        curr_date: Current date in yyyy-mm-dd format
+        look_back_days: How many days to look back
+
+    Returns:
+        list: News strings aligned with queries
+    """
+    semaphore = asyncio.Semaphore(get_config().get("news_batch_concurrency", 8))
+
+    async def fetch_one(query):
+        async with semaphore:
+            return await asyncio.to_thread(news_fn, query, curr_date, look_back_days)
+
+    return await asyncio.gather(*(fetch_one(query) for query in queries))
+
+
+def get_news_batch(news_fn, queries, curr_date, look_back_days):
+    """Synchronous wrapper around aget_news_batch."""
+    return asyncio.run(aget_news_batch(news_fn, queries, curr_date, look_back_days))
+
+
+def _fetch_reddit_days(
+    category: str,
+    before: str,
+    end_date: datetime,
+    max_limit_per_day: int,
+    ticker: str = None,
+    desc: str = None,
+) -> list:
+    """
+    Fetch the top Reddit posts for every day from before through end_date.
+
+    Days are read concurrently (the per-day lookups are independent file/HTTP
+    reads); posts are returned in date order.
+    """
+    dates = pd.date_range(before, end_date, freq="D").strftime("%Y-%m-%d").tolist()
+    data_path = os.path.join(DATA_DIR, "reddit_data")
+
+    def fetch_day(date_str):
+        args = (category, date_str, max_limit_per_day)
+        if ticker is not None:
+            args += (ticker,)
+        return fetch_top_from_category(*args, data_path=data_path)
+
+    max_workers = get_config().get("reddit_fetch_workers", 16)
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(dates)))) as executor:
+        results = list(tqdm(executor.map(fetch_day, dates), desc=desc, total=len(dates)))
+
+    return [post for day_posts in results for post in day_posts]
+
+
+def _format_reddit_post(post: dict) -> str:
+    if post["content"] == "":
+        return f"### {post['title']}\n\n"
+    return f"### {post['title']}\n\n{post['content']}\n\n"
+
+
+def iter_reddit_global_news(
+    start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
+    look_back_days: Annotated[int, "how many days to look back"],
+    max_limit_per_day: Annotated[int, "Maximum number of news per day"],
+):
+    """
+    Yield the get_reddit_global_news report piece by piece: the header, then
+    one section per post. Nothing is yielded when there are no posts.
+    """
+
+    start_date = parse_date(start_date)
+    before = start_date - timedelta(days=look_back_days)
+    before = before.strftime("%Y-%m-%d")
+
+    posts = _fetch_reddit_days(
+        "global_news",
+        before,
+        start_date,
+        max_limit_per_day,
+        desc=f"Getting Global News on {start_date}",
+    )
+    curr_date = start_date + timedelta(days=1)
+
+    if len(posts) == 0:
+        return
+
+    yield f"## Global News Reddit, from {before} to {curr_date}:\n"
+    for post in posts:
+        yield _format_reddit_post(post)
+
+
 def get_reddit_global_news(
     start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
     look_back_days: Annotated[int, "how many days to look back"],
     max_limit_per_day: Annotated[int, "Maximum number of news per day"],
+    max_sections: Annotated[int, "keep at most this many sections, header included"] = None,
 ) -> str:
     """
     Retrieve the latest top reddit news
     Args:
         start_date: Start date in yyyy-mm-dd format
         end_date: End date in yyyy-mm-dd format
+        max_sections: Truncate the report without formatting the rest; None keeps all
     Returns:
         str: A formatted dataframe containing the latest news articles posts on reddit and meta information in these columns: "created_utc", "id", "title", "selftext", "score", "num_comments", "url"
     """
+    return "".join(itertools.islice(
+        iter_reddit_global_news(start_date, look_back_days, max_limit_per_day), max_sections
+    ))
 
-    start_date = datetime.strptime(start_date, "%Y-%m-%d")
-    before = start_date - relativedelta(days=look_back_days)
-    before = before.strftime("%Y-%m-%d")
 
-    posts = []
-    # iterate from start_date to end_date
-    curr_date = datetime.strptime(before, "%Y-%m-%d")
-
-    total_iterations = (start_date - curr_date).days + 1
-    pbar = tqdm(desc=f"Getting Global News on {start_date}", total=total_iterations)
+def iter_reddit_company_news(
+    ticker: Annotated[str, "ticker symbol of the company"],
+    start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
+    look_back_days: Annotated[int, "how many days to look back"],
+    max_limit_per_day: Annotated[int, "Maximum number of news per day"],
+):
+    """
+    Yield the get_reddit_company_news report piece by piece: the header, then
+    one section per post. Nothing is yielded when there are no posts.
+    """
 
-    while curr_date <= start_date:
-        curr_date_str = curr_date.strftime("%Y-%m-%d")
-        fetch_result = fetch_top_from_category(
-            "global_news",
-            curr_date_str,
-            max_limit_per_day,
-            data_path=os.path.join(DATA_DIR, "reddit_data"),
-        )
-        posts.extend(fetch_result)
-        curr_date += relativedelta(days=1)
-        pbar.update(1)
+    start_date = parse_date(start_date)
+    before = start_date - timedelta(days=look_back_days)
+    before = before.strftime("%Y-%m-%d")
 
-    pbar.close()
+    posts = _fetch_reddit_days(
+        "company_news",
+        before,
+        start_date,
+        max_limit_per_day,
+        ticker,
+        desc=f"Getting Company News for {ticker} on {start_date}",
+    )
+    curr_date = start_date + timedelta(days=1)
 
     if len(posts) == 0:
-        return ""
+        return
 
-    news_str = ""
+    yield f"##{ticker} News Reddit, from {before} to {curr_date}:\n\n"
     for post in posts:
-        if post["content"] == "":
-            news_str += f"### {post['title']}\n\n"
-        else:
-            news_str += f"### {post['title']}\n\n{post['content']}\n\n"
-
-    return f"## Global News Reddit, from {before} to {curr_date}:\n{news_str}"
+        yield _format_reddit_post(post)
 
 
 def get_reddit_company_news(
@@ -367,6 +445,7 @@ def get_reddit_company_news(
     start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
     look_back_days: Annotated[int, "how many days to look back"],
     max_limit_per_day: Annotated[int, "Maximum number of news per day"],
+    max_sections: Annotated[int, "keep at most this many sections, header included"] = None,
 ) -> str:
     """
     Retrieve the latest top reddit news
@@ -374,51 +453,13 @@ def get_reddit_company_news(
         ticker: ticker symbol of the company
         start_date: Start date in yyyy-mm-dd format
         end_date: End date in yyyy-mm-dd format
+        max_sections: Truncate the report without formatting the rest; None keeps all
     Returns:
         str: A formatted dataframe containing the latest news articles posts on reddit and meta information in these columns: "created_utc", "id", "title", "selftext", "score", "num_comments", "url"
     """
-
-    start_date = datetime.strptime(start_date, "%Y-%m-%d")
-    before = start_date - relativedelta(days=look_back_days)
-    before = before.strftime("%Y-%m-%d")
-
-    posts = []
-    # iterate from start_date to end_date
-    curr_date = datetime.strptime(before, "%Y-%m-%d")
-
-    total_iterations = (start_date - curr_date).days + 1
-    pbar = tqdm(
-        desc=f"Getting Company News for {ticker} on {start_date}",
-        total=total_iterations,
-    )
-
-    while curr_date <= start_date:
-        curr_date_str = curr_date.strftime("%Y-%m-%d")
-        fetch_result = fetch_top_from_category(
-            "company_news",
-            curr_date_str,
-            max_limit_per_day,
-            ticker,
-            data_path=os.path.join(DATA_DIR, "reddit_data"),
-        )
-        posts.extend(fetch_result)
-        curr_date += relativedelta(days=1)
-
-        pbar.update(1)
-
-    pbar.close()
-
-    if len(posts) == 0:
-        return ""
-
-    news_str = ""
-    for post in posts:
-        if post["content"] == "":
-            news_str += f"### {post['title']}\n\n"
-        else:
-            news_str += f"### {post['title']}\n\n{post['content']}\n\n"
-
-    return f"##{ticker} News Reddit, from {before} to {curr_date}:\n\n{news_str}"
+    return "".join(itertools.islice(
+        iter_reddit_company_news(ticker, start_date, look_back_days, max_limit_per_day), max_sections
+    ))
 
 
 def get_stock_stats_indicators_window(
@@ -431,127 +472,51 @@ def get_stock_stats_indicators_window(
     online: Annotated[bool, "to fetch data online or offline"],
 ) -> str:
 
-    best_ind_params = {
-        # Moving Averages
-        "close_50_sma": (
-            "50 SMA: A medium-term trend indicator. "
-            "Usage: Identify trend direction and serve as dynamic support/resistance. "
-            "Tips: It lags price; combine with faster indicators for timely signals."
-        ),
-        "close_200_sma": (
-            "200 SMA: A long-term trend benchmark. "
-            "Usage: Confirm overall market trend and identify golden/death cross setups. "
-            "Tips: It reacts slowly; best for strategic trend confirmation rather than frequent trading entries."
-        ),
-        "close_10_ema": (
-            "10 EMA: A responsive short-term average. "
-            "Usage: Capture quick shifts in momentum and potential entry points. "
-            "Tips: Prone to noise in choppy markets; use alongside longer averages for filtering false signals."
-        ),
-        # MACD Related
-        "macd": (
-            "MACD: Computes momentum via differences of EMAs. "
-            "Usage: Look for crossovers and divergence as signals of trend changes. "
-            "Tips: Confirm with other indicators in low-volatility or sideways markets."
-        ),
-        "macds": (
-            "MACD Signal: An EMA smoothing of the MACD line. "
-            "Usage: Use crossovers with the MACD line to trigger trades. "
-            "Tips: Should be part of a broader strategy to avoid false positives."
-        ),
-        "macdh": (
-            "MACD Histogram: Shows the gap between the MACD line and its signal. "
-            "Usage: Visualize momentum strength and spot divergence early. "
-            "Tips: Can be volatile; complement with additional filters in fast-moving markets."
-        ),
-        # Momentum Indicators
-        "rsi": (
-            "RSI: Measures momentum to flag overbought/oversold conditions. "
-            "Usage: Apply 70/30 thresholds and watch for divergence to signal reversals. "
-            "Tips: In strong trends, RSI may remain extreme; always cross-check with trend analysis."
-        ),
-        # Volatility Indicators
-        "boll": (
-            "Bollinger Middle: A 20 SMA serving as the basis for Bollinger Bands. "
-            "Usage: Acts as a dynamic benchmark for price movement. "
-            "Tips: Combine with the upper and lower bands to effectively spot breakouts or reversals."
-        ),
-        "boll_ub": (
-            "Bollinger Upper Band: Typically 2 standard deviations above the middle line. "
-            "Usage: Signals potential overbought conditions and breakout zones. "
-            "Tips: Confirm signals with other tools; prices may ride the band in strong trends."
-        ),
-        "boll_lb": (
-            "Bollinger Lower Band: Typically 2 standard deviations below the middle line. "
-            "Usage: Indicates potential oversold conditions. "
-            "Tips: Use additional analysis to avoid false reversal signals."
-        ),
-        "atr": (
-            "ATR: Averages true range to measure volatility. "
-            "Usage: Set stop-loss levels and adjust position sizes based on current market volatility. "
-            "Tips: It's a reactive measure, so use it as part of a broader risk management strategy."
-        ),
-        # Volume-Based Indicators
-        "vwma": (
-            "VWMA: A moving average weighted by volume. "
-            "Usage: Confirm trends by integrating price action with volume data. "
-            "Tips: Watch for skewed results from volume spikes; use in combination with other volume analyses."
-        ),
-        "mfi": (
-            "MFI: The Money Flow Index is a momentum indicator that uses both price and volume to measure buying and selling pressure. "
-            "Usage: Identify overbought (>80) or oversold (<20) conditions and confirm the strength of trends or reversals. "
-            "Tips: Use alongside RSI or MACD to confirm signals; divergence between price and MFI can indicate potential reversals."
-        ),
-    }
-
-    if indicator not in best_ind_params:
+    if indicator not in BEST_IND_PARAMS:
         raise ValueError(
-            f"Indicator {indicator} is not supported. Please choose from: {list(best_ind_params.keys())}"
+            f"Indicator {indicator} is not supported. Please choose from: {list(BEST_IND_PARAMS.keys())}"
         )
 
     end_date = curr_date
-    curr_date = datetime.strptime(curr_date, "%Y-%m-%d")
-    before = curr_date - relativedelta(days=look_back_days)
-
-    if not online:
-        # read from YFin data
-        data = pd.read_csv(
-            os.path.join(
-                DATA_DIR,
-                f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-            )
-        )
-        data["Date"] = pd.to_datetime(data["Date"], utc=True)
-        dates_in_df = data["Date"].astype(str).str[:10]
+    curr_date = parse_date(curr_date)
+    before = curr_date - timedelta(days=look_back_days)
 
-        ind_string = ""
-        while curr_date >= before:
+    # Compute the indicator once over the whole history, then read off each day
+    try:
+        series = StockstatsUtils.get_stock_stats_series(
+            symbol,
+            indicator,
+            os.path.join(DATA_DIR, "market_data", "price_data"),
+            online=online,
+        )
+        # Only the days in the window are formatted and looked up
+        series = series[(series.index >= before) & (series.index <= curr_date)]
+        values = dict(zip(series.index.strftime("%Y-%m-%d"), series.values))
+    except Exception as e:
+        print(f"Error getting stockstats indicator data for indicator {indicator}: {e}")
+        values = None
+
+    # Newest day first
+    ind_lines = []
+    for date_str in pd.date_range(before, curr_date, freq="D")[::-1].strftime("%Y-%m-%d"):
+        if values is None:
+            indicator_value = ""
+        elif date_str in values:
+            indicator_value = values[date_str]
+        elif online:
+            indicator_value = "N/A: Not a trading day (weekend or holiday)"
+        else:
             # only do the trading dates
-            if curr_date.strftime("%Y-%m-%d") in dates_in_df.values:
-                indicator_value = get_stockstats_indicator(
-                    symbol, indicator, curr_date.strftime("%Y-%m-%d"), online
-                )
-
-                ind_string += f"{curr_date.strftime('%Y-%m-%d')}: {indicator_value}\n"
-
-            curr_date = curr_date - relativedelta(days=1)
-    else:
-        # online gathering
-        ind_string = ""
-        while curr_date >= before:
-            indicator_value = get_stockstats_indicator(
-                symbol, indicator, curr_date.strftime("%Y-%m-%d"), online
-            )
-
-            ind_string += f"{curr_date.strftime('%Y-%m-%d')}: {indicator_value}\n"
+            indicator_value = None
 
-            curr_date = curr_date - relativedelta(days=1)
+        if indicator_value is not None:
+            ind_lines.append(f"{date_str}: {indicator_value}\n")
 
     result_str = (
         f"## {indicator} values from {before.strftime('%Y-%m-%d')} to {end_date}:\n\n"
-        + ind_string
+        + "".join(ind_lines)
         + "\n\n"
-        + best_ind_params.get(indicator, "No description available.")
+        + BEST_IND_PARAMS[indicator]
     )
 
     return result_str
@@ -566,7 +531,7 @@ def get_stockstats_indicator(
     online: Annotated[bool, "to fetch data online or offline"],
 ) -> str:
 
-    curr_date = datetime.strptime(curr_date, "%Y-%m-%d")
+    curr_date = parse_date(curr_date)
     curr_date = curr_date.strftime("%Y-%m-%d")
 
     try:
@@ -586,40 +551,34 @@ def get_stockstats_indicator(
     return str(indicator_value)
 
 
+def _filter_yfin_price_data(symbol: str, start_date: str, end_date: str) -> pd.DataFrame:
+    """Rows of the offline YFin price data dated start_date through end_date."""
+    path = os.path.join(
+        DATA_DIR,
+        f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
+    )
+    data, days = load_yfin_price_data(path)
+    # days is sorted, so the range is found by binary search and sliced
+    start = days.searchsorted(pd.Timestamp(start_date).to_datetime64(), side="left")
+    end = days.searchsorted(pd.Timestamp(end_date).to_datetime64(), side="right")
+    return data.iloc[start:end]
+
+
 def get_YFin_data_window(
     symbol: Annotated[str, "ticker symbol of the company"],
     curr_date: Annotated[str, "Start date in yyyy-mm-dd format"],
     look_back_days: Annotated[int, "how many days to look back"],
 ) -> str:
     # calculate past days
-    date_obj = datetime.strptime(curr_date, "%Y-%m-%d")
-    before = date_obj - relativedelta(days=look_back_days)
+    date_obj = parse_date(curr_date)
+    before = date_obj - timedelta(days=look_back_days)
     start_date = before.strftime("%Y-%m-%d")
 
-    # read in data
-    data = pd.read_csv(
-        os.path.join(
-            DATA_DIR,
-            f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-        )
-    )
-
-    # Extract just the date part for comparison
-    data["DateOnly"] = data["Date"].str[:10]
-
     # Filter data between the start and end dates (inclusive)
-    filtered_data = data[
-        (data["DateOnly"] >= start_date) & (data["DateOnly"] <= curr_date)
-    ]
+    filtered_data = _filter_yfin_price_data(symbol, start_date, curr_date)
 
-    # Drop the temporary column we created
-    filtered_data = filtered_data.drop("DateOnly", axis=1)
-
-    # Set pandas display options to show the full DataFrame
-    with pd.option_context(
-        "display.max_rows", None, "display.max_columns", None, "display.width", None
-    ):
-        df_string = filtered_data.to_string()
+    # CSV carries the same rows as a padded table and formats much faster
+    df_string = filtered_data.to_csv(index=False)
 
     return (
         f"## Raw Market Data for {symbol} from {start_date} to {curr_date}:\n\n"
@@ -632,41 +591,7 @@ def get_YFin_data_online(
     start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
     end_date: Annotated[str, "End date in yyyy-mm-dd format"],
 ):
-
-    datetime.strptime(start_date, "%Y-%m-%d")
-    datetime.strptime(end_date, "%Y-%m-%d")
-
-    # Create ticker object
-    ticker = yf.Ticker(symbol.upper())
-
-    # Fetch historical data for the specified date range
-    data = ticker.history(start=start_date, end=end_date)
-
-    # Check if data is empty
-    if data.empty:
-        return (
-            f"No data found for symbol '{symbol}' between {start_date} and {end_date}"
-        )
-
-    # Remove timezone info from index for cleaner output
-    if data.index.tz is not None:
-        data.index = data.index.tz_localize(None)
-
-    # Round numerical values to 2 decimal places for cleaner display
-    numeric_columns = ["Open", "High", "Low", "Close", "Adj Close"]
-    for col in numeric_columns:
-        if col in data.columns:
-            data[col] = data[col].round(2)
-
-    # Convert DataFrame to CSV string
-    csv_string = data.to_csv()
-
-    # Add header information
-    header = f"# Stock data for {symbol.upper()} from {start_date} to {end_date}\n"
-    header += f"# Total records: {len(data)}\n"
-    header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-
-    return header + csv_string
+    return _get_YFin_data_online(symbol, start_date, end_date)
 
 
 def get_tushare_data_online(symbol: Annotated[str, "ticker symbol of the company"],
@@ -686,8 +611,8 @@ def get_tushare_data_online(symbol: Annotated[str, "ticker symbol of the company
     """
 
     # Validate date formats
-    datetime.strptime(start_date, "%Y-%m-%d")
-    datetime.strptime(end_date, "%Y-%m-%d")
+    parse_date(start_date)
+    parse_date(end_date)
 
     try:
         # Get or create TushareUtils instance
@@ -761,14 +686,15 @@ def get_tushare_stock_info(
         formatted_result = tushare_utils.format_stock_info(info_list)
 
         # Add header
-        header = f"# Tushare Stock Information\n"
-        header += f"# Symbol: {symbol}\n"
-        header += f"# Info Type: {info_type}\n"
-        header += f"# Date: {date}\n"
-        header += f"# Retrieved: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-        header += "=" * 60 + "\n\n"
-
-        return header + formatted_result
+        return "".join([
+            "# Tushare Stock Information\n",
+            f"# Symbol: {symbol}\n",
+            f"# Info Type: {info_type}\n",
+            f"# Date: {date}\n",
+            f"# Retrieved: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+            "=" * 60 + "\n\n",
+            formatted_result,
+        ])
 
     except Exception as e:
         return f"Error fetching {info_type} for '{symbol}': {str(e)}"
@@ -806,21 +732,27 @@ def get_tushare_stock_news(
         if not stock_info:
             return f"No news found for {symbol} in the last {interval} days"
 
-        # Format output
-        output = f"## {symbol} News from Tushare\n"
-        output += f"## Date: {date} (looking back {interval} days)\n"
-        output += "=" * 60 + "\n\n"
+        # Format output; sections are collected and joined once
+        parts = [
+            f"## {symbol} News from Tushare\n",
+            f"## Date: {date} (looking back {interval} days)\n",
+            "=" * 60 + "\n\n",
+        ]
 
         for item in stock_info:
             if item['type'] == 'company_info':
-                output += f"### Company: {item['name']} ({item['symbol']})\n"
-                output += f"Industry: {item['industry']}, Area: {item['area']}\n\n"
+                parts.append(
+                    f"### Company: {item['name']} ({item['symbol']})\n"
+                    f"Industry: {item['industry']}, Area: {item['area']}\n\n"
+                )
             elif item['type'] in ['news', 'cctv_news', 'announcement', 'ir_qa']:
-                output += f"### [{item['type'].upper()}] {item['title']}\n"
-                output += f"Date: {item['datetime']}, Source: {item['source']}\n"
-                output += f"{item['content']}\n\n"
+                parts.append(
+                    f"### [{item['type'].upper()}] {item['title']}\n"
+                    f"Date: {item['datetime']}, Source: {item['source']}\n"
+                    f"{item['content']}\n\n"
+                )
 
-        return output
+        return "".join(parts)
 
     except Exception as e:
         return f"Error fetching news for '{symbol}': {str(e)}"
@@ -853,42 +785,40 @@ def get_tushare_news(
         if news_df.empty:
             return f"No news found for the last {interval} days"
 
-        # Format output
-        output = f"## Tushare News (All Sources)\n"
-        output += f"## Date: {date} (looking back {interval} days)\n"
-        output += f"## Total items: {len(news_df)}\n"
-        output += "=" * 60 + "\n\n"
+        # Format output; sections are collected and joined once
+        parts = [
+            "## Tushare News (All Sources)\n",
+            f"## Date: {date} (looking back {interval} days)\n",
+            f"## Total items: {len(news_df)}\n",
+            "=" * 60 + "\n\n",
+        ]
 
-        # Group by type
-        news_types = news_df['type'].unique()
-
-        for news_type in news_types:
-            type_news = news_df[news_df['type'] == news_type]
-            output += f"### {news_type.upper()} ({len(type_news)} items)\n"
-            output += "-" * 40 + "\n"
+        # Group by type, in order of first appearance
+        for news_type, type_news in news_df.groupby('type', sort=False):
+            parts.append(f"### {news_type.upper()} ({len(type_news)} items)\n" + "-" * 40 + "\n")
 
             # Show first few items from each type
-            for _, row in type_news.head(5).iterrows():
-                output += f"\n**{row['title']}**\n"
-                output += f"Date: {row['datetime']}"
-                if row.get('source'):
-                    output += f", Source: {row['source']}"
-                if row.get('ts_code'):
-                    output += f", Stock: {row['ts_code']}"
-                output += "\n"
+            for row in type_news.head(5).to_dict("records"):
+                source = f", Source: {row['source']}" if row.get('source') else ""
+                stock = f", Stock: {row['ts_code']}" if row.get('ts_code') else ""
 
                 # Show content preview
                 content = row['content']
                 if content and len(content) > 200:
-                    output += f"{content[:200]}...\n"
+                    preview = f"{content[:200]}...\n"
                 elif content:
-                    output += f"{content}\n"
-                output += "\n"
+                    preview = f"{content}\n"
+                else:
+                    preview = ""
+
+                parts.append(
+                    f"\n**{row['title']}**\nDate: {row['datetime']}{source}{stock}\n{preview}\n"
+                )
 
             if len(type_news) > 5:
-                output += f"... and {len(type_news) - 5} more {news_type} items\n\n"
+                parts.append(f"... and {len(type_news) - 5} more {news_type} items\n\n")
 
-        return output
+        return "".join(parts)
 
     except Exception as e:
         return f"Error fetching news: {str(e)}"
@@ -899,29 +829,13 @@ def get_YFin_data(
     start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
     end_date: Annotated[str, "End date in yyyy-mm-dd format"],
 ) -> str:
-    # read in data
-    data = pd.read_csv(
-        os.path.join(
-            DATA_DIR,
-            f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-        )
-    )
-
     if end_date > "2025-03-25":
         raise Exception(
             f"Get_YFin_Data: {end_date} is outside of the data range of 2015-01-01 to 2025-03-25"
         )
 
-    # Extract just the date part for comparison
-    data["DateOnly"] = data["Date"].str[:10]
-
     # Filter data between the start and end dates (inclusive)
-    filtered_data = data[
-        (data["DateOnly"] >= start_date) & (data["DateOnly"] <= end_date)
-    ]
-
-    # Drop the temporary column we created
-    filtered_data = filtered_data.drop("DateOnly", axis=1)
+    filtered_data = _filter_yfin_price_data(symbol, start_date, end_date)
 
     # remove the index from the dataframe
     filtered_data = filtered_data.reset_index(drop=True)
@@ -929,10 +843,114 @@ def get_YFin_data(
     return filtered_data
 
 
+# Shared cache for OpenAI web-search responses
+_openai_response_cache = None
+
+def get_openai_response_cache():
+    """Get or create the OpenAI response cache, or None when caching is disabled"""
+    global _openai_response_cache
+    config = get_config()
+    ttl = config.get("openai_response_cache_ttl")
+    if ttl is None:
+        return None
+    path = os.path.join(config["data_cache_dir"], "openai_responses.sqlite")
+    cache = _openai_response_cache
+    # Rebuild when set_config has moved the cache dir or changed the TTL
+    if cache is None or cache.path != path or cache.ttl != ttl:
+        _openai_response_cache = ResponseCache(path, ttl=ttl)
+    return _openai_response_cache
+
+
+# Shared cache for complete get_stock_news_openai results
+_news_result_cache = None
+
+def get_news_result_cache():
+    """Get or create the news result cache, or None when caching is disabled"""
+    global _news_result_cache
+    config = get_config()
+    ttl = config.get("news_result_cache_ttl")
+    if ttl is None:
+        return None
+    directory = os.path.join(config["data_cache_dir"], "news")
+    cache = _news_result_cache
+    # Rebuild when set_config has moved the cache dir or changed the TTL
+    if cache is None or cache.directory != directory or cache.ttl != ttl:
+        _news_result_cache = FileCache(directory, ttl=ttl)
+    return _news_result_cache
+
+
+# Shared rate limiter for OpenAI web-search requests
+_openai_rate_limiter = None
+_openai_rate_limiter_key = None
+
+def get_openai_rate_limiter():
+    """Get or create the OpenAI rate limiter, or None when rate limiting is disabled"""
+    global _openai_rate_limiter, _openai_rate_limiter_key
+    config = get_config()
+    rpm = config.get("openai_max_requests_per_minute")
+    if rpm is None:
+        return None
+    tpm = config.get("openai_max_tokens_per_minute")
+    # Rebuild when set_config has changed either budget
+    if _openai_rate_limiter is None or _openai_rate_limiter_key != (rpm, tpm):
+        _openai_rate_limiter = AsyncRateLimiter(rpm, tpm)
+        _openai_rate_limiter_key = (rpm, tpm)
+    return _openai_rate_limiter
+
+
 def get_stock_news_openai(symbol, ticker, curr_date):
     """
     Search for stock news from Chinese social media and news platforms.
-    Searches each site individually for better coverage.
+    Synchronous wrapper around aget_stock_news_openai.
+
+    Args:
+        symbol: Stock code (e.g., '300418.SZ')
+        ticker: Company name (e.g., '昆仑万维')
+        curr_date: Current date in YYYY-MM-DD format
+
+    Returns:
+        str: JSON formatted search results or error message
+    """
+    return asyncio.run(aget_stock_news_openai(symbol, ticker, curr_date))
+
+
+async def aget_stock_news_openai_batch(watchlist, curr_date):
+    """
+    Search stock news for several stocks concurrently.
+
+    A stock listed more than once is searched once: the result cache only
+    helps after the first search has finished, so concurrent duplicates
+    would otherwise all run the full set of web searches.
+
+    Args:
+        watchlist: List of (symbol, ticker) pairs, e.g. [('300418.SZ', '昆仑万维')]
+        curr_date: Current date in YYYY-MM-DD format
+
+    Returns:
+        list: JSON formatted search results (or None on error), aligned with watchlist
+    """
+    config = get_config()
+    semaphore = asyncio.Semaphore(config.get("news_batch_concurrency", 8))
+
+    async def search_one_stock(symbol, ticker):
+        async with semaphore:
+            return await aget_stock_news_openai(symbol, ticker, curr_date)
+
+    stocks = list(dict.fromkeys(tuple(stock) for stock in watchlist))
+    results = await asyncio.gather(
+        *(search_one_stock(symbol, ticker) for symbol, ticker in stocks)
+    )
+    by_stock = dict(zip(stocks, results))
+    return [by_stock[tuple(stock)] for stock in watchlist]
+
+
+async def aget_stock_news_openai(symbol, ticker, curr_date):
+    """
+    Search for stock news from Chinese social media and news platforms.
+    Searches each site individually for better coverage; the per-site
+    requests are issued concurrently. With config["news_search_mode"] set
+    to "combined", all sites are covered by one request that relies on
+    parallel web-search tool calls instead.
 
     Args:
         symbol: Stock code (e.g., '300418.SZ')
@@ -943,7 +961,6 @@ def get_stock_news_openai(symbol, ticker, curr_date):
         str: JSON formatted search results or error message
     """
     config = get_config()
-    client = OpenAI(base_url=config["backend_url"])
 
     # Define sites to search
     SITES = [
@@ -961,8 +978,7 @@ def get_stock_news_openai(symbol, ticker, curr_date):
 
     try:
         # Calculate date range
-        from datetime import datetime, timedelta
-        end_date_dt = datetime.strptime(curr_date, '%Y-%m-%d')
+        end_date_dt = parse_date(curr_date)
         start_date_dt = end_date_dt - timedelta(days=7)
         start_date = start_date_dt.strftime('%Y-%m-%d')
         end_date = end_date_dt.strftime('%Y-%m-%d')
@@ -1021,31 +1037,110 @@ OUTPUT (JSON format):
 }}
 """
 
-        def search_one_site(site_info):
-            """Search a single site and return results"""
-            site_name, domains, category = site_info
-            try:
-                response = client.responses.create(
-                    model=config.get("quick_think_llm", "gpt-4o"),
-                    input=[
-                        {"role": "system", "content": """You are an AI assistant with access to websearch functions.
+        def build_combined_prompt():
+            """Build one search prompt covering every site"""
+            kw = " / ".join(kw_variants)
+            dates = " / ".join(date_variants[:8])  # Show first 8 for brevity
+            scopes = "\n".join(
+                f"- {site_name} ({category}): " + " OR ".join([f"site:{d}" for d in domains])
+                for site_name, domains, category in SITES
+            )
+
+            return f"""
+TARGET WINDOW
+- Only keep items dated {start_date}–{end_date} inclusive, timezone = Asia/Shanghai.
+
+SCOPE (one web search per platform, run them in parallel)
+{scopes}
+- Search with keywords: {kw}
+- Date strings to match: {dates}
+
+SEARCH RULES
+1) For every platform above, run a query using its domains (`site:`) + keywords + date strings.
+2) If a platform has zero results, retry it by:
+   a) swapping keywords,
+   b) using only code "{symbol}",
+   c) dropping explicit date tokens from the query (but still filter by date at extraction)
+3) Deduplicate by URL. Exclude pages without a clear timestamp within the window.
+
+OUTPUT (JSON format, one entry per platform):
+{{
+  "results": [
+    {{
+      "platform": "platform name as listed above",
+      "category": "social or news",
+      "items": [
+        {{
+          "author": "author name or null",
+          "datetime_local": "YYYY-MM-DD HH:MM",
+          "title_or_snippet": "content snippet",
+          "url": "source URL"
+        }}
+      ],
+      "found_count": number
+    }}
+  ]
+}}
+"""
+
+        def build_request(prompt, **kwargs):
+            """Responses API parameters for one web-search prompt"""
+            return dict(
+                model=config.get("quick_think_llm", "gpt-4o"),
+                input=[
+                    {"role": "system", "content": """You are an AI assistant with access to websearch functions.
 The websearch function empowers you for real-time web search and information retrieval, particularly for current and
 relevant data from the internet. Always include the source URL for information fetched from the web."""},
-                        {"role": "user", "content": [
-                            {"type": "input_text", "text": build_site_prompt(site_name, domains, category)}
-                        ]}
-                    ],
-                    tools=[{
-                        "type": "web_search_preview",
-                        "search_context_size": "high",
-                        "user_location": {"type": "approximate"}
-                    }],
-                    max_output_tokens=10000,  # Enough for single site results
-                    top_p=1,
-                    store=True,
+                    {"role": "user", "content": [
+                        {"type": "input_text", "text": prompt}
+                    ]}
+                ],
+                tools=[{
+                    "type": "web_search_preview",
+                    "search_context_size": "high",
+                    "user_location": {"type": "approximate"}
+                }],
+                top_p=1,
+                store=True,
+                **kwargs,
+            )
+
+        async def create_search_text(client, request):
+            """Issue one Responses API call with web search enabled and return its text"""
+            # Identical requests are answered from the on-disk cache
+            cache = get_openai_response_cache()
+            key = make_cache_key(**request)
+            if cache is not None:
+                # SQLite I/O runs in a worker thread so it never blocks the event loop
+                cached_text = await asyncio.to_thread(cache.get, key)
+                if cached_text is not None:
+                    return cached_text
+
+            # Pace requests against the account's RPM/TPM budget when configured
+            limiter = get_openai_rate_limiter()
+            if limiter is not None:
+                # Rough estimate: one token per input character (CJK-heavy) plus the output budget
+                input_chars = len(json.dumps(request["input"], ensure_ascii=False))
+                tokens = input_chars + request.get("max_output_tokens", 0)
+                response = await call_with_rate_limit(
+                    limiter,
+                    lambda: client.responses.with_raw_response.create(**request),
+                    tokens,
                 )
+            else:
+                response = await client.responses.create(**request)
+            text = response.output_text if response.output_text else None
+            if text and cache is not None:
+                await asyncio.to_thread(cache.set, key, text)
+            return text
+
+        async def search_one_site(client, semaphore, site_info, request):
+            """Search a single site and return results"""
+            site_name, domains, category = site_info
+            try:
+                async with semaphore:
+                    text = await create_search_text(client, request)
 
-                text = response.output_text if response.output_text else None
                 if text:
                     # Try to parse as JSON
                     try:
@@ -1066,16 +1161,78 @@ relevant data from the internet. Always include the source URL for information f
                 print(f"Error searching {site_name}: {e}")
                 return None
 
+        def open_search_client():
+            """Async client for news searches; call_with_rate_limit retries on the rate-limited path"""
+            max_retries = 0 if get_openai_rate_limiter() is not None else 5
+            return make_async_openai_client(config["backend_url"], max_retries=max_retries)
+
+        async def search_all_sites():
+            """Fan the per-site searches out, capped by a semaphore"""
+            semaphore = asyncio.Semaphore(config.get("news_search_concurrency", 5))
+            async with open_search_client() as client:
+                return await asyncio.gather(
+                    *(
+                        search_one_site(client, semaphore, site, request)
+                        for site, request in zip(SITES, search_requests)
+                    )
+                )
+
+        async def search_combined():
+            """Search every site in a single request using parallel tool calls"""
+            try:
+                async with open_search_client() as client:
+                    text = await create_search_text(client, search_requests[0])
+                by_platform = {
+                    result.get("platform"): result
+                    for result in json.loads(text).get("results", [])
+                } if text else {}
+            except Exception as e:
+                print(f"Error in combined search: {e}")
+                by_platform = {}
+
+            # Line results up with SITES so they aggregate like per-site results
+            return [by_platform.get(site[0]) for site in SITES]
+
+        mode = config.get("news_search_mode", "per_site")
+        if mode == "combined":
+            search_requests = [build_request(
+                build_combined_prompt(),
+                parallel_tool_calls=True,
+                max_output_tokens=min(NEWS_SITE_MAX_OUTPUT_TOKENS * len(SITES), NEWS_MAX_OUTPUT_TOKENS),
+            )]
+        else:
+            search_requests = [
+                build_request(
+                    build_site_prompt(site_name, domains, category),
+                    max_output_tokens=NEWS_SITE_MAX_OUTPUT_TOKENS,
+                )
+                for site_name, domains, category in SITES
+            ]
+
+        # Whole results are reused only for exactly the same requests, so
+        # changing the sites, prompts, model or token budget searches again
+        news_cache = get_news_result_cache()
+        news_cache_key = make_cache_key(mode=mode, requests=search_requests)
+        if news_cache is not None:
+            cached_output = news_cache.get(news_cache_key)
+            if cached_output is not None:
+                return cached_output
+
         # Search all sites
         all_items = []
         search_summary = []
 
         print(f"\nSearching for {ticker} ({symbol}) from {start_date} to {end_date}")
         print("=" * 60)
+        if mode == "combined":
+            print(f"Searching {len(SITES)} sites in one request...")
+            results = await search_combined()
+        else:
+            print(f"Searching {len(SITES)} sites concurrently...")
+            results = await search_all_sites()
 
-        for site in SITES:
-            print(f"Searching {site[0]}...")
-            result = search_one_site(site)
+        for site, result in zip(SITES, results):
+            print(f"{site[0]}:")
 
             if result:
                 # Extract items
@@ -1128,10 +1285,15 @@ relevant data from the internet. Always include the source URL for information f
 
         # Convert to JSON string for output
         output = json.dumps(final_result, ensure_ascii=False, indent=2)
+        # Cache only complete results; a failed or unparsable site is
+        # searched again on the next run
+        complete = all(result and not result.get("error") for result in results)
+        if news_cache is not None and complete:
+            news_cache.set(news_cache_key, output)
         return output
 
     except Exception as e:
-        print(f"Error in get_stock_news_openai: {e}")
+        print(f"Error in aget_stock_news_openai: {e}")
         print(traceback.format_exc())
         return None
 
@@ -0,0 +1,98 @@
+# Shared OpenAI clients so repeated calls reuse one HTTP connection pool
+
+import asyncio
+import functools
+from typing import Awaitable, Callable, List, Optional
+
+import httpx
+from openai import AsyncOpenAI, OpenAI
+
+from .config import get_config
+
+# Connection pool shared by every request made through the cached client
+HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+
+@functools.lru_cache(maxsize=None)
+def _openai_client(base_url: Optional[str]) -> OpenAI:
+    return OpenAI(base_url=base_url, http_client=httpx.Client(limits=HTTP_LIMITS))
+
+
+def get_openai_client(base_url: Optional[str] = None) -> OpenAI:
+    """
+    Get or create the OpenAI client for a backend.
+
+    Args:
+        base_url: API base URL; defaults to config["backend_url"]
+
+    Returns:
+        OpenAI client reused across calls with the same base_url
+    """
+    if base_url is None:
+        base_url = get_config().get("backend_url") or None
+    return _openai_client(base_url)
+
+
+def make_async_openai_client(
+    base_url: Optional[str] = None,
+    timeout: Optional[float] = None,
+    max_retries: int = 5,
+) -> AsyncOpenAI:
+    """
+    Create an AsyncOpenAI client with the shared pool limits.
+
+    Async clients are bound to the event loop that uses them, so unlike
+    get_openai_client this builds a new one; use it as an async context
+    manager within a single asyncio.run.
+
+    Args:
+        base_url: API base URL; defaults to config["backend_url"]
+        timeout: Per-request timeout in seconds; defaults to
+            config["openai_request_timeout"]
+        max_retries: SDK retries on 429s and 5xx with exponential backoff;
+            pass 0 when the caller already retries (e.g. call_with_rate_limit)
+    """
+    config = get_config()
+    if base_url is None:
+        base_url = config.get("backend_url") or None
+    if timeout is None:
+        timeout = config.get("openai_request_timeout", 120)
+    return AsyncOpenAI(
+        base_url=base_url,
+        http_client=httpx.AsyncClient(limits=HTTP_LIMITS),
+        # Timeouts surface as catchable APITimeoutError and close the socket cleanly
+        timeout=httpx.Timeout(timeout, connect=5.0),
+        max_retries=max_retries,
+    )
+
+
+async def gather_with_client(
+    requests: List[Callable[[AsyncOpenAI], Awaitable]],
+    max_concurrency: Optional[int] = None,
+    return_exceptions: bool = False,
+) -> list:
+    """
+    Run several async OpenAI requests concurrently over one client.
+
+    Args:
+        requests: Coroutine functions that take the shared AsyncOpenAI client
+        max_concurrency: Cap on in-flight requests; defaults to
+            config["news_search_concurrency"]
+        return_exceptions: Return failures in place of results instead of raising
+
+    Returns:
+        Results in the same order as requests
+    """
+    if max_concurrency is None:
+        max_concurrency = get_config().get("news_search_concurrency", 5)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async with make_async_openai_client() as client:
+        async def run(request):
+            async with semaphore:
+                return await request(client)
+
+        return await asyncio.gather(
+            *(run(request) for request in requests),
+            return_exceptions=return_exceptions,
+        )
@@ -0,0 +1,194 @@
+# Client-side rate limiting for concurrent OpenAI API calls
+
+import asyncio
+import re
+import threading
+import time
+from typing import Awaitable, Callable, Mapping, Optional
+
+import openai
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+# First backoff (seconds) after a 5xx, timeout or connection error; doubles per attempt
+RETRY_BACKOFF_SECONDS = 1.0
+
+
+def is_transient_error(error: Exception) -> bool:
+    """True for server errors, timeouts and dropped connections worth retrying"""
+    if isinstance(error, openai.APIConnectionError):  # includes APITimeoutError
+        return True
+    status_code = getattr(error, "status_code", None)
+    return status_code is not None and status_code >= 500
+
+
+def parse_reset_duration(value: Optional[str]) -> Optional[float]:
+    """
+    Parse an OpenAI rate-limit reset header such as "6m0s", "1.5s" or "20ms".
+
+    Args:
+        value: Header value; a bare number is read as seconds
+
+    Returns:
+        Duration in seconds, or None if the value is missing or unparseable
+    """
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+
+class AsyncRateLimiter:
+    """
+    Token buckets for requests per minute and tokens per minute.
+
+    Both buckets refill continuously; acquire() waits until they can cover
+    the next request. Modelled on the OpenAI cookbook's
+    api_request_parallel_processor. One limiter may be shared by event
+    loops running in different threads, so bucket state is guarded by a
+    threading.Lock that is never held across an await.
+    """
+
+    def __init__(self, max_requests_per_minute: float, max_tokens_per_minute: Optional[float] = None):
+        """
+        Args:
+            max_requests_per_minute: Request budget per minute
+            max_tokens_per_minute: Token budget per minute; None disables token limiting
+        """
+        self.max_requests_per_minute = float(max_requests_per_minute)
+        self.max_tokens_per_minute = float(max_tokens_per_minute) if max_tokens_per_minute else None
+        self.available_requests = self.max_requests_per_minute
+        self.available_tokens = self.max_tokens_per_minute
+        self.last_update = time.monotonic()
+        self.pause_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self.last_update
+        self.last_update = now
+
+        self.available_requests = min(
+            self.max_requests_per_minute,
+            self.available_requests + self.max_requests_per_minute * elapsed / 60.0,
+        )
+        if self.max_tokens_per_minute is not None:
+            self.available_tokens = min(
+                self.max_tokens_per_minute,
+                self.available_tokens + self.max_tokens_per_minute * elapsed / 60.0,
+            )
+
+    def _wait_time(self, tokens: float) -> float:
+        """Seconds until both buckets can cover a request of this size."""
+        wait = max(0.0, (1.0 - self.available_requests) * 60.0 / self.max_requests_per_minute)
+        if self.max_tokens_per_minute is not None:
+            missing = tokens - self.available_tokens
+            wait = max(wait, missing * 60.0 / self.max_tokens_per_minute)
+        return wait
+
+    async def acquire(self, tokens: float = 0):
+        """
+        Wait for capacity, then reserve one request and the given tokens.
+
+        Args:
+            tokens: Estimated tokens the request will consume
+        """
+        if self.max_tokens_per_minute is not None:
+            # A request larger than the whole budget would otherwise never fit
+            tokens = min(tokens, self.max_tokens_per_minute)
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self.pause_until:
+                    wait = self.pause_until - now
+                else:
+                    self._refill()
+                    wait = self._wait_time(tokens)
+                    if wait <= 0:
+                        self.available_requests -= 1
+                        if self.max_tokens_per_minute is not None:
+                            self.available_tokens -= tokens
+                        return
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Hold all callers for the given number of seconds (e.g. after a 429)."""
+        with self._lock:
+            self.pause_until = max(self.pause_until, time.monotonic() + seconds)
+
+    def update_from_headers(self, headers: Mapping[str, str]):
+        """
+        Tighten the buckets to the server's view of the remaining budget.
+
+        Args:
+            headers: Response headers carrying x-ratelimit-* values
+        """
+        reset = None
+        with self._lock:
+            remaining_requests = headers.get("x-ratelimit-remaining-requests")
+            if remaining_requests is not None:
+                self.available_requests = min(self.available_requests, float(remaining_requests))
+                if float(remaining_requests) <= 0:
+                    reset = parse_reset_duration(headers.get("x-ratelimit-reset-requests"))
+
+            remaining_tokens = headers.get("x-ratelimit-remaining-tokens")
+            if remaining_tokens is not None and self.max_tokens_per_minute is not None:
+                self.available_tokens = min(self.available_tokens, float(remaining_tokens))
+
+        if reset:
+            self.pause(reset)
+
+
+async def call_with_rate_limit(
+    limiter: AsyncRateLimiter,
+    request: Callable[[], Awaitable],
+    tokens: float = 0,
+    max_attempts: int = 5,
+):
+    """
+    Run an OpenAI raw-response request under the limiter, with retries.
+
+    A 429 pauses the whole limiter for the server's retry-after; 5xx
+    responses, timeouts and connection errors back off this request only.
+    The client should be built with max_retries=0 so the SDK does not
+    retry underneath this loop.
+
+    Args:
+        limiter: Shared rate limiter
+        request: Zero-argument coroutine factory returning a raw response
+            (e.g. ``lambda: client.responses.with_raw_response.create(...)``)
+        tokens: Estimated tokens the request will consume
+        max_attempts: Attempts before the last retryable error is raised
+
+    Returns:
+        The parsed response object
+    """
+    for attempt in range(max_attempts):
+        await limiter.acquire(tokens)
+        try:
+            raw = await request()
+        except Exception as e:
+            if attempt == max_attempts - 1:
+                raise
+            if getattr(e, "status_code", None) == 429:
+                response = getattr(e, "response", None)
+                headers = response.headers if response is not None else {}
+                retry_after = parse_reset_duration(headers.get("retry-after")) or 2 ** attempt
+                limiter.pause(retry_after)
+                continue
+            if is_transient_error(e):
+                await asyncio.sleep(RETRY_BACKOFF_SECONDS * 2 ** attempt)
+                continue
+            raise
+
+        limiter.update_from_headers(raw.headers)
+        return raw.parse()
@@ -11,14 +11,29 @@ import os
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
+import threading
 import time
 
 
+# Reddit allows about 60 API requests per minute per OAuth client
+REDDIT_REQUESTS_PER_MINUTE = 60
+# Subreddits scanned concurrently
+REDDIT_DOWNLOAD_WORKERS = 4
+
+
 class RedditStockDownloader:
     """Download stock-related posts from Reddit using PRAW"""
 
-    def __init__(self, client_id: str, client_secret: str, user_agent: str):
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        user_agent: str,
+        max_workers: int = REDDIT_DOWNLOAD_WORKERS,
+        requests_per_minute: int = REDDIT_REQUESTS_PER_MINUTE
+    ):
         """
         Initialize Reddit API connection
 
@@ -26,12 +41,24 @@ class RedditStockDownloader:
             client_id: Reddit API client ID
             client_secret: Reddit API client secret
             user_agent: User agent string for API requests
+            max_workers: Subreddits scanned concurrently
+            requests_per_minute: API requests allowed across all workers
         """
-        self.reddit = praw.Reddit(
-            client_id=client_id,
-            client_secret=client_secret,
-            user_agent=user_agent
-        )
+        self._credentials = {
+            "client_id": client_id,
+            "client_secret": client_secret,
+            "user_agent": user_agent,
+        }
+        self.reddit = praw.Reddit(**self._credentials)
+
+        # PRAW is not thread safe, so worker threads get their own client
+        self._local = threading.local()
+        self._local.reddit = self.reddit
+
+        self.max_workers = max_workers
+        self.requests_per_minute = requests_per_minute
+        self._pace_lock = threading.Lock()
+        self._next_request_time = 0.0
 
         # Company ticker mapping (same as in reddit_utils.py)
         self.ticker_to_company = {
@@ -83,8 +110,10 @@ class RedditStockDownloader:
         Returns:
             List of post dictionaries
         """
-        subreddit = self.reddit.subreddit(subreddit_name)
+        subreddit = self._thread_reddit().subreddit(subreddit_name)
         posts = []
+        # The hot/new/top listings overlap, so keep each submission once
+        seen_ids = set()
 
         # Convert dates to timestamps
         start_timestamp = int(start_date.timestamp())
@@ -94,6 +123,7 @@ class RedditStockDownloader:
         search_methods = ['hot', 'new', 'top']
 
         for method in search_methods:
+            self._wait_for_request_slot()
             if method == 'hot':
                 submissions = subreddit.hot(limit=limit)
             elif method == 'new':
@@ -102,14 +132,14 @@ class RedditStockDownloader:
                 submissions = subreddit.top(time_filter='month', limit=limit)
 
             for submission in submissions:
+                if submission.id in seen_ids:
+                    continue
+
                 # Check if post is within date range
                 if start_timestamp <= submission.created_utc <= end_timestamp:
                     # If query specified, check if it's in title or text
-                    if query:
-                        query_lower = query.lower()
-                        if (query_lower not in submission.title.lower() and
-                            query_lower not in submission.selftext.lower()):
-                            continue
+                    if query and not self._matches_any(submission.title, submission.selftext, [query]):
+                        continue
 
                     post_data = {
                         "created_utc": int(submission.created_utc),
@@ -123,9 +153,106 @@ class RedditStockDownloader:
                         "author": str(submission.author) if submission.author else "[deleted]"
                     }
                     posts.append(post_data)
+                    seen_ids.add(submission.id)
 
         return posts
 
+    def _thread_reddit(self) -> praw.Reddit:
+        """The PRAW client of the calling thread, created on first use"""
+        reddit = getattr(self._local, "reddit", None)
+        if reddit is None:
+            reddit = self._local.reddit = praw.Reddit(**self._credentials)
+        return reddit
+
+    def _wait_for_request_slot(self):
+        """Block until the next API request slot, shared by all worker threads"""
+        with self._pace_lock:
+            now = time.monotonic()
+            start = max(now, self._next_request_time)
+            self._next_request_time = start + 60.0 / self.requests_per_minute
+
+        if start > now:
+            time.sleep(start - now)
+
+    @staticmethod
+    def _matches_any(title: str, selftext: str, terms: List[str]) -> bool:
+        """Whether any search term appears in the post title or text (case-insensitive)"""
+        title = title.lower()
+        selftext = selftext.lower()
+        return any(term.lower() in title or term.lower() in selftext for term in terms)
+
+    def _search_terms_in_subreddit(
+        self,
+        subreddit_name: str,
+        start_date: datetime,
+        end_date: datetime,
+        terms: List[str],
+        limit: int
+    ) -> List[Dict]:
+        """
+        Scan a subreddit's listings once and keep posts matching any term
+
+        The listings do not depend on the query, so matching every term
+        against one pass replaces a separate pass per term.
+
+        Args:
+            subreddit_name: Name of the subreddit
+            start_date: Start date for posts
+            end_date: End date for posts
+            terms: Tickers, company names or keywords to match
+            limit: Maximum number of posts to retrieve per listing
+
+        Returns:
+            List of post dictionaries
+        """
+        posts = self.search_posts_by_date_range(
+            subreddit_name,
+            start_date,
+            end_date,
+            limit=limit
+        )
+        return [post for post in posts if self._matches_any(post['title'], post['selftext'], terms)]
+
+    def _search_subreddits(
+        self,
+        subreddits: List[str],
+        start_date: datetime,
+        end_date: datetime,
+        terms: List[str],
+        limit: int
+    ) -> Dict[str, List[Dict]]:
+        """
+        Run _search_terms_in_subreddit for several subreddits concurrently
+
+        Requests are paced by _wait_for_request_slot; a failing subreddit
+        is reported and left empty.
+
+        Returns:
+            Dictionary mapping subreddit to list of posts
+        """
+        all_posts = {sub: [] for sub in subreddits}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self._search_terms_in_subreddit,
+                    subreddit_name,
+                    start_date,
+                    end_date,
+                    terms,
+                    limit
+                ): subreddit_name
+                for subreddit_name in subreddits
+            }
+            for future in tqdm(as_completed(futures), total=len(futures), desc="Subreddits"):
+                subreddit_name = futures[future]
+                try:
+                    all_posts[subreddit_name] = future.result()
+                except Exception as e:
+                    print(f"Error searching r/{subreddit_name}: {e}")
+
+        return all_posts
+
     def download_company_news(
         self,
         tickers: List[str],
@@ -150,43 +277,17 @@ class RedditStockDownloader:
         if subreddits is None:
             subreddits = ["wallstreetbets", "stocks", "investing", "StockMarket"]
 
-        all_posts = {sub: [] for sub in subreddits}
-
-        for subreddit_name in subreddits:
-            print(f"\nSearching r/{subreddit_name}...")
-
-            for ticker in tqdm(tickers, desc=f"Tickers in r/{subreddit_name}"):
-                try:
-                    # Search for ticker symbol
-                    posts = self.search_posts_by_date_range(
-                        subreddit_name,
-                        start_date,
-                        end_date,
-                        query=ticker,
-                        limit=posts_per_ticker
-                    )
-
-                    # Also search for company name if available
-                    if ticker in self.all_tickers:
-                        company_names = self.all_tickers[ticker].split(" OR ")
-                        for company_name in company_names:
-                            company_posts = self.search_posts_by_date_range(
-                                subreddit_name,
-                                start_date,
-                                end_date,
-                                query=company_name,
-                                limit=posts_per_ticker // len(company_names)
-                            )
-                            posts.extend(company_posts)
-
-                    all_posts[subreddit_name].extend(posts)
-
-                    # Rate limiting
-                    time.sleep(1)
+        # Match each ticker symbol and its company names, if known
+        terms = []
+        for ticker in tickers:
+            terms.append(ticker)
+            if ticker in self.all_tickers:
+                terms.extend(self.all_tickers[ticker].split(" OR "))
 
-                except Exception as e:
-                    print(f"Error searching for {ticker} in r/{subreddit_name}: {e}")
-                    continue
+        print(f"\nSearching r/{', r/'.join(subreddits)} for {', '.join(tickers)}...")
+        all_posts = self._search_subreddits(
+            subreddits, start_date, end_date, terms, limit=posts_per_ticker
+        )
 
         # Remove duplicates
         for subreddit_name in all_posts:
@@ -232,28 +333,10 @@ class RedditStockDownloader:
                 "interest rate", "market crash", "bull market", "bear market"
             ]
 
-        all_posts = {sub: [] for sub in subreddits}
-
-        for subreddit_name in subreddits:
-            print(f"\nSearching r/{subreddit_name}...")
-
-            for keyword in tqdm(keywords, desc=f"Keywords in r/{subreddit_name}"):
-                try:
-                    posts = self.search_posts_by_date_range(
-                        subreddit_name,
-                        start_date,
-                        end_date,
-                        query=keyword,
-                        limit=posts_per_keyword
-                    )
-                    all_posts[subreddit_name].extend(posts)
-
-                    # Rate limiting
-                    time.sleep(1)
-
-                except Exception as e:
-                    print(f"Error searching for '{keyword}' in r/{subreddit_name}: {e}")
-                    continue
+        print(f"\nSearching r/{', r/'.join(subreddits)}...")
+        all_posts = self._search_subreddits(
+            subreddits, start_date, end_date, keywords, limit=posts_per_keyword
+        )
 
         # Remove duplicates
         for subreddit_name in all_posts:
@@ -293,9 +376,9 @@ class RedditStockDownloader:
             # Sort posts by date
             subreddit_posts.sort(key=lambda x: x['created_utc'])
 
+            # Build the file contents first and write them in one call
             with open(file_path, 'w') as f:
-                for post in subreddit_posts:
-                    f.write(json.dumps(post) + '\n')
+                f.write("".join(json.dumps(post) + '\n' for post in subreddit_posts))
 
             print(f"Saved {len(subreddit_posts)} posts to {file_path}")
 
@@ -315,6 +398,8 @@ def main():
                        help='Stock tickers to search')
     parser.add_argument('--include-chinese', action='store_true',
                        help='Include Chinese stock tickers')
+    parser.add_argument('--workers', type=int, default=REDDIT_DOWNLOAD_WORKERS,
+                       help='Subreddits scanned concurrently')
 
     args = parser.parse_args()
 
@@ -322,7 +407,8 @@ def main():
     downloader = RedditStockDownloader(
         client_id=args.client_id,
         client_secret=args.client_secret,
-        user_agent=args.user_agent
+        user_agent=args.user_agent,
+        max_workers=args.workers
     )
 
     # Set date range
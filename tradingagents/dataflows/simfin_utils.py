@@ -0,0 +1,169 @@
+# Point-in-time lookups over the SimFin bulk statement files
+
+import functools
+import os
+from typing import Optional, Sequence, Tuple
+
+import pandas as pd
+
+from .cache_utils import atomic_write_path
+from .config import get_config
+from .utils import downcast_numeric
+
+# pyarrow is optional; without it every lookup parses the full CSV
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+# Directory and file prefix of each statement under simfin_data_all
+SIMFIN_STATEMENTS = {
+    "balance_sheet": "us-balance",
+    "cash_flow": "us-cashflow",
+    "income_statements": "us-income",
+}
+
+# Rows per parquet row group; the file is sorted by ticker, so a lookup
+# only decodes the few groups whose Ticker range covers the symbol
+SIMFIN_ROW_GROUP_SIZE = 5000
+
+# Parsed full CSVs (fallback without pyarrow) and per-ticker rows kept in memory
+SIMFIN_FULL_CACHE_SIZE = 3
+SIMFIN_TICKER_CACHE_SIZE = 256
+
+_DATE_COLUMNS = ["Report Date", "Publish Date"]
+# Always loaded, since lookups filter on them
+_KEY_COLUMNS = ["Ticker", "Publish Date"]
+
+
+def _simfin_csv_path(statement: str, freq: str) -> str:
+    return os.path.join(
+        get_config()["data_dir"],
+        "fundamental_data",
+        "simfin_data_all",
+        statement,
+        "companies",
+        "us",
+        f"{SIMFIN_STATEMENTS[statement]}-{freq}.csv",
+    )
+
+
+def _read_simfin_csv(csv_path: str) -> pd.DataFrame:
+    df = pd.read_csv(csv_path, sep=";")
+
+    # Convert date strings to datetime objects and remove any time components
+    for column in _DATE_COLUMNS:
+        df[column] = pd.to_datetime(df[column], utc=True).dt.normalize()
+    # The parquet copy inherits the narrowed types
+    return downcast_numeric(df)
+
+
+@functools.lru_cache(maxsize=SIMFIN_FULL_CACHE_SIZE)
+def _load_simfin_full(csv_path: str, mtime: float) -> pd.DataFrame:
+    # mtime is part of the cache key so an updated CSV is parsed again
+    return _read_simfin_csv(csv_path)
+
+
+@functools.lru_cache(maxsize=SIMFIN_TICKER_CACHE_SIZE)
+def _load_simfin_ticker(
+    statement: str, freq: str, ticker: str, mtime: float, columns: Optional[Tuple[str, ...]]
+) -> pd.DataFrame:
+    """
+    Every statement of one ticker, ordered by Publish Date; callers must not
+    modify the result.
+    """
+    if columns is not None:
+        columns = [c for c in _KEY_COLUMNS if c not in columns] + list(columns)
+
+    parquet_path = ensure_simfin_parquet(statement, freq)
+    if parquet_path is not None:
+        # Only the requested column chunks are read from disk
+        df = pq.read_table(
+            parquet_path, columns=columns, filters=[("Ticker", "=", ticker)]
+        ).to_pandas()
+    else:
+        df = _load_simfin_full(_simfin_csv_path(statement, freq), mtime)
+        df = df[df["Ticker"] == ticker]
+        if columns is not None:
+            df = df[columns]
+
+    # Stable, so statements sharing a Publish Date keep their file order
+    return df.sort_values("Publish Date", kind="stable")
+
+
+def ensure_simfin_parquet(statement: str, freq: str) -> Optional[str]:
+    """
+    Convert a SimFin CSV to a ticker-sorted parquet file next to it.
+
+    The conversion runs once and again only when the CSV is newer than the
+    parquet copy. If the data directory cannot be written, lookups keep
+    reading the CSV.
+
+    Args:
+        statement: Key of SIMFIN_STATEMENTS
+        freq: "annual" or "quarterly"
+
+    Returns:
+        Path of the parquet file, or None if pyarrow is not installed or the
+        file could not be written
+    """
+    if pq is None:
+        return None
+
+    csv_path = _simfin_csv_path(statement, freq)
+    parquet_path = os.path.splitext(csv_path)[0] + ".parquet"
+    if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path):
+        return parquet_path
+
+    df = _read_simfin_csv(csv_path).sort_values(["Ticker", "Publish Date"], kind="stable")
+
+    # Write under a unique temporary name so a concurrent reader never sees a partial file
+    try:
+        with atomic_write_path(parquet_path) as tmp_path:
+            df.to_parquet(tmp_path, index=False, row_group_size=SIMFIN_ROW_GROUP_SIZE)
+    except OSError:
+        return None  # e.g. a read-only data directory
+    return parquet_path
+
+
+def get_latest_simfin_statement(
+    statement: str,
+    freq: str,
+    ticker: str,
+    curr_date: str,
+    columns: Optional[Sequence[str]] = None,
+) -> Optional[pd.Series]:
+    """
+    Most recent statement for a ticker published on or before curr_date.
+
+    Args:
+        statement: Key of SIMFIN_STATEMENTS
+        freq: "annual" or "quarterly"
+        ticker: Ticker symbol
+        curr_date: Trading date in yyyy-mm-dd format
+        columns: Statement fields to load; None loads every column. Ticker and
+            Publish Date are always included
+
+    Returns:
+        The statement row without SimFinId, or None if nothing was published yet
+    """
+    # Convert the current date to datetime and normalize
+    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
+
+    # Repeated lookups for a ticker (one per agent and date) hit memory
+    mtime = os.path.getmtime(_simfin_csv_path(statement, freq))
+    ticker_df = _load_simfin_ticker(
+        statement, freq, ticker, mtime, None if columns is None else tuple(columns)
+    )
+
+    # Rows are ordered by Publish Date, so binary search replaces the
+    # filter and max scan: find the latest date on or before curr_date,
+    # then the first statement published on it
+    publish_dates = ticker_df["Publish Date"]
+    end = publish_dates.searchsorted(curr_date_dt, side="right")
+    if end == 0:
+        return None
+    latest = publish_dates.searchsorted(publish_dates.iloc[end - 1], side="left")
+
+    # Drop the SimFinID column
+    return ticker_df.iloc[latest].drop("SimFinId", errors="ignore")
@@ -1,12 +1,240 @@
+import functools
 import pandas as pd
 from stockstats import wrap
-from typing import Annotated
+from typing import Annotated, Optional
 import os
+
+# pyarrow is optional; without it the offline CSVs are parsed directly
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+from .cache_utils import atomic_write_path
 from .config import get_config
+from .utils import downcast_numeric
 from .tushare_utils import get_tushare_utils
 
+# Number of price histories (symbol, source, version) kept in memory
+STOCK_STATS_CACHE_SIZE = 32
+# Number of parsed offline YFin CSVs kept in memory
+YFIN_CSV_CACHE_SIZE = 128
+
+# Descriptions of the indicators the window tools accept, shown with their values
+BEST_IND_PARAMS = {
+    # Moving Averages
+    "close_50_sma": (
+        "50 SMA: A medium-term trend indicator. "
+        "Usage: Identify trend direction and serve as dynamic support/resistance. "
+        "Tips: It lags price; combine with faster indicators for timely signals."
+    ),
+    "close_200_sma": (
+        "200 SMA: A long-term trend benchmark. "
+        "Usage: Confirm overall market trend and identify golden/death cross setups. "
+        "Tips: It reacts slowly; best for strategic trend confirmation rather than frequent trading entries."
+    ),
+    "close_10_ema": (
+        "10 EMA: A responsive short-term average. "
+        "Usage: Capture quick shifts in momentum and potential entry points. "
+        "Tips: Prone to noise in choppy markets; use alongside longer averages for filtering false signals."
+    ),
+    # MACD Related
+    "macd": (
+        "MACD: Computes momentum via differences of EMAs. "
+        "Usage: Look for crossovers and divergence as signals of trend changes. "
+        "Tips: Confirm with other indicators in low-volatility or sideways markets."
+    ),
+    "macds": (
+        "MACD Signal: An EMA smoothing of the MACD line. "
+        "Usage: Use crossovers with the MACD line to trigger trades. "
+        "Tips: Should be part of a broader strategy to avoid false positives."
+    ),
+    "macdh": (
+        "MACD Histogram: Shows the gap between the MACD line and its signal. "
+        "Usage: Visualize momentum strength and spot divergence early. "
+        "Tips: Can be volatile; complement with additional filters in fast-moving markets."
+    ),
+    # Momentum Indicators
+    "rsi": (
+        "RSI: Measures momentum to flag overbought/oversold conditions. "
+        "Usage: Apply 70/30 thresholds and watch for divergence to signal reversals. "
+        "Tips: In strong trends, RSI may remain extreme; always cross-check with trend analysis."
+    ),
+    # Volatility Indicators
+    "boll": (
+        "Bollinger Middle: A 20 SMA serving as the basis for Bollinger Bands. "
+        "Usage: Acts as a dynamic benchmark for price movement. "
+        "Tips: Combine with the upper and lower bands to effectively spot breakouts or reversals."
+    ),
+    "boll_ub": (
+        "Bollinger Upper Band: Typically 2 standard deviations above the middle line. "
+        "Usage: Signals potential overbought conditions and breakout zones. "
+        "Tips: Confirm signals with other tools; prices may ride the band in strong trends."
+    ),
+    "boll_lb": (
+        "Bollinger Lower Band: Typically 2 standard deviations below the middle line. "
+        "Usage: Indicates potential oversold conditions. "
+        "Tips: Use additional analysis to avoid false reversal signals."
+    ),
+    "atr": (
+        "ATR: Averages true range to measure volatility. "
+        "Usage: Set stop-loss levels and adjust position sizes based on current market volatility. "
+        "Tips: It's a reactive measure, so use it as part of a broader risk management strategy."
+    ),
+    # Volume-Based Indicators
+    "vwma": (
+        "VWMA: A moving average weighted by volume. "
+        "Usage: Confirm trends by integrating price action with volume data. "
+        "Tips: Watch for skewed results from volume spikes; use in combination with other volume analyses."
+    ),
+    "mfi": (
+        "MFI: The Money Flow Index is a momentum indicator that uses both price and volume to measure buying and selling pressure. "
+        "Usage: Identify overbought (>80) or oversold (<20) conditions and confirm the strength of trends or reversals. "
+        "Tips: Use alongside RSI or MACD to confirm signals; divergence between price and MFI can indicate potential reversals."
+    ),
+}
+
+
+def ensure_yfin_parquet(path: str) -> Optional[str]:
+    """
+    Convert an offline YFin CSV to a parquet file next to it.
+
+    The conversion runs once and again only when the CSV is newer than the
+    parquet copy. If the data directory cannot be written, loads keep
+    reading the CSV.
+
+    Returns:
+        Path of the parquet file, or None if pyarrow is not installed or the
+        file could not be written
+    """
+    if pq is None:
+        return None
+
+    parquet_path = os.path.splitext(path)[0] + ".parquet"
+    if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= os.path.getmtime(path):
+        return parquet_path
+
+    data = downcast_numeric(pd.read_csv(path))
+
+    # Write under a unique temporary name so a concurrent reader never sees a partial file
+    try:
+        with atomic_write_path(parquet_path) as tmp_path:
+            data.to_parquet(tmp_path, index=False)
+    except OSError:
+        return None  # e.g. a read-only data directory
+    return parquet_path
+
+
+@functools.lru_cache(maxsize=YFIN_CSV_CACHE_SIZE)
+def _read_yfin_csv(path: str, mtime: float):
+    parquet_path = ensure_yfin_parquet(path)
+    if parquet_path is not None:
+        data = pd.read_parquet(parquet_path)
+    else:
+        data = downcast_numeric(pd.read_csv(path))
+
+    # An explicit format skips per-file inference; cache parses each day once
+    days = pd.to_datetime(data["Date"].str[:10], format="%Y-%m-%d", cache=True)
+    if not days.is_monotonic_increasing:
+        order = days.argsort(kind="stable")
+        data = data.iloc[order].reset_index(drop=True)
+        days = days.iloc[order]
+    return data, days.to_numpy()
+
+
+def load_yfin_price_data(path: str):
+    """
+    Parse an offline YFin price CSV once per file version.
+
+    Shared by the raw price tools and the stockstats indicators; an edited
+    file (new mtime) is read again. With pyarrow the CSV is converted to a
+    parquet copy once and later processes load that instead.
+
+    Returns:
+        (data, days): the frame in date order, and its Date column as
+        day-level datetime64 for searchsorted range lookups; callers must
+        not modify either
+    """
+    return _read_yfin_csv(path, os.path.getmtime(path))
+
+
+def _yfin_csv_path(symbol: str, data_dir: str) -> str:
+    return os.path.join(data_dir, f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv")
+
+
+@functools.lru_cache(maxsize=STOCK_STATS_CACHE_SIZE)
+def _load_price_data(
+    symbol: str, data_dir: Optional[str], online: bool, version
+) -> pd.DataFrame:
+    """
+    Load a price history indexed by trading date.
+
+    version is part of the cache key: the day for online histories, the
+    file mtime for offline ones. The cached frame is shared; callers must
+    copy it before wrapping.
+    """
+    if not online:
+        data = load_yfin_price_data(_yfin_csv_path(symbol, data_dir))[0].copy()
+    else:
+        config = get_config()
+
+        end_date = pd.to_datetime(version)
+        start_date = end_date - pd.DateOffset(years=15)
+        start_date_str = start_date.strftime("%Y-%m-%d")
+        end_date_str = end_date.strftime("%Y-%m-%d")
+
+        # Ensure cache directory exists
+        os.makedirs(config["data_cache_dir"], exist_ok=True)
+
+        data_file = os.path.join(
+            config["data_cache_dir"],
+            f"{symbol}-data-{start_date_str}-{end_date_str}.csv",
+        )
+
+        if os.path.exists(data_file):
+            data = pd.read_csv(data_file)
+        else:
+            tushare_utils = get_tushare_utils()
+            data = tushare_utils.get_stock_data(symbol, start_date_str, end_date_str)
+            data.to_csv(data_file, index=False)
+
+    # Ensure date column is datetime and set as index for stockstats; only
+    # the day matters, so any time or UTC offset suffix is ignored
+    date_col = "Date" if "Date" in data.columns else "date"
+    data[date_col] = pd.to_datetime(data[date_col].astype(str).str[:10])
+    return data.set_index(date_col)
+
 
 class StockstatsUtils:
+    @staticmethod
+    def get_stock_stats_series(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        indicator: Annotated[
+            str, "quantitative indicators based off of the stock data for the company"
+        ],
+        data_dir: Annotated[str, "directory of the offline YFin price data"] = None,
+        online: Annotated[bool, "fetch (and cache) data online instead"] = True,
+    ) -> pd.Series:
+        """
+        Compute an indicator over the whole price history in one pass.
+
+        Returns:
+            Indicator values indexed by trading date
+        """
+        if online:
+            version = pd.Timestamp.today().strftime("%Y-%m-%d")
+        else:
+            try:
+                version = os.path.getmtime(_yfin_csv_path(symbol, data_dir))
+            except FileNotFoundError:
+                raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
+        data = _load_price_data(symbol, data_dir, online, version)
+
+        df = wrap(data.copy())
+        series = df[indicator]  # stockstats calculates the indicator for every row
+        series.index = pd.DatetimeIndex(series.index).normalize()
+        return series
+
     @staticmethod
     def get_stock_stats(
         symbol: Annotated[str, "ticker symbol for the company"],
@@ -16,49 +244,18 @@ class StockstatsUtils:
         curr_date: Annotated[
             str, "curr date for retrieving stock price data, YYYY-mm-dd"
         ],
+        data_dir: Annotated[str, "directory of the offline YFin price data"] = None,
+        online: Annotated[bool, "fetch (and cache) data online instead"] = True,
     ):
-        config = get_config()
+        series = StockstatsUtils.get_stock_stats_series(symbol, indicator, data_dir, online)
 
-        today_date = pd.Timestamp.today()
-        curr_date_dt = pd.to_datetime(curr_date)
-
-        end_date = today_date
-        start_date = today_date - pd.DateOffset(years=15)
-        start_date_str = start_date.strftime("%Y-%m-%d")
-        end_date_str = end_date.strftime("%Y-%m-%d")
-
-        # Ensure cache directory exists
-        os.makedirs(config["data_cache_dir"], exist_ok=True)
-
-            data_file = os.path.join(
-                config["data_cache_dir"],
-                f"{symbol}-data-{start_date}-{end_date}.csv",
-            )
-
-            if os.path.exists(data_file):
-                data = pd.read_csv(data_file)
-            else:
-                tushare_utils = get_tushare_utils()
-                data = tushare_utils.get_stock_data(symbol, start_date, end_date)
-                data.to_csv(data_file, index=False)
-
-            # Ensure date column is datetime and set as index for stockstats
-            if 'Date' in data.columns:
-                data['Date'] = pd.to_datetime(data['Date'])
-                data = data.set_index('Date')
-            elif 'date' in data.columns:
-                data['date'] = pd.to_datetime(data['date'])
-                data = data.set_index('date')
-
-            df = wrap(data)
-
-        df[indicator]  # trigger stockstats to calculate the indicator
-        # Compare dates properly - after setting index, access by index
-        curr_date_dt = pd.to_datetime(curr_date)
-        matching_rows = df[df.index.date == curr_date_dt.date()]
-
-        if not matching_rows.empty:
-            indicator_value = matching_rows[indicator].values[0]
-            return indicator_value
-        else:
+        # The index holds normalized trading dates; look the day up through
+        # it instead of comparing every date
+        curr_date_dt = pd.to_datetime(curr_date).normalize()
+        try:
+            value = series.loc[curr_date_dt]
+        except KeyError:
             return "N/A: Not a trading day (weekend or holiday)"
+
+        # A repeated date yields several rows; keep the first
+        return value.iloc[0] if isinstance(value, pd.Series) else value
@@ -6,6 +6,53 @@ from typing import Annotated, Optional
 from datetime import datetime, timedelta
 import traceback
 import os
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from .cache_utils import FileCache, atomic_write_path, make_cache_key
+from .config import get_config
+
+# Keep-alive connections to the Tushare API shared by the whole process
+TUSHARE_POOL_CONNECTIONS = 10
+TUSHARE_POOL_MAXSIZE = 20
+
+_tushare_session = None
+
+
+def get_tushare_session() -> requests.Session:
+    """
+    Get or create the pooled HTTP session used for Tushare API calls.
+
+    Failed connection attempts are retried with a short backoff; POST
+    requests that reached the server are not replayed.
+    """
+    global _tushare_session
+    if _tushare_session is None:
+        adapter = HTTPAdapter(
+            pool_connections=TUSHARE_POOL_CONNECTIONS,
+            pool_maxsize=TUSHARE_POOL_MAXSIZE,
+            max_retries=Retry(total=3, backoff_factor=0.3),
+        )
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _tushare_session = session
+    return _tushare_session
+
+
+def _use_tushare_session():
+    """
+    Route the Tushare client through the pooled session.
+
+    DataApi.query posts with the module-level requests.post, which opens a
+    new connection per call; the session is a drop-in replacement for it.
+    """
+    from tushare.pro import client
+
+    client.requests = get_tushare_session()
+
 
 # Initialize Tushare API with token
 def init_tushare_api(token: Optional[str] = None):
@@ -23,13 +70,89 @@ def init_tushare_api(token: Optional[str] = None):
         )
 
     ts.set_token(token)
+    _use_tushare_session()
     return ts.pro_api()
 
 
+# Number of (symbol, date range) price frames kept in memory per instance
+STOCK_DATA_CACHE_SIZE = 256
+# Number of (date, interval) news windows kept in memory per instance
+NEWS_CACHE_SIZE = 16
+# Seconds an in-memory news window that is still open (or partial) is reused
+NEWS_OPEN_WINDOW_TTL = 10 * 60
+
+
 class TushareUtils:
     def __init__(self, token: Optional[str] = None):
         """Initialize with Tushare Pro API"""
         self.pro = init_tushare_api(token)
+        self._stock_basic = None
+        # Time the listing was fetched from the API, for its TTL
+        self._stock_basic_time = 0.0
+        # (symbol, start_date, end_date) -> price DataFrame
+        self._stock_data_cache = {}
+        # (date, interval) -> (unfiltered news DataFrame, cacheable, expiry);
+        # guarded by _news_lock since tools call in from worker threads
+        self._news_cache = {}
+        self._news_lock = threading.Lock()
+        # Config TTL key -> FileCache under data_cache_dir/tushare
+        self._file_caches = {}
+
+    def _get_file_cache(self, name: str, ttl_key: str) -> Optional[FileCache]:
+        """Get or create the on-disk cache for one endpoint, or None when disabled"""
+        config = get_config()
+        ttl = config.get(ttl_key)
+        if ttl is None:
+            return None
+        if ttl_key not in self._file_caches:
+            self._file_caches[ttl_key] = FileCache(
+                os.path.join(config["data_cache_dir"], "tushare", name),
+                ttl=ttl,
+            )
+        return self._file_caches[ttl_key]
+
+    def get_stock_basic(self) -> pd.DataFrame:
+        """
+        Fetch the full listing of A-shares from stock_basic.
+
+        The listing is kept in memory and in a parquet file under
+        data_cache_dir; both copies are refreshed once the listing is older
+        than config["tushare_stock_basic_ttl"] seconds.
+
+        Returns:
+            DataFrame with one row per listed stock
+        """
+        config = get_config()
+        path = os.path.join(config["data_cache_dir"], "tushare_stock_basic.parquet")
+        ttl = config.get("tushare_stock_basic_ttl", 24 * 60 * 60)
+
+        if self._stock_basic is not None and time.time() - self._stock_basic_time < ttl:
+            return self._stock_basic
+
+        try:
+            if os.path.exists(path) and time.time() - os.path.getmtime(path) < ttl:
+                self._stock_basic = pd.read_parquet(path)
+                # The file's age carries over to the in-memory copy
+                self._stock_basic_time = os.path.getmtime(path)
+                return self._stock_basic
+        except ImportError:
+            pass  # No parquet engine installed; fall through to the API
+
+        df = self.pro.stock_basic()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # A failed write never leaves a truncated file for the next read
+            with atomic_write_path(path) as tmp_path:
+                df.to_parquet(tmp_path, compression="zstd")
+        except ImportError:
+            pass  # Keep the in-memory copy only
+        except OSError as e:
+            # e.g. a read-only or full cache dir; the fetched listing is still good
+            print(f"Could not cache stock_basic to {path}: {e}")
+
+        self._stock_basic = df
+        self._stock_basic_time = time.time()
+        return df
 
     def get_stock_data(
         self,
@@ -48,6 +171,17 @@ class TushareUtils:
         Returns:
             DataFrame with stock price data
         """
+        # Repeated requests for the same range are served from memory; hand
+        # out copies so callers can add indicator columns freely
+        key = (symbol, start_date, end_date)
+        if key not in self._stock_data_cache:
+            if len(self._stock_data_cache) >= STOCK_DATA_CACHE_SIZE:
+                # Evict the oldest entry
+                self._stock_data_cache.pop(next(iter(self._stock_data_cache)))
+            self._stock_data_cache[key] = self._fetch_stock_data(symbol, start_date, end_date)
+        return self._stock_data_cache[key].copy()
+
+    def _fetch_stock_data(self, symbol: str, start_date: str, end_date: str) -> pd.DataFrame:
         # Convert date format from YYYY-MM-DD to YYYYMMDD for Tushare
         start_date_ts = start_date.replace("-", "")
         end_date_ts = end_date.replace("-", "")
@@ -95,9 +229,14 @@ class TushareUtils:
         """
 
         # ['ts_code', 'symbol', 'name', 'area', 'industry', 'cnspell', 'market', 'list_date', 'act_name', 'act_ent_type']
-        df = self.pro.stock_basic(
-            ts_code=symbol,
-        )
+        df = self.get_stock_basic()
+        df = df[df['ts_code'] == symbol]
+
+        # Delisted or suspended codes are not in the cached listing
+        if df.empty:
+            df = self.pro.stock_basic(
+                ts_code=symbol,
+            )
 
         if df.empty:
             return {}
@@ -195,6 +334,7 @@ class TushareUtils:
     def get_news(self,
                  date: Annotated[str, "Date for news/announcements in YYYY-MM-DD format"],
                  interval: Annotated[int, "Number of days to look back"] = 30,
+                 force_refresh: bool = False,
                  ):
         """
         Get all news from multiple sources without filtering
@@ -204,6 +344,71 @@ class TushareUtils:
         2. CCTV news
         3. Announcements (anns_d)
         4. Investor relations Q&A (irm_qa_sh, irm_qa_sz)
+
+        Windows are kept in memory per instance, and non-empty results are
+        cached on disk per (date, interval) for
+        config["tushare_news_cache_ttl"] seconds; force_refresh bypasses
+        both cached copies. Windows ending today or later, and windows where
+        a source failed, are not written to disk.
+        """
+        return self._get_news_window(date, interval, force_refresh)[0].copy()
+
+    @staticmethod
+    def _window_is_open(date: str) -> bool:
+        """Whether a window ending on date can still gain news"""
+        return date >= datetime.now().strftime("%Y-%m-%d")
+
+    def _get_news_window(self, date: str, interval: int, force_refresh: bool = False):
+        """
+        The shared news frame of one window and whether it may be cached.
+
+        Returns:
+            (news_df, cacheable): callers must copy news_df before modifying
+            it; cacheable is False when the window is still open or a source
+            failed, so results derived from it must not be persisted
+        """
+        # Repeated windows (e.g. get_news followed by get_stock_info) are
+        # served from memory
+        memory_key = (date, interval)
+        if not force_refresh:
+            with self._news_lock:
+                entry = self._news_cache.get(memory_key)
+            if entry is not None and (entry[2] is None or time.time() < entry[2]):
+                return entry[0], entry[1]
+
+        news_df = None
+        cacheable = True
+        cache = self._get_file_cache("news", "tushare_news_cache_ttl")
+        key = make_cache_key("news", date, interval)
+        if cache is not None and not force_refresh:
+            records = cache.get(key)
+            if records is not None:
+                news_df = pd.DataFrame(records)
+
+        if news_df is None:
+            news_df, complete = self._fetch_news(date, interval)
+            cacheable = complete and not self._window_is_open(date)
+            if cache is not None and cacheable and not news_df.empty:
+                cache.set(key, news_df.to_dict("records"))
+
+        # Closed, complete windows live as long as their disk copy; open or
+        # partial ones are fetched again after NEWS_OPEN_WINDOW_TTL
+        ttl = get_config().get("tushare_news_cache_ttl") if cacheable else NEWS_OPEN_WINDOW_TTL
+        expiry = None if ttl is None else time.time() + ttl
+
+        with self._news_lock:
+            if memory_key not in self._news_cache and len(self._news_cache) >= NEWS_CACHE_SIZE:
+                # Evict the oldest entry
+                self._news_cache.pop(next(iter(self._news_cache)))
+            self._news_cache[memory_key] = (news_df, cacheable, expiry)
+        return news_df, cacheable
+
+    def _fetch_news(self, date: str, interval: int):
+        """
+        Query every news source for the window.
+
+        Returns:
+            (news_df, complete): complete is False if any source request failed
         """
         end_date = datetime.strptime(date, "%Y-%m-%d")
         start_date = end_date - timedelta(days=interval)
@@ -213,6 +418,7 @@ class TushareUtils:
         end_date_str = end_date.strftime("%Y-%m-%d %H:%M:%S")
 
         all_news = []
+        complete = True
 
         # 1. Get news from multiple sources
         srcs = ['sina', 'wallstreetcn', '10jqka', 'eastmoney', 'yuncaijing',
@@ -252,6 +458,7 @@ class TushareUtils:
                             # 'symbol': row.get('symbol', '')
                         })
             except Exception as e:
+                complete = False
                 print(traceback.format_exc())
                 print(e.__str__())
                 # raise e
@@ -277,6 +484,7 @@ class TushareUtils:
                             # 'symbol': ''
                         })
             except Exception as e:
+                complete = False
                 print(traceback.format_exc())
                 print(e.__str__())
 
@@ -295,6 +503,7 @@ class TushareUtils:
                             # 'symbol': row.get('symbol', '')
                         })
             except Exception as e:
+                complete = False
                 print(traceback.format_exc())
                 print(e.__str__())
 
@@ -313,6 +522,7 @@ class TushareUtils:
                             # 'symbol': row.get('symbol', '')
                         })
             except Exception as e:
+                complete = False
                 print(traceback.format_exc())
                 print(e.__str__())
 
@@ -331,14 +541,15 @@ class TushareUtils:
                             # 'symbol': row.get('symbol', '')
                         })
             except Exception as e:
+                complete = False
                 print(traceback.format_exc())
                 print(e.__str__())
 
         # Convert to DataFrame
         if all_news:
-            return pd.DataFrame(all_news)
+            return pd.DataFrame(all_news), complete
         else:
-            return pd.DataFrame(columns=['datetime', 'title', 'content', 'source', 'type', 'ts_code', 'symbol'])
+            return pd.DataFrame(columns=['datetime', 'title', 'content', 'source', 'type', 'ts_code', 'symbol']), complete
 
 
     def get_stock_info(
@@ -347,19 +558,81 @@ class TushareUtils:
         date: Annotated[str, "Date for news/announcements in YYYY-MM-DD format"],
         interval: Annotated[int, "Number of days to look back"] = 30,
         max_limit: Annotated[int, "Maximum number of items to return"] = None,
+        force_refresh: bool = False,
     ) -> list:
         """
         Fetch various types of stock information from Tushare Pro API.
 
+        Results are cached on disk for config["tushare_stock_info_cache_ttl"]
+        seconds.
+
         Args:
             symbol: Stock symbol (e.g., '000001.SZ')
             date: Date for time-sensitive queries
             interval: Number of days to look back for news
             max_limit: Maximum number of results
+            force_refresh: Ignore cached results and fetch again
 
         Returns:
             List of dictionaries containing the requested information
         """
+        return self.get_stock_info_batch(
+            [symbol], date, interval=interval, max_limit=max_limit, force_refresh=force_refresh
+        )[symbol]
+
+    def get_stock_info_batch(
+        self,
+        symbols: Annotated[list, "Stock symbols (e.g., ['000001.SZ', '600000.SH'])"],
+        date: Annotated[str, "Date for news/announcements in YYYY-MM-DD format"],
+        interval: Annotated[int, "Number of days to look back"] = 30,
+        max_limit: Annotated[int, "Maximum number of items to return per stock"] = None,
+        force_refresh: bool = False,
+    ) -> dict:
+        """
+        Fetch stock information for several stocks, reusing cached entries.
+
+        Symbols already in the on-disk cache are served from it; only the
+        missing ones are fetched, sharing one news window, and each result
+        is cached under its own key.
+
+        Args:
+            symbols: Stock symbols
+            date: Date for time-sensitive queries
+            interval: Number of days to look back for news
+            max_limit: Maximum number of results per stock
+            force_refresh: Ignore cached results and fetch again
+
+        Returns:
+            Dictionary mapping each symbol to its list of info dictionaries
+        """
+        cache = self._get_file_cache("stock_info", "tushare_stock_info_cache_ttl")
+
+        def cache_key(symbol):
+            return make_cache_key("stock_info", symbol, date, interval, max_limit)
+
+        results = {}
+        missing = []
+        for symbol in symbols:
+            cached = None
+            if cache is not None and not force_refresh:
+                cached = cache.get(cache_key(symbol))
+            if cached is not None:
+                results[symbol] = cached
+            else:
+                missing.append(symbol)
+
+        if missing:
+            news_df, cacheable = self._get_news_window(date, interval, force_refresh)
+            for symbol in missing:
+                info = self._fetch_stock_info(symbol, news_df, max_limit)
+                # Open or partial news windows would freeze incomplete results
+                if cache is not None and cacheable and info:
+                    cache.set(cache_key(symbol), info)
+                results[symbol] = info
+
+        return {symbol: results[symbol] for symbol in symbols}
+
+    def _fetch_stock_info(self, symbol: str, news_df: pd.DataFrame, max_limit: Optional[int]) -> list:
         results = []
 
         # Get company basic information
@@ -376,9 +649,6 @@ class TushareUtils:
                 'concepts': company_info.get('concepts', '')
             })
 
-            # Get all news
-            news_df = self.get_news(date=date, interval=interval)
-
             if not news_df.empty:
                 company_name = company_info.get('name', '')
                 stock_code = symbol.split('.')[0]  # Extract code without exchange suffix
@@ -1,9 +1,17 @@
 import os
 import json
+import numpy as np
 import pandas as pd
 from datetime import date, timedelta, datetime
 from typing import Annotated
 
+# orjson is optional; it parses and writes JSON (including JSONL records)
+# faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 SavePathType = Annotated[str, "File path to save data. If None, data is not saved."]
 
 def save_output(data: pd.DataFrame, tag: str, save_path: SavePathType = None) -> None:
@@ -12,6 +20,40 @@ def save_output(data: pd.DataFrame, tag: str, save_path: SavePathType = None) ->
         print(f"{tag} saved to {save_path}")
 
 
+def downcast_numeric(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Shrink numeric columns of a freshly read frame in place.
+
+    Integer columns take the smallest integer type that holds them. Float
+    columns become float32 only when that is lossless, so large statement
+    values and prices keep every digit they are rendered with.
+    """
+    for column in df.select_dtypes("integer").columns:
+        df[column] = pd.to_numeric(df[column], downcast="integer")
+    for column in df.select_dtypes("float64").columns:
+        values = df[column].to_numpy()
+        narrowed = values.astype(np.float32)
+        if np.array_equal(narrowed.astype(np.float64), values, equal_nan=True):
+            df[column] = narrowed
+    return df
+
+
+def parse_date(date_str: str) -> datetime:
+    """
+    Parse a yyyy-mm-dd date.
+
+    datetime.fromisoformat is several times faster than strptime for this
+    exact layout; anything else (e.g. unpadded months) still goes through
+    strptime, which also raises the usual ValueError for bad input.
+    """
+    if len(date_str) == 10:
+        try:
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            pass
+    return datetime.strptime(date_str, "%Y-%m-%d")
+
+
 def get_current_date():
     return date.today().strftime("%Y-%m-%d")
 
@@ -37,3 +79,29 @@ def get_next_weekday(date):
         return next_weekday
     else:
         return date
+
+
+def load_env():
+    """
+    Load .env into os.environ once per process.
+
+    Later calls are no-ops, so scripts can call this at import time whether
+    they run on their own or under pytest (where tests/conftest.py already did).
+    """
+    if not os.environ.get("_DOTENV_LOADED"):
+        from dotenv import load_dotenv
+
+        load_dotenv(override=False)
+        os.environ["_DOTENV_LOADED"] = "1"
+
+
+def loads_json(data):
+    """Parse one JSON document (str or bytes), with orjson when available"""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def dumps_json_line(obj) -> bytes:
+    """Serialize obj as one UTF-8 JSONL record, with orjson when available"""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj) + "\n").encode("utf-8")
@@ -20,6 +20,29 @@ DEFAULT_CONFIG = {
     "max_debate_rounds": 1,
     "max_risk_discuss_rounds": 1,
     "max_recur_limit": 100,
+    # Maximum number of concurrent OpenAI web-search requests per news lookup;
+    # 10 covers every news site in one wave (pacing is left to the rate limiter)
+    "news_search_concurrency": 10,
+    # Maximum number of stocks searched concurrently by aget_stock_news_openai_batch
+    "news_batch_concurrency": 8,
+    # "per_site": one request per news site; "combined": one request for all sites
+    "news_search_mode": "per_site",
+    # Seconds to reuse cached OpenAI web-search responses (None disables the cache)
+    "openai_response_cache_ttl": 24 * 60 * 60,
+    # Seconds to reuse complete news search results per stock and date (None disables)
+    "news_result_cache_ttl": 90 * 24 * 60 * 60,
+    # Client-side OpenAI rate limits (None disables request pacing)
+    "openai_max_requests_per_minute": 500,
+    "openai_max_tokens_per_minute": 200000,
+    # Seconds before a single OpenAI request times out
+    "openai_request_timeout": 120,
+    # Seconds before the cached Tushare stock_basic listing is refreshed
+    "tushare_stock_basic_ttl": 24 * 60 * 60,
+    # Seconds to reuse cached Tushare news windows and per-stock info (None disables)
+    "tushare_news_cache_ttl": 7 * 24 * 60 * 60,
+    "tushare_stock_info_cache_ttl": 7 * 24 * 60 * 60,
+    # Days of Reddit posts read concurrently by the reddit news tools
+    "reddit_fetch_workers": 16,
     # Data vendor configuration
     # Category-level configuration (default for all tools in category)
     "data_vendors": {
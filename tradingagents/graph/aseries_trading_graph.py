@@ -1,5 +1,6 @@
 # TradingAgents/graph/trading_graph.py
 
+import asyncio
 import os
 from pathlib import Path
 import json
@@ -174,22 +175,7 @@ class TradingAgentsGraph:
 
             trace = []
             for chunk in self.graph.stream(init_agent_state, **args):
-                if len(chunk["messages"]) == 0:
-                    pass
-                else:
-                    # Check if this is a tool call
-                    last_msg = chunk["messages"][-1]
-                    if hasattr(last_msg, 'tool_calls') and last_msg.tool_calls:
-                        print("\n" + "="*50)
-                        print("TOOL CALL DETECTED - Pausing for debug")
-                        print("Tool(s) being called:")
-                        for tool_call in last_msg.tool_calls:
-                            print(f"  - {tool_call['name']} with args: {tool_call['args']}")
-                        print("="*50)
-                        # pdb.set_trace()  # This will pause execution
-
-                    chunk["messages"][-1].pretty_print()
-                    trace.append(chunk)
+                self._trace_chunk(chunk, trace)
 
             final_state = trace[-1]
         else:
@@ -200,14 +186,88 @@ class TradingAgentsGraph:
         self.curr_state = final_state
 
         # Log state
-        self._log_state(trade_date, final_state)
+        self._log_state(trade_date, final_state, company_name, self.log_states_dict)
 
         # Return decision and processed signal
         return final_state, self.process_signal(final_state["final_trade_decision"])
 
-    def _log_state(self, trade_date, final_state):
-        """Log the final state to a JSON file."""
-        self.log_states_dict[str(trade_date)] = {
+    async def apropagate(self, symbol, company_name, trade_date):
+        """Async variant of propagate so several tickers can share one event loop.
+
+        LLM calls are awaited through the graph's async path, so network waits
+        of one run overlap with the others when driven by asyncio.gather.
+        Concurrent runs share this instance, so nothing per-run is stored on
+        it: the state log holds this run only, and the final state is returned
+        for reflect_and_remember(returns_losses, state).
+        """
+
+        # Initialize state
+        init_agent_state = self.propagator.create_initial_state(
+            symbol, company_name, trade_date
+        )
+        args = self.propagator.get_graph_args()
+
+        if self.debug:
+            # Debug mode with tracing
+            trace = []
+            async for chunk in self.graph.astream(init_agent_state, **args):
+                self._trace_chunk(chunk, trace)
+
+            final_state = trace[-1]
+        else:
+            # Standard mode without tracing
+            final_state = await self.graph.ainvoke(init_agent_state, **args)
+
+        # Log state
+        self._log_state(trade_date, final_state, company_name, {})
+
+        # The signal processor is a blocking LLM call, keep it off the loop
+        decision = await asyncio.to_thread(
+            self.process_signal, final_state["final_trade_decision"]
+        )
+        return final_state, decision
+
+    async def propagate_batch(self, items, max_concurrency=8):
+        """Run apropagate for many (symbol, company_name, trade_date) items.
+
+        All runs share this graph, its LLM clients and memories; at most
+        max_concurrency runs are in flight at once. Failed runs are returned
+        as their exception so one bad ticker does not cancel the rest.
+        Each result carries its own final state; pass it to
+        reflect_and_remember, which does not track batch runs itself.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_one(symbol, company_name, trade_date):
+            async with semaphore:
+                return await self.apropagate(symbol, company_name, trade_date)
+
+        return await asyncio.gather(
+            *(run_one(*item) for item in items), return_exceptions=True
+        )
+
+    def _trace_chunk(self, chunk, trace):
+        """Print a streamed chunk in debug mode and append it to the trace."""
+        if len(chunk["messages"]) == 0:
+            return
+
+        # Check if this is a tool call
+        last_msg = chunk["messages"][-1]
+        if hasattr(last_msg, 'tool_calls') and last_msg.tool_calls:
+            print("\n" + "="*50)
+            print("TOOL CALL DETECTED - Pausing for debug")
+            print("Tool(s) being called:")
+            for tool_call in last_msg.tool_calls:
+                print(f"  - {tool_call['name']} with args: {tool_call['args']}")
+            print("="*50)
+            # pdb.set_trace()  # This will pause execution
+
+        last_msg.pretty_print()
+        trace.append(chunk)
+
+    def _log_state(self, trade_date, final_state, company_name, log_states_dict):
+        """Add the final state to log_states_dict and write it to a JSON file."""
+        log_states_dict[str(trade_date)] = {
             "company_of_interest": final_state["company_of_interest"],
             "trade_date": final_state["trade_date"],
             "market_report": final_state["market_report"],
@@ -238,31 +298,37 @@ class TradingAgentsGraph:
         }
 
         # Save to file
-        directory = Path(f"eval_results/{self.ticker}/TradingAgentsStrategy_logs/")
+        directory = Path(f"eval_results/{company_name}/TradingAgentsStrategy_logs/")
         directory.mkdir(parents=True, exist_ok=True)
 
         with open(
-            f"eval_results/{self.ticker}/TradingAgentsStrategy_logs/full_states_log_{trade_date}.json",
+            f"eval_results/{company_name}/TradingAgentsStrategy_logs/full_states_log_{trade_date}.json",
             "w",
         ) as f:
-            json.dump(self.log_states_dict, f, indent=4)
+            json.dump(log_states_dict, f, indent=4)
+
+    def reflect_and_remember(self, returns_losses, state=None):
+        """Reflect on decisions and update memory based on returns.
 
-    def reflect_and_remember(self, returns_losses):
-        """Reflect on decisions and update memory based on returns."""
+        state defaults to the last propagate run; pass the state returned by
+        apropagate to reflect on an async run.
+        """
+        if state is None:
+            state = self.curr_state
         self.reflector.reflect_bull_researcher(
-            self.curr_state, returns_losses, self.bull_memory
+            state, returns_losses, self.bull_memory
         )
         self.reflector.reflect_bear_researcher(
-            self.curr_state, returns_losses, self.bear_memory
+            state, returns_losses, self.bear_memory
         )
         self.reflector.reflect_trader(
-            self.curr_state, returns_losses, self.trader_memory
+            state, returns_losses, self.trader_memory
         )
         self.reflector.reflect_invest_judge(
-            self.curr_state, returns_losses, self.invest_judge_memory
+            state, returns_losses, self.invest_judge_memory
         )
         self.reflector.reflect_risk_manager(
-            self.curr_state, returns_losses, self.risk_manager_memory
+            state, returns_losses, self.risk_manager_memory
         )
 
     def process_signal(self, full_signal):
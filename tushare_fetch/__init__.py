@@ -3,6 +3,7 @@ Tushare data fetching module for Chinese stock market data.
 """
 
 from .fetcher import TushareFetcher
+from .rate_limiter import AdaptiveRateLimiter
 
-__all__ = ['TushareFetcher']
+__all__ = ['TushareFetcher', 'AdaptiveRateLimiter']
 __version__ = '0.1.0'
@@ -4,8 +4,9 @@ Tushare data fetcher for downloading historical stock data.
 
 import os
 import sys
-import time
+import threading
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, List
@@ -14,6 +15,14 @@ import logging
 # Import tushare from installed package (avoid local folder shadowing)
 import tushare as ts
 
+from .rate_limiter import AdaptiveRateLimiter, is_rate_limit_error
+
+try:
+    import pyarrow.dataset as pa_dataset
+    import pyarrow.parquet as pq
+except ImportError:
+    pa_dataset = None
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -78,8 +87,10 @@ class TushareFetcher:
         self,
         ts_code: str,
         start_date: Optional[str] = None,
-        end_date: Optional[str] = None
-    ) -> pd.DataFrame:
+        end_date: Optional[str] = None,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+        max_retries: int = 3
+    ) -> Optional[pd.DataFrame]:
         """
         Fetch daily trading data for a single stock.
 
@@ -87,36 +98,56 @@ class TushareFetcher:
             ts_code: Stock code (e.g., '000001.SZ')
             start_date: Start date in YYYYMMDD format (default: from listing)
             end_date: End date in YYYYMMDD format (default: today)
+            rate_limiter: Paces the call and is told about rate-limit errors
+            max_retries: Retries after a rate-limit error (needs rate_limiter)
 
         Returns:
-            DataFrame with daily trading data
+            DataFrame with daily trading data (empty if the stock has none in
+            the range), or None if the request failed or stayed rate limited
         """
         if end_date is None:
             end_date = datetime.now().strftime("%Y%m%d")
 
-        try:
-            df = self.pro.daily(
-                ts_code=ts_code,
-                start_date=start_date,
-                end_date=end_date,
-                fields=[
-                    "ts_code",
-                    "trade_date",
-                    "open",
-                    "high",
-                    "low",
-                    "close",
-                    "pre_close",
-                    "change",
-                    "pct_chg",
-                    "vol",
-                    "amount"
-                ]
-            )
+        for attempt in range(max_retries + 1):
+            if rate_limiter is not None:
+                rate_limiter.wait()
+
+            try:
+                df = self._request_daily(ts_code, start_date, end_date)
+            except Exception as e:
+                if rate_limiter is not None and is_rate_limit_error(e) and attempt < max_retries:
+                    backoff = rate_limiter.on_rate_limit()
+                    logger.warning(f"Rate limited fetching {ts_code}, backing off {backoff:.0f}s")
+                    continue
+                logger.error(f"Error fetching data for {ts_code}: {e}")
+                return None
+
+            if rate_limiter is not None:
+                rate_limiter.on_success()
             return df
-        except Exception as e:
-            logger.error(f"Error fetching data for {ts_code}: {e}")
-            return pd.DataFrame()
+
+        return None
+
+    def _request_daily(self, ts_code: str, start_date: Optional[str], end_date: str) -> pd.DataFrame:
+        """Call the daily endpoint, letting API errors propagate."""
+        return self.pro.daily(
+            ts_code=ts_code,
+            start_date=start_date,
+            end_date=end_date,
+            fields=[
+                "ts_code",
+                "trade_date",
+                "open",
+                "high",
+                "low",
+                "close",
+                "pre_close",
+                "change",
+                "pct_chg",
+                "vol",
+                "amount"
+            ]
+        )
 
     def fetch_all_daily_data(
         self,
@@ -124,7 +155,10 @@ class TushareFetcher:
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
         batch_size: int = 100,
-        delay: float = 0.2
+        delay: float = 0.2,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+        workers: int = 4,
+        force_refresh: bool = False
     ):
         """
         Fetch daily data for all stocks and save to individual files.
@@ -134,76 +168,220 @@ class TushareFetcher:
             start_date: Start date in YYYYMMDD format
             end_date: End date in YYYYMMDD format
             batch_size: Number of stocks to process before checkpointing
-            delay: Delay between API calls in seconds (to avoid rate limits)
+            delay: Initial delay between API calls in seconds (to avoid rate limits)
+            rate_limiter: Adaptive pacing; defaults to one starting at delay
+            workers: Number of stocks fetched concurrently; the shared
+                rate_limiter still spaces the calls themselves
+            force_refresh: Refetch stocks already recorded in the progress file
         """
+        if rate_limiter is None:
+            rate_limiter = AdaptiveRateLimiter(initial_delay=delay)
+
         # Get stock list if not provided
         if stock_list is None:
             logger.info("Fetching stock list...")
             stock_basic_df = self.fetch_stock_basic(save=True)
             stock_list = stock_basic_df['ts_code'].tolist()
 
-        total_stocks = len(stock_list)
-        logger.info(f"Starting to fetch daily data for {total_stocks} stocks")
+        if end_date is None:
+            end_date = datetime.now().strftime("%Y%m%d")
 
-        # Create daily data directory
-        daily_dir = self.data_dir / "daily"
-        daily_dir.mkdir(exist_ok=True)
+        total_stocks = len(stock_list)
 
-        # Track progress
+        # Track progress: stocks already fetched up to end_date are skipped
         progress_file = self.data_dir / "fetch_progress.txt"
-        completed_stocks = self._load_progress(progress_file)
+        completed_stocks = {} if force_refresh else self._load_progress(progress_file)
+
+        pending = [
+            (idx, ts_code)
+            for idx, ts_code in enumerate(stock_list, 1)
+            if not self._is_up_to_date(completed_stocks.get(ts_code), end_date)
+        ]
+        logger.info(
+            f"Starting to fetch daily data for {len(pending)}/{total_stocks} stocks "
+            f"({total_stocks - len(pending)} already completed) with {workers} workers"
+        )
 
-        # Process stocks
-        for idx, ts_code in enumerate(stock_list, 1):
-            if ts_code in completed_stocks:
-                logger.info(f"[{idx}/{total_stocks}] Skipping {ts_code} (already completed)")
-                continue
+        # Guards completed_stocks, the progress file and the checkpoint counter
+        progress_lock = threading.Lock()
+        processed = 0
+
+        def fetch_one(idx: int, ts_code: str):
+            nonlocal processed
 
             logger.info(f"[{idx}/{total_stocks}] Fetching {ts_code}...")
 
-            df = self.fetch_daily_data(ts_code, start_date, end_date)
+            df = self.fetch_daily_data(ts_code, start_date, end_date, rate_limiter=rate_limiter)
+
+            # Failed fetches stay out of the progress file so a resume retries them
+            if df is None:
+                logger.warning(f"  Fetch failed for {ts_code}; it will be retried on the next run")
+                return
 
             if not df.empty:
-                # Save to CSV
-                output_file = daily_dir / f"{ts_code}.csv"
-                df.to_csv(output_file, index=False, encoding='utf-8-sig')
+                output_file = self._save_daily_data(ts_code, df)
                 logger.info(f"  Saved {len(df)} records to {output_file}")
             else:
                 logger.warning(f"  No data for {ts_code}")
 
             # Update progress
-            completed_stocks.add(ts_code)
-            self._save_progress(progress_file, completed_stocks)
+            with progress_lock:
+                completed_stocks[ts_code] = end_date
+                self._append_progress(progress_file, ts_code, end_date, len(df))
+                processed += 1
+
+                # Checkpoint every batch_size stocks
+                if processed % batch_size == 0:
+                    logger.info(f"Checkpoint: Completed {processed}/{len(pending)} pending stocks")
+                    logger.info(f"API usage: {rate_limiter.summary()}")
+
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            futures = [executor.submit(fetch_one, idx, ts_code) for idx, ts_code in pending]
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except BaseException:
+                    # A failure here (e.g. disk full) is fatal; stop the queued
+                    # stocks instead of draining them against the API first
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
 
-            # Rate limiting
-            time.sleep(delay)
+        logger.info(f"Completed fetching data for all {total_stocks} stocks")
+        logger.info(f"API usage: {rate_limiter.summary()}")
 
-            # Checkpoint every batch_size stocks
-            if idx % batch_size == 0:
-                logger.info(f"Checkpoint: Completed {idx}/{total_stocks} stocks")
+    def _load_progress(self, progress_file: Path) -> dict:
+        """
+        Load progress from file.
 
-        logger.info(f"Completed fetching data for all {total_stocks} stocks")
+        Each line is "ts_code<TAB>end_date<TAB>rows"; the last line for a stock
+        wins. Lines holding only a ts_code (older progress files) have an
+        empty end_date and count as complete.
 
-    def _load_progress(self, progress_file: Path) -> set:
-        """Load progress from file."""
+        Returns:
+            Mapping of ts_code to the end_date it was fetched up to
+        """
+        progress = {}
         if progress_file.exists():
             with open(progress_file, 'r') as f:
-                return set(line.strip() for line in f if line.strip())
-        return set()
+                for line in f:
+                    fields = line.strip().split("\t")
+                    if fields[0]:
+                        progress[fields[0]] = fields[1] if len(fields) > 1 else ""
+        return progress
+
+    @staticmethod
+    def _is_up_to_date(fetched_end_date: Optional[str], end_date: str) -> bool:
+        """Whether a stock recorded as fetched up to fetched_end_date covers end_date."""
+        if fetched_end_date is None:
+            return False
+        return fetched_end_date == "" or fetched_end_date >= end_date
+
+    def _append_progress(self, progress_file: Path, ts_code: str, end_date: str, rows: int):
+        """Append one completed stock to the progress file."""
+        with open(progress_file, 'a') as f:
+            f.write(f"{ts_code}\t{end_date}\t{rows}\n")
+
+    def _save_daily_data(self, ts_code: str, df: pd.DataFrame) -> Path:
+        """
+        Save one stock's daily data.
 
-    def _save_progress(self, progress_file: Path, completed_stocks: set):
-        """Save progress to file."""
-        with open(progress_file, 'w') as f:
-            for ts_code in sorted(completed_stocks):
-                f.write(f"{ts_code}\n")
+        With pyarrow installed this writes the hive-style partition
+        daily_parquet/ts_code=<code>/data.parquet, replacing any earlier
+        fetch; otherwise it falls back to daily/<code>.csv.
+
+        Returns:
+            Path of the written file
+        """
+        if pa_dataset is not None:
+            partition_dir = self.data_dir / "daily_parquet" / f"ts_code={ts_code}"
+            partition_dir.mkdir(parents=True, exist_ok=True)
+            output_file = partition_dir / "data.parquet"
+            # ts_code is restored from the partition directory name
+            df.drop(columns="ts_code", errors="ignore").to_parquet(output_file, index=False)
+        else:
+            daily_dir = self.data_dir / "daily"
+            daily_dir.mkdir(exist_ok=True)
+            output_file = daily_dir / f"{ts_code}.csv"
+            df.to_csv(output_file, index=False, encoding='utf-8-sig')
+        return output_file
+
+    def load_daily_dataset(self):
+        """
+        Open the partitioned daily data as a pyarrow dataset.
+
+        Nothing is read until the dataset is scanned, so callers can select
+        columns or filter (e.g. ``dataset.to_table(columns=["trade_date", "close"])``)
+        without loading every stock.
+
+        Returns:
+            pyarrow.dataset.Dataset, or None if pyarrow is missing or nothing was fetched
+        """
+        dataset_dir = self.data_dir / "daily_parquet"
+        if pa_dataset is None or not dataset_dir.exists():
+            return None
+        return pa_dataset.dataset(dataset_dir, format="parquet", partitioning="hive")
+
+    def _migrate_legacy_csv(self) -> int:
+        """
+        Copy daily/<code>.csv files from runs without pyarrow into partitions.
+
+        Stocks that already have a partition keep it, since it comes from a
+        later fetch. The CSV files are left in place.
+
+        Returns:
+            Number of stocks migrated
+        """
+        daily_dir = self.data_dir / "daily"
+        if pa_dataset is None or not daily_dir.exists():
+            return 0
+
+        migrated = 0
+        for csv_file in sorted(daily_dir.glob("*.csv")):
+            ts_code = csv_file.stem
+            if (self.data_dir / "daily_parquet" / f"ts_code={ts_code}").exists():
+                continue
+            try:
+                # Keep codes and dates as strings, matching the API frames
+                df = pd.read_csv(csv_file, dtype={"ts_code": str, "trade_date": str})
+            except Exception as e:
+                logger.error(f"Error reading {csv_file}: {e}")
+                continue
+            self._save_daily_data(ts_code, df)
+            migrated += 1
+
+        if migrated:
+            logger.info(f"Migrated {migrated} legacy CSV files into daily_parquet")
+        return migrated
 
     def merge_daily_data(self, output_file: str = "all_daily_data.parquet"):
         """
         Merge all individual daily data files into a single file.
 
+        With pyarrow, CSV files left by earlier runs are migrated into the
+        partitioned dataset first, so they are part of the merge.
+
         Args:
             output_file: Output filename (supports .csv or .parquet)
         """
+        output_path = self.data_dir / output_file
+
+        # Stocks fetched before pyarrow was installed only exist as CSV
+        self._migrate_legacy_csv()
+
+        dataset = self.load_daily_dataset()
+        if dataset is not None:
+            logger.info("Merging partitioned daily data...")
+            table = dataset.to_table()
+            logger.info(f"Merged {table.num_rows} total records")
+
+            if output_file.endswith('.parquet'):
+                pq.write_table(table, output_path)
+            else:
+                table.to_pandas().to_csv(output_path, index=False, encoding='utf-8-sig')
+
+            logger.info(f"Saved merged data to {output_path}")
+            return
+
         daily_dir = self.data_dir / "daily"
 
         if not daily_dir.exists():
@@ -227,8 +405,6 @@ class TushareFetcher:
             merged_df = pd.concat(dfs, ignore_index=True)
             logger.info(f"Merged {len(merged_df)} total records")
 
-            output_path = self.data_dir / output_file
-
             if output_file.endswith('.parquet'):
                 merged_df.to_parquet(output_path, index=False)
             else:
@@ -0,0 +1,109 @@
+"""
+Adaptive pacing for Tushare API calls.
+"""
+
+import threading
+import time
+
+
+# Substrings of the errors Tushare raises when a per-minute quota is exceeded
+RATE_LIMIT_MARKERS = ("最多访问", "频次", "429", "rate limit")
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Whether an exception from the Tushare client reports a rate limit."""
+    message = str(error).lower()
+    return any(marker in message for marker in RATE_LIMIT_MARKERS)
+
+
+class AdaptiveRateLimiter:
+    """
+    AIMD-style spacing between API calls.
+
+    Every clean call shrinks the delay by ``decrease_factor`` down to
+    ``min_delay``; every rate-limit error adds ``increase_step`` (up to
+    ``max_delay``) and holds all callers for an exponential backoff.
+    Slots are reserved under a lock, so one limiter can pace several
+    worker threads.
+    """
+
+    def __init__(
+        self,
+        initial_delay: float = 0.2,
+        min_delay: float = 0.05,
+        max_delay: float = 2.0,
+        decrease_factor: float = 0.9,
+        increase_step: float = 0.2,
+        backoff_base: float = 2.0,
+        max_backoff: float = 60.0,
+    ):
+        """
+        Args:
+            initial_delay: Starting delay between calls in seconds
+            min_delay: Lower bound for the delay
+            max_delay: Upper bound for the delay
+            decrease_factor: Multiplier applied to the delay after a success
+            increase_step: Seconds added to the delay after a rate-limit error
+            backoff_base: Base of the exponential pause after consecutive errors
+            max_backoff: Longest pause after a rate-limit error in seconds
+        """
+        self.delay = min(max(initial_delay, min_delay), max_delay)
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step
+        self.backoff_base = backoff_base
+        self.max_backoff = max_backoff
+
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+        self._consecutive_errors = 0
+
+        # Usage statistics
+        self.calls = 0
+        self.rate_limited = 0
+        self.total_wait = 0.0
+
+    def wait(self):
+        """Block until the next call slot, then reserve it."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_time)
+            self._next_time = start + self.delay
+            self.calls += 1
+            self.total_wait += start - now
+
+        if start > now:
+            time.sleep(start - now)
+
+    def on_success(self):
+        """Record a clean call and speed up."""
+        with self._lock:
+            self._consecutive_errors = 0
+            self.delay = max(self.min_delay, self.delay * self.decrease_factor)
+
+    def on_rate_limit(self) -> float:
+        """
+        Record a rate-limit error, slow down and pause every caller.
+
+        Returns:
+            Seconds all callers are held before the next call
+        """
+        with self._lock:
+            self.rate_limited += 1
+            self._consecutive_errors += 1
+            self.delay = min(self.max_delay, self.delay + self.increase_step)
+
+            backoff = min(
+                self.max_backoff,
+                self.backoff_base ** self._consecutive_errors,
+            )
+            self._next_time = max(self._next_time, time.monotonic() + backoff)
+            return backoff
+
+    def summary(self) -> str:
+        """One-line API usage report."""
+        return (
+            f"{self.calls} calls, {self.rate_limited} rate-limited, "
+            f"current delay {self.delay:.3f}s, total wait {self.total_wait:.1f}s"
+        )